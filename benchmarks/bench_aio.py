@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures event-loop latency while an asynchronous feed is converted.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_aio [--size 200000] [--interval 0.001]
+
+A ticker task sleeps `interval` seconds in a loop and records how late it
+wakes up, while a fast async source is consumed either object by object
+(``Celsius(x).to_fahrenheit()`` in the coroutine) or through
+`totemp.aio.convert`. Lag percentiles show how long the loop is held up.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from statistics import quantiles
+from time import perf_counter
+
+from totemp import Celsius, Fahrenheit, aio
+
+
+async def feed(size: int, burst: int = 256):
+    """Yields `size` readings, letting the loop run every `burst` items."""
+    for i in range(size):
+        if not i % burst:
+            await asyncio.sleep(0)
+        yield (i % 1000) / 10
+
+
+async def per_object(size: int) -> None:
+    async for value in feed(size):
+        Celsius(value).to_fahrenheit()
+
+
+async def micro_batched(size: int) -> None:
+    async for _ in aio.convert(feed(size), Celsius, Fahrenheit):
+        pass
+
+
+async def measure(consume, size: int, interval: float) -> tuple:
+    loop = asyncio.get_running_loop()
+    lags = []
+    done = False
+
+    async def ticker() -> None:
+        while not done:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            lags.append(max(loop.time() - expected, 0.0))
+
+    task = asyncio.create_task(ticker())
+    start = perf_counter()
+    await consume(size)
+    elapsed = perf_counter() - start
+    done = True
+    await task
+    return elapsed, lags
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', type=int, default=200_000)
+    parser.add_argument('--interval', type=float, default=0.001)
+    args = parser.parse_args()
+
+    print(f'{args.size:,} readings, ticker every {args.interval * 1e3} ms')
+    print(
+        f'{"consumer":<14} {"readings/s":>12} {"lag p50 ms":>11} '
+        f'{"lag p99 ms":>11} {"lag max ms":>11}'
+    )
+    for name, consume in (
+        ('per object', per_object),
+        ('aio.convert', micro_batched),
+    ):
+        elapsed, lags = asyncio.run(measure(consume, args.size, args.interval))
+        if len(lags) < 2:
+            lags = lags * 2 or [0.0, 0.0]
+        cuts = quantiles(lags, n=100, method='inclusive')
+        print(
+            f'{name:<14} {args.size / elapsed:>12,.0f} {cuts[49] * 1e3:>11.3f} '
+            f'{cuts[98] * 1e3:>11.3f} {max(lags) * 1e3:>11.3f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
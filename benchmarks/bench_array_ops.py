@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares batch operators on a `TemperatureArray` with per-object operators.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_array_ops [--count 100000] [--repeat 5]
+
+Each case adds, multiplies, subtracts or compares a Fahrenheit operand
+with readings in Celsius, either as a list of `Celsius` objects (one
+conversion of the operand per object) or as one `TemperatureArray` (one
+conversion per batch), and reports the readings processed per second.
+"""
+from __future__ import annotations
+
+import argparse
+from timeit import Timer
+
+from totemp import Celsius, Fahrenheit, TemperatureArray
+
+CASES = (
+    ('add temperature', 'a + f'),
+    ('sub batch', 'a - g'),
+    ('mul number', 'a * 2'),
+    ('rsub temperature', 'f - a'),
+    ('gt temperature', 'a > f'),
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    readings = [(i % 1000) / 10 for i in range(args.count)]
+    objects = {
+        'a': [Celsius(value) for value in readings],
+        'f': Fahrenheit(50),
+        'g': [Fahrenheit(value) for value in readings],
+    }
+    batches = {
+        'a': TemperatureArray(Celsius, readings),
+        'f': Fahrenheit(50),
+        'g': TemperatureArray(Fahrenheit, readings),
+    }
+
+    print(f'{"case":<18} {"objects/s":>14} {"batch/s":>14} {"speedup":>8}')
+    for name, stmt in CASES:
+        left, operator, right = stmt.split()
+        per_object = (
+            f'[x {operator} y for x, y in zip({left}, {right})]'
+            if 'g' in stmt
+            else f'[{stmt.replace("a", "x")} for x in a]'
+        )
+        slow = min(Timer(per_object, globals=objects).repeat(args.repeat, 1))
+        fast = min(Timer(stmt, globals=batches).repeat(args.repeat, 1))
+        print(
+            f'{name:<18} {args.count / slow:>14,.0f} '
+            f'{args.count / fast:>14,.0f} {slow / fast:>7.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Times `convert_to` for every (source, target) pair of scales.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_conversions
+
+Each cell is the best per-call time in nanoseconds, first for the
+``convert_to`` methods as they were before the conversion table (a chain of
+``if temp_cls is ...`` checks per source scale, kept below as "before"
+functions), then for the table-driven ``convert_to``, then the speedup of
+every pair. The last column is the ratio between the slowest and the
+fastest target of a row: the if-chains get slower the further the target
+is down the chain, while the table costs one lookup for every target (only
+the identity conversions, which skip the arithmetic, are cheaper). It then
+compares converting a list of floats through objects with the generated
+`converter` functions.
+"""
+from __future__ import annotations
+
+from operator import truediv
+from timeit import Timer
+from typing import Any, Callable
+
+from totemp import (
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+    converter,
+)
+
+SCALES = (
+    Celsius,
+    Fahrenheit,
+    Delisle,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+)
+
+
+def before_celsius(self: Any, temp_cls: type) -> Any:
+    """`Celsius.convert_to` as it was before."""
+    if temp_cls is Celsius:
+        return temp_cls(self._value)
+    if temp_cls is Fahrenheit:
+        return temp_cls(self._value * 9 / 5 + 32)
+    if temp_cls is Delisle:
+        return temp_cls((100 - self._value) * 3 / 2)
+    if temp_cls is Kelvin:
+        return temp_cls(self._value + 273.15)
+    if temp_cls is Newton:
+        return temp_cls(self._value * 33 / 100)
+    if temp_cls is Rankine:
+        return temp_cls((self._value + 273.15) * 9 / 5)
+    if temp_cls is Reaumur:
+        return temp_cls(self._value * 4 / 5)
+    if temp_cls is Romer:
+        return temp_cls(self._value * 21 / 40 + 7.5)
+    raise TypeError
+
+
+def before_fahrenheit(self: Any, temp_cls: type) -> Any:
+    """`Fahrenheit.convert_to` as it was before."""
+    if temp_cls is Celsius:
+        return temp_cls((self._value - 32) * 5 / 9)
+    if temp_cls is Fahrenheit:
+        return temp_cls(self._value)
+    if temp_cls is Delisle:
+        return temp_cls((212 - self._value) * 5 / 6)
+    if temp_cls is Kelvin:
+        return temp_cls((self._value + 459.67) * 5 / 9)
+    if temp_cls is Newton:
+        return temp_cls((self._value - 32) * 11 / 60)
+    if temp_cls is Rankine:
+        return temp_cls(self._value + 459.67)
+    if temp_cls is Reaumur:
+        return temp_cls((self._value - 32) * 4 / 9)
+    if temp_cls is Romer:
+        return temp_cls((self._value - 32) * (7 / 24) + 7.5)
+    raise TypeError
+
+
+def before_delisle(self: Any, temp_cls: type) -> Any:
+    """`Delisle.convert_to` as it was before."""
+    if temp_cls is Celsius:
+        return temp_cls(100 - self._value * 2 / 3)
+    if temp_cls is Fahrenheit:
+        return temp_cls(212 - self._value * 6 / 5)
+    if temp_cls is Delisle:
+        return temp_cls(self._value)
+    if temp_cls is Kelvin:
+        return temp_cls(373.15 - self._value * 2 / 3)
+    if temp_cls is Newton:
+        return temp_cls(33 - self._value * 11 / 50)
+    if temp_cls is Rankine:
+        return temp_cls(671.67 - self._value * 6 / 5)
+    if temp_cls is Reaumur:
+        return temp_cls(80 - self._value * 8 / 15)
+    if temp_cls is Romer:
+        return temp_cls(60 - self._value * 7 / 20)
+    raise TypeError
+
+
+def before_kelvin(self: Any, temp_cls: type) -> Any:
+    """`Kelvin.convert_to` as it was before."""
+    if temp_cls is Celsius:
+        return temp_cls(self._value - 273.15)
+    if temp_cls is Fahrenheit:
+        return temp_cls(self._value * 9 / 5 - 459.67)
+    if temp_cls is Delisle:
+        return temp_cls((373.15 - self._value) * 3 / 2)
+    if temp_cls is Kelvin:
+        return temp_cls(self._value)
+    if temp_cls is Newton:
+        return temp_cls((self._value - 273.15) * 33 / 100)
+    if temp_cls is Rankine:
+        return temp_cls(self._value * 1.8)
+    if temp_cls is Reaumur:
+        return temp_cls((self._value - 273.15) * 4 / 5)
+    if temp_cls is Romer:
+        return temp_cls((self._value - 273.15) * 21 / 40 + 7.5)
+    raise TypeError
+
+
+def before_newton(self: Any, temp_cls: type) -> Any:
+    """`Newton.convert_to` as it was before."""
+    if temp_cls is Celsius:
+        return temp_cls(self._value / 0.33)
+    if temp_cls is Fahrenheit:
+        return temp_cls(self._value * 60 / 11 + 32)
+    if temp_cls is Delisle:
+        return temp_cls((33 - self._value) * 50 / 11)
+    if temp_cls is Kelvin:
+        return temp_cls(self._value / 0.33000 + 273.15)
+    if temp_cls is Newton:
+        return temp_cls(self._value)
+    if temp_cls is Rankine:
+        return temp_cls(self._value * 60 / 11 + 491.67)
+    if temp_cls is Reaumur:
+        return temp_cls(self._value * 80 / 33)
+    if temp_cls is Romer:
+        return temp_cls(self._value * 35 / 22 + 7.5)
+    raise TypeError
+
+
+def before_rankine(self: Any, temp_cls: type) -> Any:
+    """`Rankine.convert_to` as it was before."""
+    if temp_cls is Celsius:
+        return temp_cls((self._value - 491.67) * 5 / 9)
+    if temp_cls is Fahrenheit:
+        return temp_cls(self._value - 459.67)
+    if temp_cls is Delisle:
+        return temp_cls((671.67 - self._value) * 5 / 6)
+    if temp_cls is Kelvin:
+        return temp_cls(self._value * 5 / 9)
+    if temp_cls is Newton:
+        return temp_cls((self._value - 491.67) * 11 / 60)
+    if temp_cls is Rankine:
+        return temp_cls(self._value)
+    if temp_cls is Reaumur:
+        return temp_cls((self._value - 491.67) * 4 / 9)
+    if temp_cls is Romer:
+        return temp_cls((self._value - 491.67) * 7 / 24 + 7.5)
+    raise TypeError
+
+
+def before_reaumur(self: Any, temp_cls: type) -> Any:
+    """`Reaumur.convert_to` as it was before."""
+    if temp_cls is Celsius:
+        return temp_cls(self._value * 5 / 4)
+    if temp_cls is Fahrenheit:
+        return temp_cls(self._value * 9 / 4 + 32)
+    if temp_cls is Delisle:
+        return temp_cls((80 - self._value) * 15 / 8)
+    if temp_cls is Kelvin:
+        return temp_cls(self._value * 5 / 4 + 273.15)
+    if temp_cls is Newton:
+        return temp_cls(self._value * 33 / 80)
+    if temp_cls is Rankine:
+        return temp_cls(self._value * 9 / 4 + 491.67)
+    if temp_cls is Reaumur:
+        return temp_cls(self._value)
+    if temp_cls is Romer:
+        return temp_cls(self._value * 21 / 32 + 7.5)
+    raise TypeError
+
+
+def before_romer(self: Any, temp_cls: type) -> Any:
+    """`Romer.convert_to` as it was before."""
+    if temp_cls is Celsius:
+        return temp_cls((self._value - 7.5) * 40 / 21)
+    if temp_cls is Fahrenheit:
+        return temp_cls((self._value - 7.5) * 24 / 7 + 32)
+    if temp_cls is Delisle:
+        return temp_cls((60 - self._value) * 20 / 7)
+    if temp_cls is Kelvin:
+        return temp_cls((self._value - 7.5) * 40 / 21 + 273.15)
+    if temp_cls is Newton:
+        return temp_cls((self._value - 7.5) * 22 / 35)
+    if temp_cls is Rankine:
+        return temp_cls((self._value - 7.5) * 24 / 7 + 491.67)
+    if temp_cls is Reaumur:
+        return temp_cls((self._value - 7.5) * 32 / 21)
+    if temp_cls is Romer:
+        return temp_cls(self._value)
+    raise TypeError
+
+
+BEFORE = {
+    Celsius: before_celsius,
+    Fahrenheit: before_fahrenheit,
+    Delisle: before_delisle,
+    Kelvin: before_kelvin,
+    Newton: before_newton,
+    Rankine: before_rankine,
+    Reaumur: before_reaumur,
+    Romer: before_romer,
+}
+
+
+def time_pair(
+    function: Callable[[Any, type], Any],
+    source: type,
+    target: type,
+    number: int = 100_000,
+) -> float:
+    """Returns the best time of one ``function(temp, target)`` call, in ns."""
+    timer = Timer(
+        'function(temp, target)',
+        globals={'function': function, 'temp': source(36.6), 'target': target},
+    )
+    return min(timer.repeat(repeat=7, number=number)) / number * 1e9
+
+
+def print_table(title: str, rows: dict[type, list[float]], spec: str) -> None:
+    """Prints one cell per pair, formatted with `spec`."""
+    width = max(len(scale.__name__) for scale in SCALES) + 7
+    print(title)
+    print(
+        'source \\ target'.ljust(width)
+        + ''.join(scale.__name__[:9].rjust(10) for scale in SCALES)
+        + 'max/min'.rjust(10)
+    )
+    for source, cells in rows.items():
+        print(
+            source.__name__.ljust(width)
+            + ''.join(f'{cell:{spec}}' for cell in cells)
+            + f'{max(cells) / min(cells):10.2f}'
+        )
+    print()
+
+
+def main() -> None:
+    before = {
+        source: [
+            time_pair(BEFORE[source], source, target) for target in SCALES
+        ]
+        for source in SCALES
+    }
+    after = {
+        source: [
+            time_pair(source.convert_to, source, target) for target in SCALES
+        ]
+        for source in SCALES
+    }
+    speedups = {
+        source: list(map(truediv, before[source], after[source]))
+        for source in SCALES
+    }
+    print_table('before: if-chains (ns/call)', before, '10.1f')
+    print_table('after: conversion table (ns/call)', after, '10.1f')
+    print_table('speedup (before / after)', speedups, '10.2f')
+    values = [float(i) for i in range(100_000)]
+    paths = {
+        'objects': lambda: [
+            temp.to_fahrenheit().value for temp in map(Celsius, values)
+        ],
+        'converter': lambda: list(map(converter(Celsius, Fahrenheit), values)),
+    }
+    for name, path in paths.items():
+        elapsed = min(Timer(path).repeat(repeat=5, number=1))
+        print(f'{name:10} {len(values) / elapsed:14,.0f} values/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares vectorized smoothing filters with per-object EMA updates.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_filters [--sensors 1,100,10000] [--ticks 50]
+
+For each number of sensors, one tick of Fahrenheit readings is smoothed
+into Celsius state:
+
+* ``objects``: a hand-written EMA around one `Celsius` object per sensor
+  (``average += alpha * (reading - average)`` with the temperature
+  operators);
+* ``ema``, ``dema`` and ``kalman``: the filters of `totemp.filters` fed a
+  `TemperatureArray` per tick.
+
+Results are reported in microseconds per tick.
+"""
+from __future__ import annotations
+
+import argparse
+from time import perf_counter
+from typing import Any, Callable
+
+from totemp import Celsius, Fahrenheit, TemperatureArray
+from totemp.filters import (
+    DoubleExponentialMovingAverage,
+    ExponentialMovingAverage,
+    KalmanFilter,
+)
+
+ALPHA = 0.2
+
+
+def objects(sensors: int) -> Callable[[TemperatureArray], Any]:
+    averages = [Celsius(20) for _ in range(sensors)]
+
+    def tick(readings: TemperatureArray) -> Any:
+        for index, reading in enumerate(readings):
+            averages[index] += ALPHA * (reading - averages[index])
+        return averages
+
+    return tick
+
+
+PATHS: dict[str, Callable[[int], Callable[[TemperatureArray], Any]]] = {
+    'objects': objects,
+    'ema': lambda sensors: ExponentialMovingAverage(
+        Celsius, ALPHA, sensors
+    ).update,
+    'dema': lambda sensors: DoubleExponentialMovingAverage(
+        Celsius, ALPHA, sensors
+    ).update,
+    'kalman': lambda sensors: KalmanFilter(
+        Celsius, 0.01, 0.25, sensors
+    ).update,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sensors', default='1,100,10000')
+    parser.add_argument('--ticks', type=int, default=50)
+    args = parser.parse_args()
+
+    print(f'{"sensors":>8} ' + ' '.join(f'{name:>10}' for name in PATHS))
+    for sensors in map(int, args.sensors.split(',')):
+        ticks = [
+            TemperatureArray(
+                Fahrenheit, [68 + (i * 7 + tick) % 5 for i in range(sensors)]
+            )
+            for tick in range(args.ticks)
+        ]
+        timings = []
+        for path in PATHS.values():
+            update = path(sensors)
+            start = perf_counter()
+            for readings in ticks:
+                update(readings)
+            timings.append((perf_counter() - start) / args.ticks * 1e6)
+        print(
+            f'{sensors:>8} '
+            + ' '.join(f'{timing:>10,.1f}' for timing in timings)
+        )
+
+
+if __name__ == '__main__':
+    main()
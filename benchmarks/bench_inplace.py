@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares ``total = total + reading`` with ``total += reading``.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_inplace [--size 1000000]
+
+Readings in Celsius and in Fahrenheit are accumulated into a Celsius total,
+once with the binary operator (one new object per step) and once with the
+in-place operator (the total is updated in place). Temperature objects
+created during each loop are counted with `totemp.instrumentation`, which
+is enabled for the counting run only, so timings are not affected.
+"""
+from __future__ import annotations
+
+import argparse
+from time import perf_counter
+
+from totemp import Celsius, Fahrenheit, instrumentation
+
+
+def binary(readings: list) -> Celsius:
+    total = Celsius(0)
+    for reading in readings:
+        total = total + reading
+    return total
+
+
+def in_place(readings: list) -> Celsius:
+    total = Celsius(0)
+    for reading in readings:
+        total += reading
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    values = [(i % 1000) / 10 for i in range(args.size)]
+    print(f'{args.size:,} readings accumulated into a Celsius total')
+    print(
+        f'{"readings":<11} {"loop":<14} {"seconds":>9} {"readings/s":>12} '
+        f'{"allocations":>12}'
+    )
+    for kind, scale in (('same scale', Celsius), ('mixed', Fahrenheit)):
+        readings = [scale(value) for value in values]
+        for name, loop in (('total + x', binary), ('total += x', in_place)):
+            start = perf_counter()
+            loop(readings)
+            elapsed = perf_counter() - start
+            with instrumentation.profile() as counts:
+                loop(readings)
+            allocations = sum(counts.allocations.values())
+            print(
+                f'{kind:<11} {name:<14} {elapsed:>9.3f} '
+                f'{args.size / elapsed:>12,.0f} {allocations:>12,}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shows that disabled instrumentation costs nothing, and what enabling costs.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_instrumentation [--filter convert_to]
+
+The scalar cases of `benchmarks.suite` are timed four times: before
+instrumentation was ever used, after an enable/disable cycle (which must
+match the first run, as the original methods are restored), with counters
+enabled and with timing histograms enabled. Ratios are relative to the
+first run. The identity of every method is also checked after the
+cycle.
+"""
+from __future__ import annotations
+
+import argparse
+
+from benchmarks.suite import run
+from totemp import FrozenTemperature, instrumentation
+from totemp.temperature_types import AbstractTemperature
+
+DEFAULT_CASES = (
+    'construct.Celsius',
+    'convert_to.Celsius.Fahrenheit',
+    'helper.to_kelvin',
+    'dunder.add.mixed',
+    'dunder.mul.number',
+    'compare.lt.mixed',
+    'compare.eq.same',
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--filter', help='time the suite cases matching it')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    def once() -> dict[str, float]:
+        if args.filter is not None:
+            return run(args.filter, args.repeat)
+        return {
+            name: timing
+            for case in DEFAULT_CASES
+            for name, timing in run(case, args.repeat).items()
+            if name == case
+        }
+
+    def timings() -> dict[str, float]:
+        """Returns the best of `--rounds` runs, to filter out noise."""
+        rounds = [once() for _ in range(args.rounds)]
+        return {name: min(r[name] for r in rounds) for name in rounds[0]}
+
+    originals = _methods()
+    pristine = timings()
+    instrumentation.enable()
+    instrumentation.disable()
+    restored = _methods() == originals
+    disabled = timings()
+    instrumentation.enable()
+    counting = timings()
+    instrumentation.enable(timing=True)
+    timed = timings()
+    instrumentation.disable()
+
+    print(f'original methods restored after disable(): {restored}')
+    width = max(map(len, pristine))
+    print(
+        f'{"case":<{width}} {"pristine ns":>12} {"disabled":>9} '
+        f'{"counting":>9} {"timing":>9}'
+    )
+    for name, base in pristine.items():
+        print(
+            f'{name:<{width}} {base:>12.1f} {disabled[name] / base:>9.2f} '
+            f'{counting[name] / base:>9.2f} {timed[name] / base:>9.2f}'
+        )
+
+
+def _methods() -> list[int]:
+    """Returns the identities of every attribute of the temperature classes."""
+    return [
+        id(attribute)
+        for owner in (AbstractTemperature, FrozenTemperature)
+        for attribute in vars(owner).values()
+    ]
+
+
+if __name__ == '__main__':
+    main()
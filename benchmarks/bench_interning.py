@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares per-reading instances with interned ones for quantized readings.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_interning [--size 1000000] [--resolution 0.1]
+
+Readings between -20 and 40 degrees, rounded to `--resolution`, are turned
+into a list of `Celsius(x)` objects and into a list of shared
+`Celsius.of(x)` instances. The time to build each list and the memory it
+holds (traced with `tracemalloc`) are printed, along with the statistics
+of the interning cache.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tracemalloc
+from time import perf_counter
+
+from totemp import Celsius, intern_cache_clear, intern_cache_info
+
+
+def build(factory, readings: list[float]) -> tuple[float, int]:
+    """Returns the seconds and traced bytes taken by a list of instances."""
+    tracemalloc.start()
+    try:
+        start = perf_counter()
+        temps = list(map(factory, readings))
+        elapsed = perf_counter() - start
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del temps
+    return elapsed, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', type=int, default=1_000_000)
+    parser.add_argument('--resolution', type=float, default=0.1)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    digits = max(0, -int(f'{args.resolution:e}'.split('e')[1]))
+    readings = [
+        round(
+            round(rng.uniform(-20, 40) / args.resolution) * args.resolution,
+            digits,
+        )
+        for _ in range(args.size)
+    ]
+
+    print(f'{args.size:,} readings at {args.resolution} degree resolution')
+    for name, factory in (
+        ('Celsius(x)', Celsius),
+        ('Celsius.of(x)', Celsius.of),
+    ):
+        intern_cache_clear()
+        elapsed, size = build(factory, readings)
+        print(
+            f'{name:<14} {elapsed:8.3f} s {size / 2**20:10.1f} MiB '
+            f'{size / args.size:8.1f} bytes/reading'
+        )
+    print(intern_cache_info())
+
+
+if __name__ == '__main__':
+    main()
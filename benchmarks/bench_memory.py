@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures the memory held by temperature instances with `tracemalloc`.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_memory
+
+The slotted `Celsius` is compared with a class that keeps `_value` in a
+per-instance `__dict__`, which is how every instance was laid out before
+the hierarchy declared `__slots__`.
+"""
+from __future__ import annotations
+
+import tracemalloc
+
+from totemp import Celsius
+
+
+class DictTemperature:
+    """Unslotted instance layout, for comparison."""
+
+    def __init__(self, value: float) -> None:
+        self._value = value
+
+
+def bytes_per_instance(cls: type, count: int = 100_000) -> float:
+    """Returns the traced bytes held per instance of `cls`."""
+    values = [float(i) for i in range(count)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [cls(value) for value in values]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del instances
+    # The list holding the instances is traced too: one pointer per item.
+    return (after - before) / count - 8
+
+
+def main() -> None:
+    before = bytes_per_instance(DictTemperature)
+    after = bytes_per_instance(Celsius)
+    print(f'with __dict__  : {before:8.1f} bytes/instance')
+    print(f'with __slots__ : {after:8.1f} bytes/instance')
+    print(f'saved          : {before - after:8.1f} bytes/instance')
+
+
+if __name__ == '__main__':
+    main()
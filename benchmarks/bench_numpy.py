@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares converting NumPy arrays with the object path.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_numpy [--max-exponent 8] [--object-limit 6]
+
+For every size from 10^6 to 10^max-exponent readings it times:
+
+- objects: ``[Celsius(v).to_fahrenheit().value for v in values]``;
+- ndarray: ``convert_values(values, Celsius, Fahrenheit)``;
+- ndarray out=: the same, writing into a preallocated buffer.
+
+The object path is skipped above 10^object-limit readings, where it needs
+several GB of memory and minutes per run.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from time import perf_counter
+from typing import Callable
+
+from totemp import Celsius, Fahrenheit, convert_values
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def best(function: Callable[[], object], repeat: int = 3) -> float:
+    """Returns the best wall time of `function`, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-exponent', type=int, default=8)
+    parser.add_argument('--object-limit', type=int, default=6)
+    args = parser.parse_args()
+    if np is None:
+        sys.exit('NumPy is not installed, nothing to compare.')
+
+    print(f'{"size":>12} {"path":<14} {"seconds":>10} {"values/s":>16}')
+    for exponent in range(6, args.max_exponent + 1):
+        size = 10**exponent
+        values = np.random.default_rng(0).uniform(-50, 50, size)
+        out = np.empty_like(values)
+        paths: dict[str, Callable[[], object]] = {
+            'ndarray': lambda: convert_values(values, Celsius, Fahrenheit),
+            'ndarray out=': lambda: convert_values(
+                values, Celsius, Fahrenheit, out=out
+            ),
+        }
+        if exponent <= args.object_limit:
+            floats = values.tolist()
+            paths['objects'] = lambda: [
+                Celsius(value).to_fahrenheit().value for value in floats
+            ]
+        for name, path in paths.items():
+            elapsed = best(path)
+            print(
+                f'{size:>12,} {name:<14} {elapsed:>10.4f} '
+                f'{size / elapsed:>16,.0f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
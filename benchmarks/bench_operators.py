@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Times the mixed-scale operators of `AbstractTemperature`.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_operators
+
+Every operator is timed with a `Celsius` left operand and a `Fahrenheit`
+right operand, so the right operand always goes through a conversion.
+Sorting a mixed-scale list exercises `__lt__` the way a thresholding or
+ordering loop does.
+
+The "before" column times the operator bodies as they were before the
+conversion fast path, which built a temporary object with
+``other.convert_to(cls).value``; the "after" column times the operators.
+"""
+from __future__ import annotations
+
+import operator as op
+import random
+from timeit import Timer
+from typing import Any, Callable
+
+from totemp import Celsius, Fahrenheit, Kelvin
+from totemp.temperature_types import AbstractTemperature
+
+
+def before_arithmetic(function: Callable[[Any, Any], Any]) -> Callable:
+    """Returns an arithmetic operator body as it was before."""
+
+    def operator(self: AbstractTemperature, other: Any) -> Any:
+        cls = self.__class__
+        try:
+            if isinstance(other, AbstractTemperature):
+                return cls(function(self._value, other.convert_to(cls).value))
+            return cls(function(self._value, other))
+        except TypeError:
+            return NotImplemented
+
+    return operator
+
+
+def before_divmod(self: AbstractTemperature, other: Any) -> Any:
+    """`__divmod__` as it was before."""
+    cls = self.__class__
+    try:
+        if isinstance(other, AbstractTemperature):
+            result = divmod(self._value, other.convert_to(cls).value)
+            return cls(result[0]), cls(result[1])
+        result = divmod(self._value, other)
+        return cls(result[0]), cls(result[1])
+    except TypeError:
+        return NotImplemented
+
+
+def before_comparison(function: Callable[[Any, Any], Any]) -> Callable:
+    """Returns a comparison operator body as it was before."""
+
+    def operator(self: AbstractTemperature, other: Any) -> Any:
+        cls = self.__class__
+        try:
+            if isinstance(other, AbstractTemperature):
+                return function(self._value, other.convert_to(cls).value)
+            return function(self._value, other)
+        except TypeError:
+            return NotImplemented
+
+    return operator
+
+
+# (name, operator, operator body before the conversion fast path)
+OPERATORS = (
+    ('add', 'a + b', before_arithmetic(op.add)),
+    ('sub', 'a - b', before_arithmetic(op.sub)),
+    ('mul', 'a * b', before_arithmetic(op.mul)),
+    ('truediv', 'a / b', before_arithmetic(op.truediv)),
+    ('floordiv', 'a // b', before_arithmetic(op.floordiv)),
+    ('mod', 'a % b', before_arithmetic(op.mod)),
+    ('divmod', 'divmod(a, b)', before_divmod),
+    ('eq', 'a == b', before_comparison(op.eq)),
+    ('ne', 'a != b', before_comparison(op.ne)),
+    ('lt', 'a < b', before_comparison(op.lt)),
+    ('le', 'a <= b', before_comparison(op.le)),
+    ('gt', 'a > b', before_comparison(op.gt)),
+    ('ge', 'a >= b', before_comparison(op.ge)),
+)
+_before_lt = before_comparison(op.lt)
+
+
+class BeforeOrder:
+    """Sort key comparing temperatures with `__lt__` as it was before."""
+
+    __slots__ = ('temp',)
+
+    def __init__(self, temp: AbstractTemperature) -> None:
+        self.temp = temp
+
+    def __lt__(self, other: BeforeOrder) -> bool:
+        return _before_lt(self.temp, other.temp)
+
+
+class AfterOrder(BeforeOrder):
+    """Sort key comparing temperatures with `__lt__`, same overhead."""
+
+    __slots__ = ()
+
+    def __lt__(self, other: BeforeOrder) -> bool:
+        return self.temp < other.temp
+
+
+def best(stmt: str, namespace: dict, number: int) -> float:
+    """Returns the best time of one execution of `stmt`, in nanoseconds."""
+    timer = Timer(stmt, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main() -> None:
+    namespace = {'a': Celsius(36.6), 'b': Fahrenheit(98.6)}
+    print(f'{"operator":10} {"before":>10} {"after":>10} {"speedup":>8}')
+    for name, stmt, body in OPERATORS:
+        before = best('body(a, b)', {**namespace, 'body': body}, 100_000)
+        after = best(stmt, namespace, 100_000)
+        print(
+            f'{name:10} {before:7.1f} ns {after:7.1f} ns '
+            f'{before / after:7.2f}x'
+        )
+
+    scales = (Celsius, Fahrenheit, Kelvin)
+    rng = random.Random(0)
+    temps = [
+        scale(rng.uniform(0, 100)) for scale in scales for _ in range(10_000)
+    ]
+    rng.shuffle(temps)
+    namespace = {
+        'temps': temps,
+        'BeforeOrder': BeforeOrder,
+        'AfterOrder': AfterOrder,
+    }
+    before = best('sorted(temps, key=BeforeOrder)', namespace, 5) / 1e6
+    after = best('sorted(temps, key=AfterOrder)', namespace, 5) / 1e6
+    print(
+        f'{"sorted":10} {before:7.1f} ms {after:7.1f} ms '
+        f'{before / after:7.2f}x  ({len(temps)} items)'
+    )
+
+
+if __name__ == '__main__':
+    main()
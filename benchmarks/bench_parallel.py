@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures how `convert_parallel` scales with the number of workers.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_parallel [--size 10000000] [--workers N]
+
+The same input is converted with 1 to N workers (N defaults to the number
+of CPUs); speedups are relative to the single-worker (serial) run.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from time import perf_counter
+
+from totemp import Celsius, Kelvin
+from totemp.batch import HAS_NUMPY
+from totemp.parallel import convert_parallel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', type=int, default=10_000_000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    if HAS_NUMPY:
+        import numpy as np
+
+        values = np.random.default_rng(0).uniform(-50, 50, args.size)
+    else:
+        values = [(i % 1000) / 10 for i in range(args.size)]
+
+    print(f'{args.size:,} values, NumPy: {HAS_NUMPY}')
+    print(f'{"workers":>8} {"seconds":>10} {"values/s":>16} {"speedup":>8}')
+    serial = None
+    for workers in range(1, args.workers + 1):
+        start = perf_counter()
+        convert_parallel(values, Celsius, Kelvin, workers=workers)
+        elapsed = perf_counter() - start
+        serial = serial or elapsed
+        print(
+            f'{workers:>8} {elapsed:>10.3f} {args.size / elapsed:>16,.0f} '
+            f'{serial / elapsed:>8.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
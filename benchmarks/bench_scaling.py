@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures end-to-end throughput and peak memory from 10^3 to 10^8 readings.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_scaling [--min-exponent 3] [--max-exponent 6]
+                                       [--paths objects,batch,stream]
+
+Every path converts the same synthetic Celsius readings to Fahrenheit:
+
+* ``objects``: a list of `Celsius` objects mapped with
+  ``Celsius.to_fahrenheit`` into a list of `Fahrenheit` objects;
+* ``batch``: a `TemperatureArray` converted with ``to_fahrenheit``;
+* ``stream``: `totemp.stream.convert_chunks` over the readings, with only
+  one chunk alive at a time.
+
+Each cell is run twice: once untraced for the throughput (readings/s),
+then under `tracemalloc` for the peak memory, reported in bytes per
+reading. The objects path needs about 150 bytes per reading, so its 10^8
+run needs some 15 GB of memory; use `--paths` to leave it out.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from collections import deque
+from time import perf_counter
+from typing import Callable, Iterator
+
+from totemp import Celsius, Fahrenheit, TemperatureArray, stream
+
+
+def readings(count: int) -> Iterator[float]:
+    """Yields `count` synthetic readings without materializing them."""
+    return ((i % 1000) / 10 for i in range(count))
+
+
+def objects(count: int) -> object:
+    temps = [Celsius(value) for value in readings(count)]
+    return list(map(Celsius.to_fahrenheit, temps))
+
+
+def batch(count: int) -> object:
+    return TemperatureArray(Celsius, readings(count)).to_fahrenheit()
+
+
+def streaming(count: int) -> object:
+    chunks = stream.convert_chunks(readings(count), Celsius, Fahrenheit)
+    return deque(chunks, maxlen=1)
+
+
+PATHS: dict[str, Callable[[int], object]] = {
+    'objects': objects,
+    'batch': batch,
+    'stream': streaming,
+}
+
+
+def throughput(path: Callable[[int], object], count: int) -> float:
+    """Returns the readings converted per second by `path`."""
+    gc.collect()
+    start = perf_counter()
+    result = path(count)
+    elapsed = perf_counter() - start
+    del result
+    return count / elapsed
+
+
+def peak_bytes(path: Callable[[int], object], count: int) -> int:
+    """Returns the peak memory traced while `path` runs and its result is
+    alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = path(count)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--min-exponent', type=int, default=3)
+    parser.add_argument('--max-exponent', type=int, default=6)
+    parser.add_argument('--paths', default=','.join(PATHS))
+    args = parser.parse_args()
+
+    names = args.paths.split(',')
+    unknown = set(names) - PATHS.keys()
+    if unknown:
+        parser.error(f'unknown paths: {", ".join(sorted(unknown))}')
+
+    print(
+        f'{"path":<8} {"readings":>12} {"readings/s":>14} '
+        f'{"peak MiB":>10} {"bytes/reading":>14}'
+    )
+    for name in names:
+        path = PATHS[name]
+        for exponent in range(args.min_exponent, args.max_exponent + 1):
+            count = 10**exponent
+            rate = throughput(path, count)
+            peak = peak_bytes(path, count)
+            print(
+                f'{name:<8} {count:>12,} {rate:>14,.0f} '
+                f'{peak / 2**20:>10,.1f} {peak / count:>14,.1f}'
+            )
+        print()
+
+
+if __name__ == '__main__':
+    main()
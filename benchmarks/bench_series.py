@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares `TemperatureSeries` with lists of `(timestamp, Celsius)` tuples.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_series [--count 1000000] [--repeat 3]
+
+Cases, each timed as the best of `--repeat` runs:
+
+* ``build``: building the storage from the readings;
+* ``slice``: selecting one minute of readings, with a scan of the tuples
+  or by bisecting the series timestamps;
+* ``rolling``: the 60 s rolling mean, recomputed per reading from a
+  deque of tuples with a plain sum or in one compensated pass with
+  ``rolling_mean``;
+* ``rolling-n``: the same with a window of the last `SIZE` readings.
+
+The memory used by each storage is reported with `tracemalloc`.
+"""
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+from collections import deque
+from timeit import Timer
+
+from totemp import Celsius, TemperatureSeries
+
+WINDOW = 60.0
+SIZE = 120
+
+
+def tuples_rolling_mean(pairs: list[tuple[float, Celsius]]) -> list[float]:
+    window: deque[tuple[float, Celsius]] = deque()
+    total = 0.0
+    means = []
+    for timestamp, temp in pairs:
+        window.append((timestamp, temp))
+        total += temp.value
+        while window[0][0] <= timestamp - WINDOW:
+            total -= window.popleft()[1].value
+        means.append(total / len(window))
+    return means
+
+
+def tuples_rolling_mean_count(
+    pairs: list[tuple[float, Celsius]]
+) -> list[float]:
+    window: deque[tuple[float, Celsius]] = deque()
+    total = 0.0
+    means = []
+    for pair in pairs:
+        window.append(pair)
+        total += pair[1].value
+        if len(window) > SIZE:
+            total -= window.popleft()[1].value
+        means.append(total / len(window))
+    return means
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    timestamps = [i * 0.5 for i in range(args.count)]
+    values = [(i % 1000) / 10 for i in range(args.count)]
+    middle = timestamps[len(timestamps) // 2]
+
+    tracemalloc.start()
+    pairs = [(t, Celsius(v)) for t, v in zip(timestamps, values)]
+    tuples_bytes = tracemalloc.get_traced_memory()[0]
+    before = tracemalloc.get_traced_memory()[0]
+    series = TemperatureSeries(Celsius, timestamps, values)
+    series_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    names = dict(globals(), **locals())
+    cases = (
+        (
+            'build',
+            '[(t, Celsius(v)) for t, v in zip(timestamps, values)]',
+            'TemperatureSeries(Celsius, timestamps, values)',
+        ),
+        (
+            'slice',
+            '[p for p in pairs if middle <= p[0] < middle + 60]',
+            'series.between(middle, middle + 60)',
+        ),
+        (
+            'rolling',
+            'tuples_rolling_mean(pairs)',
+            'series.rolling_mean(duration=WINDOW)',
+        ),
+        (
+            'rolling-n',
+            'tuples_rolling_mean_count(pairs)',
+            'series.rolling_mean(SIZE)',
+        ),
+    )
+    print(
+        f'storage: tuples {tuples_bytes / 2**20:,.1f} MiB, '
+        f'series {series_bytes / 2**20:,.1f} MiB'
+    )
+    print(f'{"case":<9} {"tuples s":>10} {"series s":>10} {"speedup":>8}')
+    for name, slow_stmt, fast_stmt in cases:
+        slow = min(Timer(slow_stmt, globals=names).repeat(args.repeat, 1))
+        fast = min(Timer(fast_stmt, globals=names).repeat(args.repeat, 1))
+        print(f'{name:<9} {slow:>10.4f} {fast:>10.6f} {slow / fast:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares `RunningStats` with converting and buffering for `statistics`.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_stats [--count 1000000] [--repeat 3]
+
+Both paths summarize the same synthetic Celsius readings in Fahrenheit:
+
+* ``buffered``: every reading is converted with ``to_fahrenheit`` and kept
+  in a list for `statistics.fmean` and `statistics.variance`;
+* ``objects``: the readings are fed to `RunningStats` as objects;
+* ``batch``: the readings are fed to `RunningStats` as a `TemperatureArray`.
+
+Each path is reported in readings per second with its peak memory.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import statistics
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable
+
+from totemp import Celsius, Fahrenheit, RunningStats, TemperatureArray
+
+
+def buffered(readings: list[Any], batch: TemperatureArray) -> object:
+    values = [reading.to_fahrenheit().value for reading in readings]
+    return statistics.fmean(values), statistics.variance(values)
+
+
+def objects(readings: list[Any], batch: TemperatureArray) -> object:
+    stats = RunningStats(Fahrenheit, readings)
+    return stats.mean, stats.variance
+
+
+def batched(readings: list[Any], batch: TemperatureArray) -> object:
+    stats = RunningStats(Fahrenheit, batch)
+    return stats.mean, stats.variance
+
+
+PATHS: dict[str, Callable[[list[Any], TemperatureArray], object]] = {
+    'buffered': buffered,
+    'objects': objects,
+    'batch': batched,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    values = [(i % 1000) / 10 for i in range(args.count)]
+    readings = [Celsius(value) for value in values]
+    batch = TemperatureArray(Celsius, values)
+
+    print(f'{"path":<10} {"readings/s":>14} {"peak MiB":>10}')
+    for name, path in PATHS.items():
+        best = float('inf')
+        for _ in range(args.repeat):
+            gc.collect()
+            start = perf_counter()
+            path(readings, batch)
+            best = min(best, perf_counter() - start)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            path(readings, batch)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        print(f'{name:<10} {args.count / best:>14,.0f} {peak / 2**20:>10,.1f}')
+
+
+if __name__ == '__main__':
+    main()
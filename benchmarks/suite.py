@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark suite for the scalar API, with JSON results and baselines.
+
+Run from the repository root with::
+
+    python -m benchmarks.suite [--output results.json]
+                               [--baseline baseline.json] [--threshold 0.1]
+                               [--filter convert_to] [--repeat 5]
+
+Times construction (and interned `of` lookups), every `convert_to` pair,
+every ``to_*`` helper, every arithmetic, reflected, in-place, unary and
+comparison dunder of `AbstractTemperature`, ``str``/``repr`` and
+`rounded`, using only `timeit`.
+Each result is the best time of one call in nanoseconds. With `--output`
+the results are saved as JSON; with `--baseline` they are compared to a
+previously saved file, and the exit status is 1 when any case is slower
+than the baseline by more than `--threshold` (a fraction, 0.1 = 10 %).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from timeit import Timer
+from typing import Any
+
+import totemp
+from totemp import (
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+)
+
+SCALES = (
+    Celsius,
+    Fahrenheit,
+    Delisle,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+)
+
+HELPERS = (
+    'to_celsius',
+    'to_fahrenheit',
+    'to_delisle',
+    'to_kelvin',
+    'to_newton',
+    'to_rankine',
+    'to_reaumur',
+    'to_romer',
+)
+
+BINARY_OPERATORS = (
+    ('add', 'a + {}'),
+    ('sub', 'a - {}'),
+    ('mul', 'a * {}'),
+    ('pow', 'a ** {}'),
+    ('truediv', 'a / {}'),
+    ('floordiv', 'a // {}'),
+    ('mod', 'a % {}'),
+    ('divmod', 'divmod(a, {})'),
+)
+
+# `timeit` runs statements inside a function, so `t` is declared global.
+IN_PLACE_OPERATORS = (
+    ('iadd', 'global t; t += {}'),
+    ('isub', 'global t; t -= {}'),
+)
+
+REFLECTED_OPERATORS = (
+    ('radd', '2 + a'),
+    ('rsub', '2 - a'),
+    ('rmul', '2 * a'),
+    ('rpow', '2 ** a'),
+    ('rtruediv', '2 / a'),
+    ('rfloordiv', '2 // a'),
+    ('rmod', '2 % a'),
+    ('rdivmod', 'divmod(2, a)'),
+)
+
+COMPARISONS = (
+    ('eq', 'a == {}'),
+    ('ne', 'a != {}'),
+    ('lt', 'a < {}'),
+    ('le', 'a <= {}'),
+    ('gt', 'a > {}'),
+    ('ge', 'a >= {}'),
+)
+
+UNARY_OPERATIONS = (
+    ('abs', 'abs(a)'),
+    ('pos', '+a'),
+    ('neg', '-a'),
+    ('invert', '~a'),
+    ('round', 'round(a, 1)'),
+    ('floor', 'math.floor(a)'),
+    ('ceil', 'math.ceil(a)'),
+    ('trunc', 'math.trunc(a)'),
+    ('float', 'float(a)'),
+    ('int', 'int(a)'),
+)
+
+TARGET_TIME = 0.02  # seconds per repetition
+
+# Right operands: same scale, another scale (converted first), plain number.
+OPERANDS = (('same', 'c'), ('mixed', 'f'), ('number', '2'))
+
+
+def cases() -> dict[str, str]:
+    """Returns the statements to time, by case name."""
+    suite = {}
+    for scale in SCALES:
+        suite[f'construct.{scale.__name__}'] = f'{scale.__name__}(36.6)'
+    suite['construct.of'] = 'Celsius.of(36.6)'
+    for source in SCALES:
+        for target in SCALES:
+            suite[
+                f'convert_to.{source.__name__}.{target.__name__}'
+            ] = f'{source.__name__.lower()}.convert_to({target.__name__})'
+    for helper in HELPERS:
+        suite[f'helper.{helper}'] = f'a.{helper}()'
+    for name, template in BINARY_OPERATORS:
+        for kind, operand in OPERANDS:
+            suite[f'dunder.{name}.{kind}'] = template.format(operand)
+    for name, template in IN_PLACE_OPERATORS:
+        for kind, operand in OPERANDS:
+            suite[f'dunder.{name}.{kind}'] = template.format(operand)
+    for name, stmt in REFLECTED_OPERATORS:
+        suite[f'dunder.{name}.number'] = stmt
+    for name, template in COMPARISONS:
+        for kind, operand in OPERANDS:
+            suite[f'compare.{name}.{kind}'] = template.format(operand)
+    for name, stmt in UNARY_OPERATIONS:
+        suite[f'dunder.{name}'] = stmt
+    suite['format.str'] = 'str(a)'
+    suite['format.repr'] = 'repr(a)'
+    suite['rounded'] = 'a.rounded()'
+    return suite
+
+
+def namespace() -> dict[str, Any]:
+    """Returns the globals the statements of `cases` run with."""
+    import math
+
+    names: dict[str, Any] = {scale.__name__: scale for scale in SCALES}
+    names.update(
+        {scale.__name__.lower(): scale(36.6) for scale in SCALES},
+        math=math,
+        a=Celsius(36.6),
+        t=Celsius(36.6),
+        c=Celsius(12.5),
+        f=Fahrenheit(54.5),
+    )
+    return names
+
+
+def best_time(stmt: str, names: dict[str, Any], repeat: int) -> float:
+    """Returns the best time of one execution of `stmt`, in nanoseconds."""
+    timer = Timer(stmt, globals=names)
+    number = 1
+    while timer.timeit(number) < TARGET_TIME:
+        number *= 4
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run(pattern: str = '', repeat: int = 5) -> dict[str, float]:
+    """Times every case whose name contains `pattern`."""
+    names = namespace()
+    return {
+        name: best_time(stmt, names, repeat)
+        for name, stmt in cases().items()
+        if pattern in name
+    }
+
+
+def compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+) -> list[str]:
+    """Prints `results` next to `baseline`; returns the regressed cases."""
+    regressions = []
+    width = max(map(len, results), default=0)
+    print(f'{"case":<{width}} {"ns":>10} {"baseline":>10} {"ratio":>7}')
+    for name, timing in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f'{name:<{width}} {timing:>10.1f} {"-":>10} {"-":>7}')
+            continue
+        ratio = timing / reference
+        flag = ''
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(
+            f'{name:<{width}} {timing:>10.1f} {reference:>10.1f} '
+            f'{ratio:>7.2f}{flag}'
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--output', help='write the results to this JSON')
+    parser.add_argument('--baseline', help='JSON results to compare with')
+    parser.add_argument('--threshold', type=float, default=0.1)
+    parser.add_argument('--filter', default='', help='only run these cases')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, args.repeat)
+    if args.output:
+        document = {
+            'meta': {
+                'totemp': totemp.__version__,
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'machine': platform.machine(),
+                'date': datetime.now(timezone.utc).isoformat(),
+            },
+            'unit': 'ns',
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(document, file, indent=2)
+            file.write('\n')
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(
+            f'\n{len(regressions)} case(s) slower than the baseline by more '
+            f'than {args.threshold:.0%}',
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+
+from totemp import filters, stats
+
+
+@pytest.fixture(params=(True, False), ids=('numpy', 'python'))
+def numpy_path(request, monkeypatch):
+    """Runs a test on the NumPy path (if installed) and the pure-Python one."""
+    if request.param:
+        pytest.importorskip('numpy')
+    monkeypatch.setattr(stats, 'HAS_NUMPY', request.param)
+    monkeypatch.setattr(filters, 'HAS_NUMPY', request.param)
+    # Vectorize the filters of any size, so small tests cover both paths.
+    monkeypatch.setattr(filters, 'MIN_VECTORIZED_SENSORS', 1)
+    return request.param
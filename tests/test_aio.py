@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import asyncio
+from array import array
+
+import pytest
+
+from totemp import Celsius, Fahrenheit, Kelvin, aio
+
+
+async def feed(values, delay=0.0):
+    for value in values:
+        if delay:
+            await asyncio.sleep(delay)
+        yield value
+
+
+async def collect(async_iterable) -> list:
+    return [item async for item in async_iterable]
+
+
+class TestAio:
+    """Tests the asyncio adapter"""
+
+    def test_convert_matches_scalar_path(self) -> None:
+        """Tests that every reading is converted with the scalar formulas"""
+        values = [x / 3 for x in range(500)]
+        converted = asyncio.run(
+            collect(
+                aio.convert(feed(values), Celsius, Fahrenheit, max_batch=64)
+            )
+        )
+
+        assert converted == [Celsius(x).to_fahrenheit().value for x in values]
+
+    def test_batches_close_on_count(self) -> None:
+        """Tests that a batch holds at most `max_batch` readings"""
+        batches = asyncio.run(
+            collect(
+                aio.convert_batches(
+                    feed(range(10)), Celsius, Kelvin, max_batch=4
+                )
+            )
+        )
+
+        assert all(isinstance(batch, array) for batch in batches)
+        assert sum(map(len, batches)) == 10
+        assert max(map(len, batches)) <= 4
+
+    def test_batches_close_on_time_window(self) -> None:
+        """Tests that slow feeds are flushed after `max_delay` seconds"""
+
+        async def main():
+            # The next reading only arrives once the previous batch was
+            # yielded, so only the time window can close each batch.
+            received = asyncio.Event()
+
+            async def source():
+                for value in range(3):
+                    yield value
+                    await received.wait()
+                    received.clear()
+
+            sizes = []
+            async for batch in aio.convert_batches(
+                source(), Celsius, Kelvin, max_batch=100, max_delay=0.001
+            ):
+                sizes.append(len(batch))
+                received.set()
+            return sizes
+
+        assert asyncio.run(main()) == [1, 1, 1]
+
+    def test_backpressure_bounds_reads_ahead(self) -> None:
+        """Tests that a stalled consumer stops the source from being read"""
+        pulled = []
+
+        async def source():
+            for value in range(1_000):
+                pulled.append(value)
+                yield value
+
+        async def main():
+            batches = aio.convert_batches(
+                source(), Celsius, Kelvin, max_batch=2, max_pending=5
+            )
+            await batches.__anext__()
+            await asyncio.sleep(0.01)
+            read_ahead = len(pulled)
+            await batches.aclose()
+            return read_ahead
+
+        assert asyncio.run(main()) < 10
+
+    def test_source_errors_are_propagated(self) -> None:
+        """Tests that errors from the source reach the consumer"""
+
+        async def broken():
+            yield Celsius(0)
+            raise RuntimeError('sensor offline')
+
+        async def main():
+            values = []
+            with pytest.raises(RuntimeError):
+                async for value in aio.convert(broken(), Celsius, Kelvin):
+                    values.append(value)
+            return values
+
+        assert asyncio.run(main()) == [273.15]
+
+    def test_invalid_arguments(self) -> None:
+        """Tests that invalid sizes and scales are rejected up front"""
+
+        async def first(**kwargs):
+            return await aio.convert_batches(
+                feed([1]), Celsius, **kwargs
+            ).__anext__()
+
+        with pytest.raises(ValueError):
+            asyncio.run(first(to_scale=Kelvin, max_batch=0))
+        with pytest.raises(ValueError):
+            asyncio.run(first(to_scale=Kelvin, max_delay=-1))
+        with pytest.raises(ValueError):
+            asyncio.run(first(to_scale=Kelvin, max_pending=0))
+        with pytest.raises(ValueError):
+            asyncio.run(first(to_scale=Kelvin, max_batch=8, max_pending=4))
+        with pytest.raises(TypeError):
+            asyncio.run(first(to_scale=int))
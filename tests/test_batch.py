@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from array import array
+
+import pytest
+
+from totemp import (
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+    TemperatureArray,
+    convert_values,
+    converter,
+)
+
+SCALES = (
+    Celsius,
+    Fahrenheit,
+    Delisle,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+)
+VALUES = (-273.15, -40, -0.0, 0, 12, 25, 36.6, 100, 451.25)
+
+
+class TestConvertValues:
+    """Tests the batch conversion of raw values"""
+
+    @pytest.mark.parametrize('source', SCALES)
+    @pytest.mark.parametrize('target', SCALES)
+    def test_array_path_matches_scalar_path(self, source, target) -> None:
+        """Tests that iterables are converted into identical array('d')"""
+        converted = convert_values(VALUES, source, target)
+        expected = [source(value).convert_to(target).value for value in VALUES]
+
+        assert isinstance(converted, array)
+        assert [repr(value) for value in converted] == [
+            repr(float(value)) for value in expected
+        ]
+
+    def test_out_buffer_is_filled_in_place(self) -> None:
+        """Tests that `out` receives the results and is returned"""
+        values = array('d', [0, 100])
+        returned = convert_values(values, Celsius, Kelvin, out=values)
+
+        assert returned is values
+        assert values.tolist() == [273.15, 373.15]
+        with pytest.raises(ValueError):
+            convert_values([1.0], Celsius, Kelvin, out=array('d', [0, 0]))
+
+    def test_invalid_scales_raise_type_error(self) -> None:
+        """Tests that unknown scales are rejected"""
+        with pytest.raises(TypeError):
+            convert_values([1.0], Celsius, float)
+
+
+class TestNumpyBackend:
+    """Tests the NumPy path of batch conversions (skipped without NumPy)"""
+
+    @pytest.mark.parametrize('source', SCALES)
+    @pytest.mark.parametrize('target', SCALES)
+    def test_ndarray_path_matches_scalar_path(self, source, target) -> None:
+        """Tests that ndarrays are converted with the scalar results"""
+        np = pytest.importorskip('numpy')
+        converted = convert_values(np.array(VALUES), source, target)
+        expected = [
+            float(source(value).convert_to(target).value) for value in VALUES
+        ]
+
+        assert isinstance(converted, np.ndarray)
+        assert converted.dtype == np.float64
+        assert converted.tolist() == expected
+
+    def test_ndarray_out_buffer(self) -> None:
+        """Tests in-place conversion into a preallocated ndarray"""
+        np = pytest.importorskip('numpy')
+        values = np.array([0.0, 100.0])
+        out = np.empty_like(values)
+
+        assert convert_values(values, Celsius, Fahrenheit, out=out) is out
+        assert out.tolist() == [32.0, 212.0]
+        convert_values(values, Celsius, Kelvin, out=values)
+        assert values.tolist() == [273.15, 373.15]
+
+    def test_temperature_array_keeps_ndarray_storage(self) -> None:
+        """Tests that TemperatureArray stores and returns ndarrays"""
+        np = pytest.importorskip('numpy')
+        batch = TemperatureArray(Celsius, np.arange(3, dtype=np.float64))
+        converted = batch.to_fahrenheit()
+
+        assert isinstance(converted.values, np.ndarray)
+        assert converted.values.tolist() == [32.0, 33.8, 35.6]
+        assert converted[1] == Fahrenheit(33.8)
+
+    def test_converter_functions_accept_ndarrays(self) -> None:
+        """Tests that generated converters broadcast over ndarrays"""
+        np = pytest.importorskip('numpy')
+        values = np.array([0.0, 100.0])
+
+        assert converter(Celsius, Kelvin)(values).tolist() == [273.15, 373.15]
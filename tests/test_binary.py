@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from array import array
+
+import pytest
+
+from totemp import Celsius, Fahrenheit, Kelvin
+from totemp.binary import convert_file
+from totemp.cli import main
+
+VALUES = [-273.15, -40.0, 0.0, 21.5, 36.6, 100.0, 451.0]
+
+
+def write_values(path, values) -> None:
+    data = array('d', values)
+    if data.itemsize != 8:  # pragma: no cover
+        pytest.skip('array("d") is not float64 on this platform')
+    path.write_bytes(data.tobytes())
+
+
+def read_values(path) -> list:
+    return array('d', path.read_bytes()).tolist()
+
+
+class TestBinary:
+    """Tests memory-mapped conversion of float64 files"""
+
+    def test_convert_file_in_place(self, tmp_path) -> None:
+        """Tests rewriting a file in place, page by page"""
+        path = tmp_path / 'readings.f64'
+        write_values(path, VALUES)
+
+        assert convert_file(path, Celsius, Kelvin, page_size=3) == len(VALUES)
+        assert read_values(path) == [
+            Celsius(v).to_kelvin().value for v in VALUES
+        ]
+
+    def test_convert_file_into_new_file(self, tmp_path) -> None:
+        """Tests writing the results to a separate output file"""
+        source, target = tmp_path / 'in.f64', tmp_path / 'out.f64'
+        write_values(source, VALUES)
+
+        convert_file(source, Celsius, Fahrenheit, target)
+
+        assert read_values(source) == VALUES
+        assert read_values(target) == [
+            Celsius(v).to_fahrenheit().value for v in VALUES
+        ]
+
+    def test_empty_and_truncated_files(self, tmp_path) -> None:
+        """Tests empty files and sizes that are not a multiple of 8"""
+        empty = tmp_path / 'empty.f64'
+        empty.write_bytes(b'')
+        assert convert_file(empty, Celsius, Kelvin) == 0
+
+        truncated = tmp_path / 'truncated.f64'
+        truncated.write_bytes(b'\x00' * 12)
+        with pytest.raises(ValueError):
+            convert_file(truncated, Celsius, Kelvin)
+
+    def test_cli_binary_mode_in_place(self, tmp_path, capsys) -> None:
+        """Tests `python -m totemp convert` on a binary file in place"""
+        path = tmp_path / 'readings.f64'
+        write_values(path, [0.0, 100.0])
+
+        assert (
+            main(['convert', '--from', 'C', '--to', 'K', str(path), str(path)])
+            == 0
+        )
+        assert read_values(path) == [273.15, 373.15]
+        assert 'values/s' in capsys.readouterr().err
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+
+from totemp import Celsius, Fahrenheit, Kelvin, Reaumur, Romer
+from totemp.cli import convert_csv, convert_text, main, scale_from_name
+
+
+class TestCli:
+    """Tests the bulk command-line converter"""
+
+    def test_scale_from_name_accepts_names_and_symbols(self) -> None:
+        """Tests the aliases accepted for --from/--to"""
+        assert scale_from_name('C') is Celsius
+        assert scale_from_name('ºF') is Fahrenheit
+        assert scale_from_name('kelvin') is Kelvin
+        assert scale_from_name('Ré') is Reaumur
+        assert scale_from_name('re') is Reaumur
+        assert scale_from_name('Ro') is Romer
+        with pytest.raises(ValueError):
+            scale_from_name('X')
+
+    def test_convert_csv_converts_only_the_column(self) -> None:
+        """Tests that one column is converted and the rest is copied"""
+        source = io.StringIO('id,temp,note\n1,25,a\n2,,b\n3,-40,c\n')
+        target = io.StringIO()
+        rows = convert_csv(
+            source, target, Celsius, Fahrenheit, column='temp', chunk_size=2
+        )
+
+        assert rows == 3
+        assert target.getvalue() == (
+            'id,temp,note\n1,77.0,a\n2,,b\n3,-40.0,c\n'
+        )
+
+    def test_convert_text_keeps_blank_lines(self) -> None:
+        """Tests the one-value-per-line format"""
+        target = io.StringIO()
+        rows = convert_text(io.StringIO('0\n\n100\n'), target, Celsius, Kelvin)
+
+        assert rows == 3
+        assert target.getvalue() == '273.15\n\n373.15\n'
+
+    def test_invalid_values_report_their_line(self) -> None:
+        """Tests that parse errors name the input line of the bad value"""
+        with pytest.raises(ValueError, match='line 4: .*hot'):
+            convert_text(
+                io.StringIO('0\n\n100\nhot\n'),
+                io.StringIO(),
+                Celsius,
+                Kelvin,
+                chunk_size=2,
+            )
+        with pytest.raises(ValueError, match='line 4: .*hot'):
+            convert_csv(
+                io.StringIO('temp\n0\n1\nhot\n'),
+                io.StringIO(),
+                Celsius,
+                Kelvin,
+                column='temp',
+                chunk_size=2,
+            )
+
+    def test_main_converts_files_and_reports(self, tmp_path, capsys) -> None:
+        """Tests `python -m totemp convert` end to end"""
+        source = tmp_path / 'in.csv'
+        target = tmp_path / 'out.csv'
+        source.write_text('temp\n0\n100\n', encoding='utf-8')
+
+        status = main(
+            [
+                'convert',
+                '--from',
+                'C',
+                '--to',
+                'F',
+                '--column',
+                'temp',
+                str(source),
+                str(target),
+            ]
+        )
+
+        assert status == 0
+        assert target.read_text(encoding='utf-8') == 'temp\n32.0\n212.0\n'
+        assert 'rows/s' in capsys.readouterr().err
+
+    def test_main_reports_invalid_values(self, tmp_path, capsys) -> None:
+        """Tests that invalid cells stop the conversion with an error"""
+        source = tmp_path / 'in.txt'
+        source.write_text('12\nhot\n', encoding='utf-8')
+
+        with pytest.raises(SystemExit) as error:
+            main(
+                [
+                    'convert',
+                    '--from',
+                    'C',
+                    '--to',
+                    'K',
+                    str(source),
+                    str(tmp_path / 'out.txt'),
+                ]
+            )
+        assert error.value.code == 1
+        assert "line 2: invalid temperature value 'hot'" in (
+            capsys.readouterr().err
+        )
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from array import array
+
+import pytest
+
+from totemp import Celsius, Fahrenheit, Kelvin, TemperatureArray
+from totemp.filters import (
+    DoubleExponentialMovingAverage,
+    ExponentialMovingAverage,
+    KalmanFilter,
+    _SmoothingFilter,
+)
+
+TICKS = [
+    [20.0, -5.0, 36.6],
+    [21.0, -4.5, 37.0],
+    [23.5, -6.0, 36.9],
+    [22.0, -5.5, 38.2],
+    [24.0, -4.0, 37.5],
+]
+
+
+def ema(readings, alpha):
+    """Returns the hand-written EMA of one sensor."""
+    average = readings[0]
+    averages = [average]
+    for reading in readings[1:]:
+        average += alpha * (reading - average)
+        averages.append(average)
+    return averages
+
+
+class TestFilters:
+    """Tests the vectorized streaming filters"""
+
+    def test_ema_matches_per_sensor_loop(self, numpy_path) -> None:
+        """Tests the EMA of every sensor against a scalar loop"""
+        smoother = ExponentialMovingAverage(Celsius, 0.3, sensors=3)
+        outputs = [smoother.update(tick).values.tolist() for tick in TICKS]
+
+        for sensor in range(3):
+            expected = ema([tick[sensor] for tick in TICKS], 0.3)
+            assert [output[sensor] for output in outputs] == expected
+        assert smoother.output.scale is Celsius
+        assert isinstance(smoother.output.values, array) != numpy_path
+
+    def test_dema_removes_trend_lag(self, numpy_path) -> None:
+        """Tests the double EMA against its definition"""
+        smoother = DoubleExponentialMovingAverage(Celsius, 0.5, sensors=3)
+        for tick in TICKS:
+            output = smoother.update(tick)
+
+        for sensor in range(3):
+            first = ema([tick[sensor] for tick in TICKS], 0.5)
+            second = ema(first, 0.5)
+            assert output.values[sensor] == pytest.approx(
+                2 * first[-1] - second[-1]
+            )
+        ramp = DoubleExponentialMovingAverage(Celsius, 0.5)
+        single = ExponentialMovingAverage(Celsius, 0.5)
+        for value in range(20):
+            lagged, followed = single.update(value), ramp.update(value)
+        assert abs(followed.value - 19) < abs(lagged.value - 19)
+
+    def test_kalman_matches_scalar_equations(self, numpy_path) -> None:
+        """Tests the Kalman estimates and variance"""
+        kalman = KalmanFilter(Celsius, 0.01, 0.25, sensors=3)
+        outputs = [kalman.update(tick) for tick in TICKS]
+
+        estimate, variance = TICKS[0][1], 0.25
+        for tick, output in zip(TICKS[1:], outputs[1:]):
+            predicted = variance + 0.01
+            gain = predicted / (predicted + 0.25)
+            estimate += gain * (tick[1] - estimate)
+            variance = (1 - gain) * predicted
+            assert output.values[1] == pytest.approx(estimate)
+        assert kalman.variance == pytest.approx(variance)
+        kalman.reset()
+        assert kalman.update([1, 2, 3]).values.tolist() == [1, 2, 3]
+        assert kalman.variance == 0.25
+
+    def test_readings_in_any_scale(self, numpy_path) -> None:
+        """Tests that readings are converted to the state scale"""
+        smoother = ExponentialMovingAverage(Fahrenheit, 0.5, sensors=2)
+        smoother.update(TemperatureArray(Celsius, [0, 100]))
+        output = smoother.update([Kelvin(373.15), 212])
+
+        assert output.scale is Fahrenheit
+        assert output.values.tolist() == pytest.approx([122.0, 212.0])
+        single = ExponentialMovingAverage(Fahrenheit, 0.5)
+        single.update(Celsius(0))
+        assert single.update(Celsius(100)) == Fahrenheit(122)
+
+    def test_base_filter_is_abstract(self) -> None:
+        """Tests that filters must implement the state hooks"""
+        with pytest.raises(TypeError):
+            _SmoothingFilter(Celsius, 1)
+
+        class Incomplete(_SmoothingFilter):
+            def _start(self, values):
+                pass
+
+        with pytest.raises(TypeError):
+            Incomplete(Celsius, 1)
+
+    def test_invalid_arguments(self) -> None:
+        """Tests the validation of parameters and readings"""
+        with pytest.raises(ValueError):
+            ExponentialMovingAverage(Celsius, 0)
+        with pytest.raises(ValueError):
+            DoubleExponentialMovingAverage(Celsius, 1.5)
+        with pytest.raises(ValueError):
+            KalmanFilter(Celsius, 0.1, 0)
+        with pytest.raises(ValueError):
+            KalmanFilter(Celsius, 0.1, 1, sensors=0)
+        with pytest.raises(TypeError):
+            KalmanFilter(float, 0.1, 1)
+        smoother = ExponentialMovingAverage(Celsius, 0.5, sensors=2)
+        with pytest.raises(ValueError):
+            smoother.output
+        with pytest.raises(ValueError):
+            smoother.update(Celsius(1))
+        with pytest.raises(TypeError):
+            smoother.update('20 ºC')
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+
+from totemp import (
+    Celsius,
+    Fahrenheit,
+    FrozenTemperature,
+    Kelvin,
+    instrumentation,
+)
+from totemp.temperature_types import AbstractTemperature
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    """Tests the opt-in instrumentation counters"""
+
+    def test_disabled_by_default_and_restores_methods(self) -> None:
+        """Tests that disabling puts back the original methods"""
+        originals = {
+            owner: dict(vars(owner))
+            for owner in (AbstractTemperature, FrozenTemperature)
+        }
+
+        assert not instrumentation.is_enabled()
+        instrumentation.enable(timing=True)
+        assert instrumentation.is_enabled()
+        assert (
+            AbstractTemperature.__add__
+            is not originals[AbstractTemperature]['__add__']
+        )
+        instrumentation.disable()
+
+        for owner, attributes in originals.items():
+            assert dict(vars(owner)) == attributes
+
+    def test_counts_conversions_operators_and_allocations(self) -> None:
+        """Tests the counters recorded while enabled"""
+        instrumentation.enable()
+        temp = Celsius(10) + Fahrenheit(50)
+        temp.to_kelvin()
+        temp.convert_to(Kelvin)
+        temp < Kelvin(300)
+        instrumentation.disable()
+        Celsius(1).to_kelvin()  # not counted
+
+        counts = instrumentation.snapshot()
+        assert counts.conversions == {(Celsius, Kelvin): 2}
+        assert counts.operators == {'__add__': 1, '__lt__': 1}
+        assert counts.allocations == {
+            Celsius: 2,
+            Fahrenheit: 1,
+            Kelvin: 3,
+        }
+        assert counts.timings == {}
+
+    def test_timing_histograms(self) -> None:
+        """Tests that timing records one duration per call"""
+        instrumentation.enable(timing=True)
+        for value in range(5):
+            Celsius(value).to_fahrenheit()
+        instrumentation.disable()
+
+        histogram = instrumentation.snapshot().timings['convert_to']
+        assert sum(histogram.values()) == 5
+        assert all(bucket & (bucket - 1) == 0 for bucket in histogram)
+
+    def test_profile_scopes_counts_and_restores_state(self) -> None:
+        """Tests that profile blocks only report their own counts"""
+        instrumentation.enable()
+        Celsius(1).to_kelvin()
+        with instrumentation.profile() as outer:
+            Celsius(2).to_kelvin()
+            with instrumentation.profile(timing=True) as inner:
+                Celsius(3) == Celsius(3).frozen()
+        assert instrumentation.is_enabled()
+
+        assert outer.conversions == {(Celsius, Kelvin): 1}
+        assert outer.operators == {'__eq__': 1}
+        assert inner.conversions == {}
+        assert inner.operators == {'__eq__': 1}
+        assert '__eq__' in inner.timings
+        assert sum(instrumentation.snapshot().conversions.values()) == 2
+
+    def test_profile_disables_when_done(self) -> None:
+        """Tests that profile leaves instrumentation disabled afterwards"""
+        with instrumentation.profile() as counts:
+            -Celsius(1)
+
+        assert not instrumentation.is_enabled()
+        assert counts.operators == {'__neg__': 1}
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pytest
+
+from totemp import BooleanMask
+
+
+class TestBooleanMask:
+    """Tests the BooleanMask returned by batch comparisons"""
+
+    def test_count_any_all(self) -> None:
+        """Tests counting the selected values"""
+        mask = BooleanMask([0, 1, 1, 0])
+
+        assert mask.count() == 2
+        assert mask.count(0) == 2
+        assert mask.any() and not mask.all()
+        assert BooleanMask([1, 1]).all()
+        assert not BooleanMask([0, 0]).any()
+        assert BooleanMask().all() and not BooleanMask().any()
+        assert repr(mask) == 'BooleanMask([False, True, True, False])'
+
+    @pytest.mark.parametrize('values', [[], [0, 1], [1, 1, 1]])
+    def test_truth_value_is_ambiguous(self, values) -> None:
+        """Tests that only single-value masks can be used as booleans"""
+        with pytest.raises(ValueError, match=r'any\(\) or mask\.all\(\)'):
+            bool(BooleanMask(values))
+
+    def test_truth_value_of_single_value(self) -> None:
+        """Tests the truth value of a mask with one value"""
+        assert BooleanMask([1])
+        assert not BooleanMask([0])
+
+    def test_combinations(self) -> None:
+        """Tests the element-wise logical operators"""
+        left = BooleanMask([0, 1, 1, 0])
+        right = BooleanMask([0, 0, 1, 1])
+
+        assert left & right == BooleanMask([0, 0, 1, 0])
+        assert left | right == BooleanMask([0, 1, 1, 1])
+        assert left ^ right == BooleanMask([0, 1, 0, 1])
+        assert ~left == BooleanMask([1, 0, 0, 1])
+        assert isinstance(~left, BooleanMask)
+        assert isinstance(bytes(right) & left, BooleanMask)
+        with pytest.raises(ValueError):
+            left & BooleanMask([1])
+        with pytest.raises(TypeError):
+            left & [1, 0, 1, 0]
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from array import array
+
+import pytest
+
+from totemp import Celsius, Fahrenheit, Kelvin, convert_values
+from totemp.parallel import convert_parallel
+
+VALUES = [value / 8 for value in range(-5_000, 5_003)]
+
+
+class TestParallel:
+    """Tests shared-memory conversion over a process pool"""
+
+    def test_results_match_serial_path(self) -> None:
+        """Tests that several workers give the serial results"""
+        converted = convert_parallel(VALUES, Celsius, Kelvin, workers=3)
+
+        assert isinstance(converted, array)
+        assert converted == convert_values(VALUES, Celsius, Kelvin)
+
+    def test_single_worker_and_tiny_inputs(self) -> None:
+        """Tests the serial fallback for one worker or fewer values"""
+        assert convert_parallel([0.0], Celsius, Fahrenheit, workers=4) == (
+            array('d', [32.0])
+        )
+        assert convert_parallel([], Celsius, Kelvin, workers=2) == array('d')
+        assert convert_parallel(VALUES, Celsius, Kelvin, workers=1) == (
+            convert_values(VALUES, Celsius, Kelvin)
+        )
+
+    def test_ndarray_inputs_return_ndarrays(self) -> None:
+        """Tests that ndarray inputs give ndarray results"""
+        np = pytest.importorskip('numpy')
+        values = np.array(VALUES)
+        converted = convert_parallel(values, Celsius, Fahrenheit, workers=2)
+
+        assert isinstance(converted, np.ndarray)
+        assert converted.tolist() == list(
+            convert_values(VALUES, Celsius, Fahrenheit)
+        )
+
+    def test_invalid_arguments_raise(self) -> None:
+        """Tests that invalid scales and worker counts are rejected"""
+        with pytest.raises(TypeError):
+            convert_parallel(VALUES, Celsius, float)
+        with pytest.raises(ValueError):
+            convert_parallel(VALUES, Celsius, Kelvin, workers=0)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import math
+import statistics
+
+import pytest
+
+from totemp import (
+    Celsius,
+    Fahrenheit,
+    Kelvin,
+    TemperatureArray,
+    TemperatureSeries,
+)
+
+TIMESTAMPS = (0, 0.5, 0.5, 1, 2.5, 3, 3, 3.5, 6, 6.5, 10)
+VALUES = (12, 25, -3.5, 36.6, 100, 0, 451.25, -40, 21.5, 18, 19)
+
+
+def window(index, size=None, duration=None):
+    """Returns the values of the window ending at `index`, naively."""
+    if size is not None:
+        return VALUES[max(index - size + 1, 0) : index + 1]
+    limit = TIMESTAMPS[index] - duration
+    return [
+        value
+        for timestamp, value in zip(TIMESTAMPS[: index + 1], VALUES)
+        if timestamp > limit
+    ]
+
+
+class TestTemperatureSeries:
+    """Tests the timestamped TemperatureSeries container"""
+
+    def test_storage_and_items(self) -> None:
+        """Tests the parallel buffers, indexing and iteration"""
+        series = TemperatureSeries(Celsius, [1, 2], [Fahrenheit(50), 20])
+
+        assert series.timestamps.typecode == series.values.typecode == 'd'
+        assert len(series) == 2
+        assert series[0] == (1.0, Celsius(10))
+        assert list(series) == [(1.0, Celsius(10)), (2.0, Celsius(20))]
+        assert series[1:].values.tolist() == [20.0]
+        assert (
+            repr(series)
+            == 'TemperatureSeries(Celsius, [1.0, 2.0], [10.0, 20.0])'
+        )
+
+    def test_from_pairs(self) -> None:
+        """Tests building a series from (timestamp, temperature) tuples"""
+        series = TemperatureSeries.from_pairs(
+            [(0, Celsius(0)), (1, Kelvin(373.15))]
+        )
+
+        assert series.scale is Celsius
+        assert series.values.tolist() == [0.0, 100.0]
+        assert TemperatureSeries.from_pairs([], Kelvin).scale is Kelvin
+        with pytest.raises(ValueError):
+            TemperatureSeries.from_pairs([])
+
+    def test_append_and_extend_grow_in_place(self) -> None:
+        """Tests that new readings are added to the same buffers"""
+        series = TemperatureSeries(Celsius, [0], [1])
+        timestamps, values = series.timestamps, series.values
+        series.append(1, Kelvin(273.15))
+        series.extend([2, 2], TemperatureArray(Fahrenheit, [32, 212]))
+
+        assert series.timestamps is timestamps and series.values is values
+        assert values.tolist() == [1.0, 0.0, 0.0, 100.0]
+        with pytest.raises(ValueError):
+            series.append(1.5, 3)
+        with pytest.raises(ValueError):
+            series.extend([3, 2.5], [1, 2])
+        with pytest.raises(ValueError):
+            series.extend([3], [1, 2])
+        assert len(series) == 4
+
+    def test_between_bisects_timestamps(self) -> None:
+        """Tests time slicing with a half-open range"""
+        series = TemperatureSeries(Celsius, TIMESTAMPS, VALUES)
+
+        selected = series.between(0.5, 3)
+        assert selected.timestamps.tolist() == [0.5, 0.5, 1, 2.5]
+        assert selected.values.tolist() == [25, -3.5, 36.6, 100]
+        assert len(series.between(20, 30)) == 0
+
+    def test_convert_to_keeps_timestamps(self) -> None:
+        """Tests converting the whole series in one pass"""
+        series = TemperatureSeries(Celsius, TIMESTAMPS, VALUES)
+        converted = series.convert_to(Fahrenheit)
+
+        assert converted.scale is Fahrenheit
+        assert converted.timestamps == series.timestamps
+        assert converted.timestamps is not series.timestamps
+        assert list(converted) == [
+            (timestamp, Celsius(value).to_fahrenheit())
+            for timestamp, value in zip(TIMESTAMPS, VALUES)
+        ]
+        assert series.to_array().values == series.values
+
+    @pytest.mark.parametrize(
+        'window_kwargs',
+        ({'size': 1}, {'size': 3}, {'duration': 0.5}, {'duration': 3}),
+    )
+    def test_rolling_aggregates_match_naive_windows(
+        self, window_kwargs
+    ) -> None:
+        """Tests rolling mean, min and max against a naive computation"""
+        series = TemperatureSeries(Celsius, TIMESTAMPS, VALUES)
+        size = window_kwargs.get('size')
+        duration = window_kwargs.get('duration')
+
+        means = series.rolling_mean(size, duration=duration)
+        lows = series.rolling_min(size, duration=duration)
+        highs = series.rolling_max(size, duration=duration)
+        for index in range(len(VALUES)):
+            values = window(index, size, duration)
+            assert means.values[index] == pytest.approx(
+                statistics.fmean(values)
+            )
+            assert lows.values[index] == min(values)
+            assert highs.values[index] == max(values)
+        assert means.timestamps == series.timestamps
+
+    @pytest.mark.parametrize(
+        'window_kwargs',
+        ({'size': 1}, {'size': 2}, {'size': 4}, {'duration': 1.5}),
+    )
+    @pytest.mark.parametrize(
+        'values',
+        (
+            [1e17, 1, 2, 3, 4, 5, 6, 7],
+            [1, -1e17, 1e17, 2, 3, 1e-3, 5, 6],
+            [1, math.inf, 2, 3, 4, 5, 6, 7],
+            [1, 2, math.nan, 3, -math.inf, 4, math.inf, 5],
+        ),
+    )
+    def test_rolling_mean_recovers_after_extreme_readings(
+        self, window_kwargs, values
+    ) -> None:
+        """Tests that large and non-finite readings leave later windows"""
+        timestamps = range(len(values))
+        series = TemperatureSeries(Celsius, timestamps, values)
+        size = window_kwargs.get('size')
+        duration = window_kwargs.get('duration')
+
+        means = series.rolling_mean(size, duration=duration).values
+        for index, timestamp in enumerate(timestamps):
+            if size is not None:
+                start = index - size + 1
+            else:
+                start = math.floor(timestamp - duration) + 1
+            try:
+                expected = statistics.fmean(values[max(start, 0) : index + 1])
+            except ValueError:  # fsum refuses inf - inf
+                expected = math.nan
+            if math.isnan(expected):
+                assert math.isnan(means[index])
+            else:
+                assert means[index] == pytest.approx(expected, rel=1e-15)
+
+    def test_invalid_windows(self) -> None:
+        """Tests that exactly one valid window is required"""
+        series = TemperatureSeries(Celsius, TIMESTAMPS, VALUES)
+
+        with pytest.raises(TypeError):
+            series.rolling_mean()
+        with pytest.raises(TypeError):
+            series.rolling_min(2, duration=1)
+        with pytest.raises(ValueError):
+            series.rolling_max(0)
+        with pytest.raises(ValueError):
+            series.rolling_mean(duration=0)
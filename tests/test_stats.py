@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import pickle
+import statistics
+
+import pytest
+
+from totemp import (
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    Kelvin,
+    RunningStats,
+    TemperatureArray,
+)
+
+VALUES = [(i * 7919 % 1000) / 10 - 20 for i in range(1000)]
+
+
+class TestRunningStats:
+    """Tests the one-pass RunningStats accumulator"""
+
+    def test_matches_statistics_module(self, numpy_path) -> None:
+        """Tests the results against the statistics module"""
+        stats = RunningStats(Celsius, VALUES)
+
+        assert stats.count == len(VALUES)
+        assert stats.mean == Celsius(statistics.fmean(VALUES))
+        assert stats.min == Celsius(min(VALUES))
+        assert stats.max == Celsius(max(VALUES))
+        assert stats.variance == pytest.approx(statistics.variance(VALUES))
+        assert stats.pvariance == pytest.approx(statistics.pvariance(VALUES))
+        assert stats.stdev == pytest.approx(statistics.stdev(VALUES))
+        assert stats.pstdev == pytest.approx(statistics.pstdev(VALUES))
+
+    def test_add_one_by_one_matches_batches(self) -> None:
+        """Tests that Welford updates agree with the batch path"""
+        one_by_one = RunningStats(Celsius)
+        for value in VALUES:
+            one_by_one.add(value)
+        batched = RunningStats(Celsius, iter(VALUES))
+
+        assert one_by_one.count == batched.count
+        assert one_by_one.mean.value == pytest.approx(batched.mean.value)
+        assert one_by_one.variance == pytest.approx(batched.variance)
+        assert one_by_one.min == batched.min
+        assert one_by_one.max == batched.max
+
+    def test_mixed_scales_are_converted(self, numpy_path) -> None:
+        """Tests temperatures and batches of other scales"""
+        stats = RunningStats(Fahrenheit)
+        stats.add(Celsius(100))
+        stats.update([Kelvin(273.15), 50])
+        stats.update(TemperatureArray(Celsius, [-40]))
+
+        assert stats.count == 4
+        assert stats.min == Fahrenheit(-40)
+        assert stats.max == Fahrenheit(212)
+        assert stats.mean.value == pytest.approx((212 + 32 + 50 - 40) / 4)
+        assert isinstance(stats.mean, Fahrenheit)
+
+    def test_compensated_sum(self, numpy_path) -> None:
+        """Tests that large values do not swallow small ones"""
+        stats = RunningStats(Kelvin)
+        for value in (1e16, 1.0, -1e16, 1.0):
+            stats.add(value)
+
+        assert stats.mean == Kelvin(0.5)
+        assert RunningStats(Kelvin, [1e100, 1.0, -1e100]).count == 3
+
+    @pytest.mark.parametrize('scale', (Celsius, Delisle, Kelvin))
+    def test_merge_partial_accumulators(self, scale) -> None:
+        """Tests merging accumulators kept in other scales"""
+        total = RunningStats(Celsius, VALUES[:300])
+        part = RunningStats(scale, [Celsius(value) for value in VALUES[300:]])
+        total.merge(part)
+        total.merge(RunningStats(Fahrenheit))
+
+        assert total.count == len(VALUES)
+        assert total.mean.value == pytest.approx(statistics.fmean(VALUES))
+        assert total.variance == pytest.approx(statistics.variance(VALUES))
+        assert total.min.value == pytest.approx(min(VALUES))
+        assert total.max.value == pytest.approx(max(VALUES))
+        with pytest.raises(TypeError):
+            total.merge(Celsius(1))
+
+    def test_state_is_constant_and_picklable(self) -> None:
+        """Tests that the accumulator can be sent to and from workers"""
+        stats = RunningStats(Celsius, VALUES)
+        copy = pickle.loads(pickle.dumps(stats))
+
+        assert repr(copy) == repr(stats)
+        assert not hasattr(stats, '__dict__')
+
+    def test_empty_accumulator(self) -> None:
+        """Tests errors for statistics that need more values"""
+        stats = RunningStats(Celsius)
+
+        assert stats.count == 0
+        assert repr(stats) == 'RunningStats(Celsius, count=0)'
+        with pytest.raises(ValueError):
+            stats.mean
+        stats.add(1)
+        assert stats.pvariance == 0
+        with pytest.raises(ValueError):
+            stats.variance
+        with pytest.raises(TypeError):
+            RunningStats(float)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from array import array
+from itertools import count, islice
+
+import pytest
+
+from totemp import Celsius, Fahrenheit, Kelvin, stream
+
+
+class TestStream:
+    """Tests lazy, chunked conversion of iterables"""
+
+    def test_convert_matches_scalar_path(self) -> None:
+        """Tests that streamed values equal the scalar conversions"""
+        values = [x / 4 for x in range(-400, 400)]
+        streamed = list(stream.convert(values, Celsius, Kelvin, chunk_size=7))
+
+        assert streamed == [Celsius(x).to_kelvin().value for x in values]
+
+    def test_convert_is_lazy_over_unbounded_input(self) -> None:
+        """Tests that an infinite iterable can be consumed incrementally"""
+        converted = stream.convert(count(), Celsius, Fahrenheit, chunk_size=4)
+
+        assert list(islice(converted, 3)) == [32.0, 33.8, 35.6]
+
+    def test_convert_chunks_respects_chunk_size(self) -> None:
+        """Tests that chunks hold at most `chunk_size` values"""
+        chunks = list(
+            stream.convert_chunks(range(10), Celsius, Kelvin, chunk_size=4)
+        )
+
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert all(isinstance(chunk, array) for chunk in chunks)
+
+    def test_temperature_objects_are_converted_from_their_scale(self) -> None:
+        """Tests that objects of any scale are accepted with plain numbers"""
+        items = [Celsius(0), Fahrenheit(212), Kelvin(0), 100]
+        streamed = list(stream.convert(items, Celsius, Kelvin))
+
+        assert streamed == pytest.approx([273.15, 373.15, 0.0, 373.15])
+
+    def test_invalid_arguments_raise(self) -> None:
+        """Tests that invalid scales and chunk sizes are rejected early"""
+        with pytest.raises(TypeError):
+            next(stream.convert([1.0], Celsius, float))
+        with pytest.raises(TypeError, match='`from_scale`'):
+            next(stream.convert([1.0], float, Celsius))
+        with pytest.raises(ValueError):
+            next(stream.convert([1.0], Celsius, Kelvin, chunk_size=0))
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from array import array
+
+import pytest
+
+from totemp import (
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+    TemperatureArray,
+)
+
+SCALES = (
+    Celsius,
+    Fahrenheit,
+    Delisle,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+)
+VALUES = (-273.15, -40, -3.5, 0, 12, 25, 36.6, 100, 451.25)
+
+
+class TestTemperatureArray:
+    """Tests the array-backed TemperatureArray container"""
+
+    @pytest.mark.parametrize('source', SCALES)
+    @pytest.mark.parametrize('target', SCALES)
+    def test_convert_to_matches_scalar_path(self, source, target) -> None:
+        """Tests that batch conversion gives the same values as convert_to"""
+        batch = TemperatureArray(source, VALUES).convert_to(target)
+        expected = [source(value).convert_to(target).value for value in VALUES]
+
+        assert batch.scale is target
+        assert batch.values.tolist() == expected
+
+    def test_to_helpers_match_convert_to(self) -> None:
+        """Tests that every to_* helper returns the matching scale"""
+        batch = TemperatureArray(Celsius, VALUES)
+        helpers = (
+            batch.to_celsius,
+            batch.to_fahrenheit,
+            batch.to_delisle,
+            batch.to_kelvin,
+            batch.to_newton,
+            batch.to_rankine,
+            batch.to_reaumur,
+            batch.to_romer,
+        )
+
+        for helper, scale in zip(helpers, SCALES):
+            converted = helper()
+            assert converted.scale is scale
+            assert converted.values == batch.convert_to(scale).values
+
+    def test_storage_is_contiguous_double_array(self) -> None:
+        """Tests that values are stored in an array('d') buffer"""
+        batch = TemperatureArray(Kelvin, [1, 2.5])
+
+        assert isinstance(batch.values, array)
+        assert batch.values.typecode == 'd'
+        assert len(batch) == 2
+
+    def test_items_and_slices(self) -> None:
+        """Tests indexing, slicing, iteration and representation"""
+        batch = TemperatureArray(Celsius, [12, 25, 50])
+
+        assert batch[0] == Celsius(12)
+        assert isinstance(batch[-1], Celsius)
+        assert batch[1:].values.tolist() == [25.0, 50.0]
+        assert list(batch) == [Celsius(12), Celsius(25), Celsius(50)]
+        assert repr(batch) == 'TemperatureArray(Celsius, [12.0, 25.0, 50.0])'
+        assert batch.symbol == 'ºC'
+
+    def test_iteration_is_lazy_across_chunks(self) -> None:
+        """Tests that iteration yields items without copying the buffer"""
+        batch = TemperatureArray(Celsius, range(10_000))
+        iterator = iter(batch)
+
+        assert next(iterator) == Celsius(0)
+        assert type(next(iterator).value) is float
+        assert sum(1 for _ in iterator) == 9_998
+        assert list(batch)[4095:4098] == [
+            Celsius(4095),
+            Celsius(4096),
+            Celsius(4097),
+        ]
+
+    def test_from_temperatures_converts_mixed_scales(self) -> None:
+        """Tests building a batch from temperature objects of any scale"""
+        temps = [Celsius(0), Fahrenheit(212), Kelvin(273.15)]
+        batch = TemperatureArray.from_temperatures(temps)
+
+        assert batch.scale is Celsius
+        assert batch.values.tolist() == [0.0, 100.0, 0.0]
+        assert TemperatureArray.from_temperatures([], Kelvin).scale is Kelvin
+        with pytest.raises(ValueError):
+            TemperatureArray.from_temperatures([])
+
+    def test_from_temperatures_uses_mutable_scale_of_frozen(self) -> None:
+        """Tests that a frozen first element yields a batch of its scale"""
+        batch = TemperatureArray.from_temperatures(
+            [Celsius.of(1), Fahrenheit(212)]
+        )
+
+        assert batch.scale is Celsius
+        assert batch.values.tolist() == [1, 100]
+        assert repr(batch) == repr(TemperatureArray(Celsius, [1, 100]))
+        assert (batch + 1).scale is batch.scale
+
+    def test_invalid_scale_raises_type_error(self) -> None:
+        """Tests that only temperature classes are accepted as scales"""
+        with pytest.raises(TypeError):
+            TemperatureArray(float, [1.0])
+        with pytest.raises(TypeError):
+            TemperatureArray(Celsius, [1.0]).convert_to(float)
+
+    @pytest.mark.parametrize('other', (Fahrenheit(54.5), Kelvin(300), 2.5))
+    @pytest.mark.parametrize(
+        'operator',
+        (
+            lambda a, b: a + b,
+            lambda a, b: a - b,
+            lambda a, b: a * b,
+            lambda a, b: a / b,
+            lambda a, b: a // b,
+            lambda a, b: a % b,
+        ),
+    )
+    def test_arithmetic_matches_scalar_dunders(self, operator, other) -> None:
+        """Tests that batch arithmetic gives the values of the scalar path"""
+        # Non-zero both in Celsius and in Kelvin, for the reflected divisions.
+        values = [value for value in VALUES if value not in (0, -273.15)]
+        batch = TemperatureArray(Celsius, values)
+
+        result = operator(batch, other)
+        expected = [operator(Celsius(value), other) for value in values]
+        assert list(result) == expected
+        reflected = operator(other, batch)
+        expected = [operator(other, Celsius(value)) for value in values]
+        assert reflected.scale is type(expected[0])
+        assert list(reflected) == expected
+
+    def test_arithmetic_with_sequences_and_batches(self) -> None:
+        """Tests element-wise operands, converted once to the batch scale"""
+        batch = TemperatureArray(Celsius, [10, 20, 30])
+        kelvin = TemperatureArray(Kelvin, [273.15, 283.15, 293.15])
+
+        assert (batch - kelvin).values.tolist() == [10.0, 10.0, 10.0]
+        assert (batch * [1, 2, 3]).values.tolist() == [10.0, 40.0, 90.0]
+        assert (
+            batch + (Kelvin(273.15), 1, Fahrenheit(32))
+        ).values.tolist() == [
+            10.0,
+            21.0,
+            30.0,
+        ]
+        assert (2 ** TemperatureArray(Celsius, [1, 3])).values.tolist() == [
+            2.0,
+            8.0,
+        ]
+        quotients, remainders = divmod(batch, 7)
+        assert quotients.values.tolist() == [1.0, 2.0, 4.0]
+        assert remainders.values.tolist() == [3.0, 6.0, 2.0]
+        assert (Celsius.of(40) - batch).scale is Celsius
+        with pytest.raises(ValueError):
+            batch + [1, 2]
+        with pytest.raises(ZeroDivisionError):
+            batch / [1, 0, 1]
+        with pytest.raises(TypeError):
+            batch + 'a'
+
+    def test_arithmetic_with_ndarray(self) -> None:
+        """Tests that ndarray operands are computed with NumPy"""
+        np = pytest.importorskip('numpy')
+        batch = TemperatureArray(Celsius, np.array([10.0, 20.0, 30.0]))
+
+        result = batch + Fahrenheit(50)
+        assert isinstance(result.values, np.ndarray)
+        assert result.values.tolist() == [20.0, 30.0, 40.0]
+        assert (batch * np.array([1, 2, 3])).values.tolist() == [
+            10.0,
+            40.0,
+            90.0,
+        ]
+        assert (
+            TemperatureArray(Celsius, [1, 2]) + np.ones(2)
+        ).values.tolist() == [
+            2.0,
+            3.0,
+        ]
+        with pytest.raises(ZeroDivisionError):
+            batch % np.array([1.0, 0.0, 1.0])
+
+    @pytest.mark.parametrize(
+        'base, exponent', [(0.0, -1), (0.0, -0.5), (0.0, 2), (2.0, -1)]
+    )
+    def test_pow_matches_scalar_on_every_path(self, base, exponent) -> None:
+        """Tests zero raised to a negative power on all three paths"""
+        np = pytest.importorskip('numpy')
+        bases = (
+            TemperatureArray(Celsius, [base]),
+            TemperatureArray(Celsius, np.array([base])),
+        )
+        exponents = (
+            TemperatureArray(Celsius, [exponent]),
+            TemperatureArray(Celsius, np.array([exponent])),
+        )
+        try:
+            expected = (Celsius(base) ** exponent).value
+        except ZeroDivisionError:
+            for batch in bases:
+                with pytest.raises(ZeroDivisionError):
+                    batch**exponent
+            for batch in exponents:
+                with pytest.raises(ZeroDivisionError):
+                    base**batch
+        else:
+            for batch in bases:
+                assert (batch**exponent).values.tolist() == [expected]
+            for batch in exponents:
+                assert (base**batch).values.tolist() == [expected]
+
+    @pytest.mark.parametrize('threshold', (Fahrenheit(100), Kelvin(300), 25))
+    @pytest.mark.parametrize(
+        'operator',
+        (
+            lambda a, b: a == b,
+            lambda a, b: a != b,
+            lambda a, b: a < b,
+            lambda a, b: a <= b,
+            lambda a, b: a > b,
+            lambda a, b: a >= b,
+        ),
+    )
+    def test_comparisons_match_scalar_dunders(
+        self, operator, threshold
+    ) -> None:
+        """Tests that comparison masks agree with the scalar comparisons"""
+        batch = TemperatureArray(Celsius, VALUES + (37.7, 26.85))
+
+        mask = operator(batch, threshold)
+        expected = [operator(Celsius(value), threshold) for value in batch]
+        assert list(map(bool, mask)) == expected
+        # Reflected comparisons convert the threshold too, so values at the
+        # boundary may compare differently after rounding.
+        batch = TemperatureArray(Celsius, VALUES)
+        assert list(map(bool, operator(threshold, batch))) == [
+            operator(threshold, Celsius(value)) for value in batch
+        ]
+
+    def test_filter_by_threshold_in_another_scale(self) -> None:
+        """Tests filtering and counting with a mask"""
+        batch = TemperatureArray(Celsius, [10, 40, 38, 20])
+
+        mask = batch > Fahrenheit(100)
+        assert mask.count() == 2 and mask.any() and not mask.all()
+        assert batch.filter(mask).values.tolist() == [40.0, 38.0]
+        assert batch.filter(~mask).values.tolist() == [10.0, 20.0]
+        assert batch.filter([True, False, False, True]).scale is Celsius
+        assert (batch == [10, 0, 38, 0]).count() == 2
+        assert (batch < TemperatureArray(Kelvin, [300] * 4)).count() == 2
+        with pytest.raises(ValueError):
+            batch.filter(mask[1:])
+        with pytest.raises(TypeError):
+            batch < 'a'
+
+    def test_comparisons_with_ndarray(self) -> None:
+        """Tests masks and filtering of ndarray-backed batches"""
+        np = pytest.importorskip('numpy')
+        batch = TemperatureArray(Celsius, np.array([10.0, 40.0, 38.0]))
+
+        mask = batch >= Fahrenheit(100.4)
+        assert list(mask) == [0, 1, 1]
+        selected = batch.filter(mask)
+        assert isinstance(selected.values, np.ndarray)
+        assert selected.values.tolist() == [40.0, 38.0]
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+
+from totemp import (
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+    TemperatureArray,
+    format_many,
+    parse,
+    parse_many,
+)
+from totemp.text import fold_symbol
+
+SCALES = (
+    Celsius,
+    Fahrenheit,
+    Delisle,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+)
+
+
+class TestParse:
+    """Tests parsing temperature strings"""
+
+    @pytest.mark.parametrize('scale', SCALES)
+    def test_round_trips_str(self, scale) -> None:
+        """Tests that `parse` reads back the output of `__str__`"""
+        for value in (12, 53.6, -0.5, 1e-07):
+            temp = parse(str(scale(value)))
+
+            assert type(temp) is scale
+            assert temp.value == value
+
+    @pytest.mark.parametrize(
+        'text, expected',
+        [
+            ('12 °C', Celsius(12)),
+            ('12C', Celsius(12)),
+            (' -3.5 c ', Celsius(-3.5)),
+            ('+1e3 K', Kelvin(1000)),
+            ('5 ºRé', Reaumur(5)),
+            ('5 Re', Reaumur(5)),
+            ('5 ºRø', Romer(5)),
+            ('5 Ro', Romer(5)),
+            ('5 R', Rankine(5)),
+            ('5 De', Delisle(5)),
+        ],
+    )
+    def test_accepts_symbol_variants(self, text, expected) -> None:
+        """Tests degree sign, case and accent variants of the symbols"""
+        temp = parse(text)
+
+        assert type(temp) is type(expected)
+        assert temp.value == expected.value
+
+    @pytest.mark.parametrize('text', ['', '12', 'ºC', '12 X', '1.2.3 ºC'])
+    def test_rejects_invalid_strings(self, text) -> None:
+        """Tests that invalid strings raise `ValueError`"""
+        with pytest.raises(ValueError):
+            parse(text)
+
+    def test_fold_symbol(self) -> None:
+        """Tests that symbol spellings fold to the same key"""
+        assert fold_symbol('ºC') == fold_symbol('°c') == fold_symbol(' C ')
+        assert fold_symbol('ºRé') == fold_symbol('Re') == 're'
+        assert fold_symbol('Rø') == fold_symbol('ro') == 'ro'
+        assert fold_symbol('Celsius') == 'celsius'
+
+
+class TestParseMany:
+    """Tests bulk parsing of temperature strings"""
+
+    def test_returns_objects(self) -> None:
+        """Tests that every line becomes an object of its own scale"""
+        temps = parse_many(['12 ºC\n', '\n', '53.6 ºF\n'])
+
+        assert [type(temp) for temp in temps] == [Celsius, Fahrenheit]
+        assert [temp.value for temp in temps] == [12, 53.6]
+
+    def test_converts_to_scale(self) -> None:
+        """Tests that mixed scales are converted to `scale`"""
+        temps = parse_many(['12 ºC', '53.6 ºF'], Celsius)
+
+        assert all(type(temp) is Celsius for temp in temps)
+        assert [temp.value for temp in temps] == [
+            12,
+            Fahrenheit(53.6).to_celsius().value,
+        ]
+
+    def test_returns_array(self) -> None:
+        """Tests that `as_array` builds a batch of the first line's scale"""
+        batch = parse_many(['1 K', '0 ºC', '', '2 K'], as_array=True)
+
+        assert isinstance(batch, TemperatureArray)
+        assert batch.scale is Kelvin
+        assert list(batch.values) == [1, 273.15, 2]
+
+    def test_array_of_empty_input_needs_scale(self) -> None:
+        """Tests that an empty input only makes a batch of a given scale"""
+        assert len(parse_many([], Celsius, as_array=True)) == 0
+        with pytest.raises(ValueError):
+            parse_many([], as_array=True)
+
+    def test_reports_invalid_line_number(self) -> None:
+        """Tests that errors name the offending line"""
+        with pytest.raises(ValueError, match='line 3'):
+            parse_many(['1 ºC', '', 'oops'])
+
+
+class TestFormatMany:
+    """Tests bulk formatting of temperatures"""
+
+    def test_matches_str(self) -> None:
+        """Tests that the default output equals `__str__`"""
+        values = [12, 53.6, -0.5]
+
+        assert format_many(values, Fahrenheit) == [
+            str(Fahrenheit(value)) for value in values
+        ]
+
+    def test_expresses_values_in_scale(self) -> None:
+        """Tests that objects and batches are converted to `scale` first"""
+        batch = TemperatureArray(Kelvin, [273.15])
+
+        assert format_many([Fahrenheit(212), 5], Celsius) == [
+            '100.0 ºC',
+            '5 ºC',
+        ]
+        assert format_many(batch, Celsius) == ['0.0 ºC']
+
+    def test_precision_and_symbol(self) -> None:
+        """Tests fixed decimals and output without the symbol"""
+        assert format_many([1, 2.345], Kelvin, precision=2) == [
+            '1.00 K',
+            '2.35 K',
+        ]
+        assert format_many([1.5], Romer, with_symbol=False) == ['1.5']
+        with pytest.raises(ValueError):
+            format_many([1], Kelvin, precision=-1)
+
+    def test_writes_to_file(self) -> None:
+        """Tests that lines are written to the stream, also from iterators"""
+        file = io.StringIO()
+        written = format_many(
+            (float(x) for x in range(3)), Reaumur, precision=1, file=file
+        )
+
+        assert written == 3
+        assert file.getvalue() == '0.0 ºRé\n1.0 ºRé\n2.0 ºRé\n'
+
+    def test_round_trips_with_parse_many(self) -> None:
+        """Tests that formatted lines parse back to the same values"""
+        values = [x / 7 for x in range(-50, 50)]
+        batch = parse_many(format_many(values, Newton), as_array=True)
+
+        assert batch.scale is Newton
+        assert list(batch.values) == values
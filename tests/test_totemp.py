@@ -1,18 +1,64 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import weakref
+
+import pytest
+
 from tests.test_funcs import func_to_test_precise_rounded_results
 from totemp import (
     Celsius,
     Delisle,
     Fahrenheit,
+    FrozenTemperature,
     Kelvin,
     Newton,
     Rankine,
     Reaumur,
     Romer,
+    TemperatureArray,
+    cli,
+    convert_values,
+    converter,
+    intern_cache_clear,
+    intern_cache_info,
+    parse,
+    scales,
+    set_intern_cache_size,
+    text,
+)
+from totemp.temperature_types import (
+    _CONVERSIONS,
+    _FORMULAS,
+    _KELVIN,
+    DEFAULT_INTERN_CACHE_SIZE,
+    AbstractTemperature,
+    _derive,
 )
 
 
+@pytest.fixture
+def scale_registry():
+    """Unregisters the scales defined by a test and forgets their names."""
+    kelvin = dict(_KELVIN)
+    rows = {scale: dict(row) for scale, row in _CONVERSIONS.items()}
+    names = (text._SYMBOLS, text._FOLDED_SYMBOLS, cli._SCALE_NAMES)
+    saved_names = [dict(mapping) for mapping in names]
+    yield
+    _KELVIN.clear()
+    _KELVIN.update(kelvin)
+    for scale in set(_CONVERSIONS) - set(rows):
+        del _CONVERSIONS[scale]
+    for scale, row in rows.items():
+        # The rows are shared with the `_conversions` of each class.
+        _CONVERSIONS[scale].clear()
+        _CONVERSIONS[scale].update(row)
+    for mapping, saved in zip(names, saved_names):
+        mapping.clear()
+        mapping.update(saved)
+    converter.cache_clear()
+    intern_cache_clear()
+
+
 class TestToTemp:
     """Tests all methods of all Classes in temperature_types.py"""
 
@@ -695,3 +741,278 @@ class TestToTemp:
         errors = func_to_test_precise_rounded_results(temps)
 
         assert not errors, 'errors occurred:\n{}'.format('\n'.join(errors))
+
+    def test_instances_are_slotted(self) -> None:
+        """Tests that temperature instances carry slots instead of a dict"""
+        for temp in (Celsius(1), Fahrenheit(2), Kelvin(3), Romer(4)):
+            assert not hasattr(temp, '__dict__')
+            assert temp.value == temp._value
+
+        temp = Celsius(1)
+        temp.value = 2.5
+        assert temp.value == 2.5
+        assert temp.symbol == 'ºC'
+        with pytest.raises(AttributeError):
+            temp.other = 1
+
+    def test_instances_support_weak_references(self) -> None:
+        """Tests that slotted instances can still be weakly referenced"""
+        for temp in (Celsius(1), Kelvin(2), Celsius(3).frozen()):
+            ref = weakref.ref(temp)
+            assert ref() is temp
+
+        cache = weakref.WeakValueDictionary({'reading': Celsius(4)})
+        assert 'reading' not in cache
+
+    def test_subclasses_must_set_symbol(self) -> None:
+        """Tests that __init_subclass__ still enforces the `_symbol` attribute"""
+        with pytest.raises(AttributeError):
+
+            class NoSymbol(AbstractTemperature):
+                __slots__ = ()
+
+    def test_abstract_base_is_not_instantiable(self) -> None:
+        """Tests that AbstractTemperature itself cannot be instantiated"""
+        with pytest.raises(TypeError):
+            AbstractTemperature(5)
+
+    def test_mixed_scale_operators_skip_temporary_objects(
+        self, monkeypatch
+    ) -> None:
+        """Tests that mixed-scale operators convert `other` without convert_to"""
+        temp0, temp1 = Celsius(25), Fahrenheit(77)
+        expected = temp1.convert_to(Celsius).value
+
+        def fail(*args, **kwargs):
+            raise AssertionError('convert_to should not be called')
+
+        monkeypatch.setattr(Fahrenheit, 'convert_to', fail)
+
+        assert temp0 == temp1
+        assert not temp0 < temp1
+        assert (temp0 + temp1).value == 25 + expected
+        assert divmod(temp0, temp1) == (Celsius(1.0), Celsius(0.0))
+
+    def test_frozen_temperatures_hash_across_scales(self) -> None:
+        """Tests that frozen temperatures dedup equal values in any scale"""
+        readings = [
+            Celsius(0).frozen(),
+            Kelvin(273.15).frozen(),
+            Fahrenheit(32).frozen(),
+            Celsius(100).frozen(),
+        ]
+
+        assert readings[0] == readings[1] == readings[2]
+        assert hash(readings[0]) == hash(readings[1]) == hash(readings[2])
+        assert len(set(readings)) == 2
+        assert {readings[1]: 'ice'}[Celsius(0).frozen()] == 'ice'
+
+    def test_frozen_temperatures_are_immutable(self) -> None:
+        """Tests the frozen variant is read-only and keeps its scale"""
+        temp = Reaumur(12).frozen()
+
+        assert isinstance(temp, Reaumur)
+        assert isinstance(temp, FrozenTemperature)
+        assert temp.frozen() is temp
+        assert repr(temp + 1) == 'FrozenReaumur(13)'
+        assert temp.to_celsius() == Celsius(15.0)
+        with pytest.raises(AttributeError):
+            temp.value = 13
+        with pytest.raises(TypeError):
+            hash(Reaumur(12))
+
+    def test_converter_matches_convert_to(self) -> None:
+        """Tests that generated float converters use the scalar formulas"""
+        scales = (
+            Celsius,
+            Fahrenheit,
+            Delisle,
+            Kelvin,
+            Newton,
+            Rankine,
+            Reaumur,
+            Romer,
+        )
+        values = (-273.15, -40, -0.0, 0, 12.5, 25, 100, 451)
+
+        for source in scales:
+            for target in scales:
+                function = converter(source, target)
+                assert function is converter(source, target)
+                for value in values:
+                    expected = source(value).convert_to(target).value
+                    assert repr(function(value)) == repr(expected)
+
+    def test_converter_rejects_non_temperature_scales(self) -> None:
+        """Tests that converter raises TypeError for unknown scales"""
+        with pytest.raises(TypeError):
+            converter(float, Celsius)
+        with pytest.raises(TypeError):
+            converter(Celsius, float)
+
+    def test_registry_holds_builtin_scales(self) -> None:
+        """Tests that built-in scales are registered in definition order"""
+        assert scales() == (
+            Celsius,
+            Fahrenheit,
+            Delisle,
+            Kelvin,
+            Newton,
+            Rankine,
+            Reaumur,
+            Romer,
+        )
+
+    def test_derived_coefficients_match_formulas(self) -> None:
+        """Tests that built-in fixed points reproduce the textbook formulas"""
+        values = (-273.15, -40, 0, 12.5, 100, 451)
+
+        def apply(coefficients, value):
+            pre, mul, div, post = coefficients
+            return (value + pre) * mul / div + post
+
+        for source, row in _FORMULAS.items():
+            for target, formula in row.items():
+                derived = _derive(source, target)
+                for value in values:
+                    assert apply(derived, value) == pytest.approx(
+                        apply(formula, value), rel=1e-12, abs=1e-12
+                    )
+
+    def test_registered_scale_converts_everywhere(
+        self, scale_registry
+    ) -> None:
+        """Tests that a scale declaring fixed points gets every conversion"""
+
+        class Hooke(AbstractTemperature):
+            __slots__ = ()
+            _symbol = 'ºH'
+            _fixed_points = ((0, 273.15), (10, 283.15))
+
+        assert Hooke in scales()
+        assert Hooke(10).to_celsius().value == 10
+        assert Hooke(10).convert_to(Fahrenheit).value == 50
+        assert Celsius(20).convert_to(Hooke).value == 20
+        assert Hooke(10) == Celsius(10)
+        assert Hooke(10).frozen() == Kelvin(283.15).frozen()
+        assert converter(Kelvin, Hooke)(273.15) == 0
+        assert list(convert_values([0.0, 10.0], Hooke, Celsius)) == [0, 10]
+        assert list(TemperatureArray(Celsius, [5]).convert_to(Hooke)) == [5]
+        assert type(parse('3 ºH')) is Hooke
+
+    def test_registered_scale_from_kelvin_scale_and_offset(
+        self, scale_registry
+    ) -> None:
+        """Tests scales declared by scale and offset relative to Kelvin"""
+
+        class MilliKelvin(AbstractTemperature):
+            __slots__ = ()
+            _symbol = 'mK'
+            _to_kelvin = (0.001, 0)
+
+        assert MilliKelvin(1500).to_kelvin().value == 1.5
+        assert Kelvin(2).convert_to(MilliKelvin).value == 2000
+        assert Celsius(0).convert_to(MilliKelvin).value == 273150
+
+    def test_registry_rejects_degenerate_scales(self, scale_registry) -> None:
+        """Tests that fixed points must define an invertible scale"""
+        with pytest.raises(ValueError):
+
+            class Flat(AbstractTemperature):
+                __slots__ = ()
+                _symbol = 'ºFl'
+                _fixed_points = ((0, 273.15), (0, 373.15))
+
+        with pytest.raises(ValueError):
+
+            class Null(AbstractTemperature):
+                __slots__ = ()
+                _symbol = 'ºZ'
+                _to_kelvin = (0, 273.15)
+
+    def test_of_returns_shared_frozen_instances(self) -> None:
+        """Tests that `of` interns immutable instances by scale and value"""
+        temp = Celsius.of(21.5)
+
+        assert temp is Celsius.of(21.5)
+        assert isinstance(temp, Celsius.Frozen)
+        assert temp.value == 21.5
+        assert Celsius.of(21.5) is not Fahrenheit.of(21.5)
+        assert repr(Celsius.of(1)) == 'FrozenCelsius(1)'
+        assert repr(Celsius.of(1.0)) == 'FrozenCelsius(1.0)'
+        with pytest.raises(AttributeError):
+            temp.value = 22
+
+    def test_of_cache_statistics_and_eviction(self) -> None:
+        """Tests the hit/miss statistics and the LRU bound of `of`"""
+        set_intern_cache_size(2)
+        try:
+            first = Kelvin.of(1)
+            Kelvin.of(2)
+            Kelvin.of(1)
+            Kelvin.of(3)  # evicts Kelvin.of(2), the least recently used
+
+            info = intern_cache_info()
+            assert (info.hits, info.misses) == (1, 3)
+            assert (info.maxsize, info.currsize) == (2, 2)
+            assert Kelvin.of(1) is first
+
+            intern_cache_clear()
+            assert intern_cache_info().currsize == 0
+            assert Kelvin.of(1) is not first
+            with pytest.raises(ValueError):
+                set_intern_cache_size(-1)
+        finally:
+            set_intern_cache_size(DEFAULT_INTERN_CACHE_SIZE)
+
+    def test_in_place_operators_update_mutable_instances(self) -> None:
+        """Tests that augmented assignments keep the object and its class"""
+        operators = (
+            ('__iadd__', '__add__'),
+            ('__isub__', '__sub__'),
+            ('__imul__', '__mul__'),
+            ('__ipow__', '__pow__'),
+            ('__itruediv__', '__truediv__'),
+            ('__ifloordiv__', '__floordiv__'),
+            ('__imod__', '__mod__'),
+        )
+
+        for in_place, binary in operators:
+            for other in (Fahrenheit(50), Celsius(3), 2, 0.5):
+                temp = Celsius(7.5)
+                expected = getattr(Celsius(7.5), binary)(other)
+
+                assert getattr(temp, in_place)(other) is temp
+                assert type(temp) is Celsius
+                assert repr(temp) == repr(expected)
+
+    def test_in_place_operators_avoid_conversions(self, monkeypatch) -> None:
+        """Tests that mixed-scale `+=` does not build a temporary object"""
+        total = Celsius(0)
+
+        def fail(self, temp_cls):
+            raise AssertionError('convert_to should not be called')
+
+        monkeypatch.setattr(AbstractTemperature, 'convert_to', fail)
+        total += Kelvin(274.15)
+        total -= Fahrenheit(33.8)
+
+        assert total.value == pytest.approx(0)
+
+    def test_in_place_operators_leave_frozen_instances(self) -> None:
+        """Tests that `+=` on a frozen instance rebinds to a new object"""
+        temp = original = Celsius(1).frozen()
+        temp += Kelvin(274.15)
+
+        assert temp is not original
+        assert original.value == 1
+        assert temp == Celsius(2)
+        assert isinstance(temp, FrozenTemperature)
+
+    def test_in_place_operators_reject_unsupported_operands(self) -> None:
+        """Tests that unsupported operands still raise TypeError"""
+        temp = Celsius(1)
+
+        with pytest.raises(TypeError):
+            temp += 'a'
+        assert temp.value == 1
@@ -1,16 +1,29 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+from . import aio, filters, instrumentation, stream
+from .batch import convert_values
+from .mask import BooleanMask
+from .series import TemperatureSeries
+from .stats import RunningStats
+from .temperature_array import TemperatureArray
 from .temperature_types import (
     Celsius,
     Delisle,
     Fahrenheit,
+    FrozenTemperature,
     Kelvin,
     Newton,
     Rankine,
     Reaumur,
     Romer,
+    converter,
+    intern_cache_clear,
+    intern_cache_info,
+    scales,
+    set_intern_cache_size,
 )
+from .text import format_many, parse, parse_many
 
 __author__ = 'Edson Pimenta, Raul Silva and Dávilos Tavares'
 __credits__ = ['Edson Pimenta', 'Dávilos Tavares', 'Raul Silva']
@@ -31,4 +44,22 @@ __all__ = [
     'Rankine',
     'Reaumur',
     'Romer',
+    'TemperatureArray',
+    'BooleanMask',
+    'RunningStats',
+    'TemperatureSeries',
+    'FrozenTemperature',
+    'converter',
+    'scales',
+    'intern_cache_info',
+    'intern_cache_clear',
+    'set_intern_cache_size',
+    'convert_values',
+    'stream',
+    'aio',
+    'filters',
+    'instrumentation',
+    'parse',
+    'parse_many',
+    'format_many',
 ]
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, AsyncIterable, AsyncIterator
+
+from .batch import _plain_values, convert_values
+from .temperature_types import AbstractTemperature, _check_scale
+
+DEFAULT_MAX_BATCH = 1024
+DEFAULT_MAX_DELAY = 0.005
+
+
+async def convert_batches(
+    source: AsyncIterable[Any],
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    *,
+    max_batch: int = DEFAULT_MAX_BATCH,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    max_pending: int | None = None,
+) -> AsyncGenerator[Any, None]:
+    """
+    Converts an asynchronous feed in micro-batches.
+
+    Readings are pulled from `source` by a background task into a buffer
+    of at most `max_pending` items (``4 * max_batch`` by default, and no
+    less than `max_batch`): when the consumer falls behind, the buffer
+    fills up and the task stops reading `source` until there is room
+    again. A batch is closed once it holds `max_batch` readings or
+    `max_delay` seconds after it was started, whichever comes first, and is
+    converted at once with `convert_values`, so the event loop runs one
+    batch operation instead of per-object work.
+    Items may be plain numbers in `from_scale` or temperature objects of
+    any scale.
+    Exceptions raised by `source` are re-raised after the readings that
+    arrived before them are yielded.
+
+    Yields
+    ------
+    batch : array
+        ``array('d')`` with the converted values of up to `max_batch`
+        readings.
+    """
+    if max_batch < 1:
+        raise ValueError('`max_batch` must be a positive integer')
+    if max_delay < 0:
+        raise ValueError('`max_delay` must not be negative')
+    if max_pending is not None and max_pending < max_batch:
+        raise ValueError('`max_pending` must not be less than `max_batch`')
+    _check_scale(from_scale, to_scale, 'from_scale')
+
+    loop = asyncio.get_running_loop()
+    buffer = _Buffer(max_batch, max_pending or 4 * max_batch)
+    producer = asyncio.create_task(buffer.fill(source))
+    try:
+        while await buffer.wait():
+            deadline = loop.time() + max_delay
+            while len(buffer.items) < max_batch and not buffer.done:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                buffer.ready.clear()
+                try:
+                    await asyncio.wait_for(buffer.ready.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            yield convert_values(
+                _plain_values(buffer.take(max_batch), from_scale),
+                from_scale,
+                to_scale,
+            )
+        if buffer.error is not None:
+            raise buffer.error
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+
+
+async def convert(
+    source: AsyncIterable[Any],
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    *,
+    max_batch: int = DEFAULT_MAX_BATCH,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    max_pending: int | None = None,
+) -> AsyncIterator[float]:
+    """
+    Converts an asynchronous feed and yields the values one by one.
+
+    Readings are micro-batched as described in `convert_batches`.
+
+    Yields
+    ------
+    value : float
+        Each reading of `source` converted to `to_scale`.
+    """
+    async with aclosing(
+        convert_batches(
+            source,
+            from_scale,
+            to_scale,
+            max_batch=max_batch,
+            max_delay=max_delay,
+            max_pending=max_pending,
+        )
+    ) as batches:
+        async for batch in batches:
+            for value in batch:
+                yield value
+
+
+class _Buffer:
+    """Readings pulled from a source and not yet taken by the consumer."""
+
+    __slots__ = (
+        'items',
+        'ready',
+        'room',
+        'done',
+        'error',
+        '_max_batch',
+        '_max_pending',
+    )
+
+    def __init__(self, max_batch: int, max_pending: int) -> None:
+        self.items: list[Any] = []
+        self.ready = asyncio.Event()  # first item, full batch or end
+        self.room = asyncio.Event()
+        self.done = False
+        self.error: Exception | None = None
+        self._max_batch = max_batch
+        self._max_pending = max_pending
+
+    async def fill(self, source: AsyncIterable[Any]) -> None:
+        """Appends the items of `source`, pausing while the buffer is full."""
+        items = self.items
+        try:
+            async for item in source:
+                items.append(item)
+                count = len(items)
+                if count == 1 or count >= self._max_batch:
+                    self.ready.set()
+                while len(items) >= self._max_pending:
+                    self.room.clear()
+                    self.ready.set()
+                    await self.room.wait()
+        except Exception as error:
+            self.error = error
+        finally:
+            self.done = True
+            self.ready.set()
+
+    async def wait(self) -> bool:
+        """Waits for items; returns ``False`` once the source is exhausted."""
+        while not self.items and not self.done:
+            self.ready.clear()
+            await self.ready.wait()
+        return bool(self.items)
+
+    def take(self, count: int) -> list[Any]:
+        """Removes and returns up to `count` items."""
+        taken = self.items[:count]
+        del self.items[:count]
+        self.room.set()
+        return taken
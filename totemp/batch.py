@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable
+
+from .temperature_types import (
+    _IDENTITY,
+    AbstractTemperature,
+    _is_neutral_addend,
+    converter,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None  # type: ignore[assignment]
+
+HAS_NUMPY = np is not None
+
+_PLAIN_NUMBERS = frozenset((float, int))
+
+
+def is_ndarray(values: Any) -> bool:
+    """Returns whether `values` is a NumPy ``ndarray``."""
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def convert_values(
+    values: Iterable[float],
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    *,
+    out: Any = None,
+) -> Any:
+    """
+    Returns the raw values of `from_scale` converted to `to_scale`.
+
+    ``ndarray`` inputs (or an ``ndarray`` `out`) take the NumPy path and
+    return a ``float64`` ``ndarray``; any other iterable returns an
+    ``array('d')``. Results are identical to converting each value with
+    `convert_to`. If `out` is given, the results are written into it and it
+    is returned, which avoids allocating a new buffer (`out` may be the
+    input itself for an in-place conversion).
+    If no conversion is possible, `TypeError` is raised.
+
+    Returns
+    -------
+    convert_values(values, from_scale, to_scale) : ndarray | array
+        (values + pre) * mul / div + post
+    """
+    if is_ndarray(values) or is_ndarray(out):
+        return _convert_ndarray(values, from_scale, to_scale, out)
+    function = converter(from_scale, to_scale)
+    if out is None:
+        return array('d', map(function, values))
+    converted = array('d', map(function, values))
+    if len(converted) != len(out):
+        raise ValueError(
+            f'`out` has {len(out)} items, expected {len(converted)}'
+        )
+    out[:] = converted
+    return out
+
+
+def _convert_ndarray(
+    values: Any,
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    out: Any,
+) -> Any:
+    """NumPy path of `convert_values`: one ufunc call per coefficient."""
+    coefficients = from_scale._coefficients(to_scale)
+    values = np.asarray(values)
+    if out is None:
+        out = np.empty(values.shape, dtype=np.float64)
+    if coefficients is _IDENTITY:
+        np.copyto(out, values)
+        return out
+    pre, mul, div, post = coefficients
+    # The operations mirror the scalar formula step by step (skipping only
+    # the neutral ones), so every element is rounded exactly as there.
+    source = values
+    if not _is_neutral_addend(pre):
+        np.add(source, pre, out=out)
+        source = out
+    if mul != 1:
+        np.multiply(source, mul, out=out)
+        source = out
+    if div != 1:
+        np.true_divide(source, div, out=out)
+        source = out
+    if not _is_neutral_addend(post):
+        np.add(source, post, out=out)
+        source = out
+    if source is not out:
+        np.copyto(out, source)
+    return out
+
+
+def _plain_values(chunk: list[Any], scale: type[AbstractTemperature]) -> Any:
+    """Returns `chunk` with temperature objects expressed in `scale`."""
+    if _PLAIN_NUMBERS.issuperset(map(type, chunk)):
+        return chunk
+    return [
+        item._value_in(scale)
+        if isinstance(item, AbstractTemperature)
+        else item
+        for item in chunk
+    ]
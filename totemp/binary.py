@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import mmap
+import os
+import sys
+from array import array
+from typing import Any
+
+from .batch import HAS_NUMPY, convert_values
+from .temperature_types import AbstractTemperature, _check_scale
+
+if HAS_NUMPY:
+    import numpy as np
+
+ITEM_SIZE = 8
+DEFAULT_PAGE_SIZE = 65_536
+
+
+def convert_file(
+    source: str | os.PathLike[str],
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    target: str | os.PathLike[str] | None = None,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> int:
+    """
+    Converts a file of raw little-endian float64 values.
+
+    The file is memory-mapped and converted `page_size` values at a time
+    through a ``memoryview`` of the mapping (or a zero-copy ``ndarray`` when
+    NumPy is installed) with the coefficients used by `convert_to`, so files
+    larger than the available memory can be converted. Without `target`
+    the file is rewritten in place; otherwise the results go to a new
+    memory-mapped `target` file of the same size.
+    If the file size is not a multiple of 8 bytes, `ValueError` is raised.
+
+    Returns
+    -------
+    count : int
+        Number of converted values.
+    """
+    if page_size < 1:
+        raise ValueError('`page_size` must be a positive integer')
+    _check_scale(from_scale, to_scale, 'from_scale')
+    size = os.path.getsize(source)
+    if size % ITEM_SIZE:
+        raise ValueError(
+            f'{os.fspath(source)!r} has {size} bytes, '
+            f'which is not a multiple of {ITEM_SIZE}'
+        )
+    if target is not None and os.path.exists(target):
+        if os.path.samefile(source, target):
+            target = None
+
+    if target is None:
+        with open(source, 'r+b') as file:
+            if size:
+                with mmap.mmap(file.fileno(), size) as mapping:
+                    _convert_mapping(
+                        mapping, mapping, from_scale, to_scale, page_size
+                    )
+                    mapping.flush()
+        return size // ITEM_SIZE
+
+    with open(source, 'rb') as source_file, open(target, 'w+b') as target_file:
+        target_file.truncate(size)
+        if size:
+            with mmap.mmap(
+                source_file.fileno(), size, access=mmap.ACCESS_READ
+            ) as source_mapping, mmap.mmap(
+                target_file.fileno(), size
+            ) as target_mapping:
+                _convert_mapping(
+                    source_mapping,
+                    target_mapping,
+                    from_scale,
+                    to_scale,
+                    page_size,
+                )
+                target_mapping.flush()
+    return size // ITEM_SIZE
+
+
+def _convert_mapping(
+    source: mmap.mmap,
+    target: mmap.mmap,
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    page_size: int,
+) -> None:
+    """Converts the float64 values of `source` into `target`, page by page."""
+    if HAS_NUMPY:
+        _convert_ndarrays(
+            np.frombuffer(source, dtype='<f8'),
+            np.frombuffer(target, dtype='<f8'),
+            from_scale,
+            to_scale,
+            page_size,
+        )
+        return
+    values = memoryview(source).cast('d')
+    out = memoryview(target).cast('d')
+    try:
+        for start in range(0, len(values), page_size):
+            page = values[start : start + page_size]
+            out_page = out[start : start + page_size]
+            if sys.byteorder == 'little':
+                convert_values(page, from_scale, to_scale, out=out_page)
+            else:  # pragma: no cover - big-endian hosts
+                swapped = array('d', page)
+                swapped.byteswap()
+                converted = convert_values(swapped, from_scale, to_scale)
+                converted.byteswap()
+                out_page[:] = converted
+            page.release()
+            out_page.release()
+    finally:
+        values.release()
+        out.release()
+
+
+def _convert_ndarrays(
+    values: Any,
+    out: Any,
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    page_size: int,
+) -> None:
+    """NumPy path of `_convert_mapping`, on zero-copy views of the files."""
+    for start in range(0, len(values), page_size):
+        stop = start + page_size
+        convert_values(
+            values[start:stop], from_scale, to_scale, out=out[start:stop]
+        )
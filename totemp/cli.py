@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import sys
+from contextlib import nullcontext
+from itertools import islice
+from time import perf_counter
+from typing import IO, Any, Sequence
+
+from .batch import convert_values
+from .binary import convert_file
+from .temperature_types import AbstractTemperature, scales
+from .text import fold_symbol
+
+DEFAULT_CHUNK_SIZE = 65_536
+BUFFER_SIZE = 1 << 20
+
+
+def scale_from_name(name: str) -> type[AbstractTemperature]:
+    """
+    Returns the temperature class matching `name`.
+
+    `name` may be a class name (``'Celsius'``) or a symbol with or without
+    the degree sign and accents (``'ºC'``, ``'C'``, ``'Rø'``, ``'Ro'``), in
+    any case. If no scale matches, `ValueError` is raised.
+    """
+    folded = fold_symbol(name)
+    if folded not in _SCALE_NAMES:
+        _update_scale_names()  # a scale may have been registered since
+    try:
+        return _SCALE_NAMES[folded]
+    except KeyError:
+        raise ValueError(f'unknown temperature scale {name!r}') from None
+
+
+def convert_csv(
+    source: IO[str],
+    target: IO[str],
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    *,
+    column: str,
+    delimiter: str = ',',
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Converts one column of a CSV stream and writes the result to `target`.
+
+    The first row is the header; `column` is a header name or a zero-based
+    index. Rows are read, converted with `convert_values` and written
+    `chunk_size` at a time, so memory does not grow with the input.
+    Empty cells are kept empty.
+
+    Returns
+    -------
+    rows : int
+        Number of data rows written.
+    """
+    reader = csv.reader(source, delimiter=delimiter)
+    writer = csv.writer(target, delimiter=delimiter, lineterminator='\n')
+    header = next(reader, None)
+    if header is None:
+        return 0
+    index = _column_index(header, column)
+    writer.writerow(header)
+
+    rows_count = 0
+    while True:
+        rows = list(islice(reader, chunk_size))
+        if not rows:
+            return rows_count
+        try:
+            cells = [row[index] for row in rows]
+        except IndexError:
+            raise ValueError(
+                f'a row after line {rows_count + 1} has no column {column!r}'
+            ) from None
+        filled = [i for i, cell in enumerate(cells) if cell.strip()]
+        # Line numbers assume one line per row, as CSV files usually have.
+        values = _parse_floats(
+            [cells[i] for i in filled], filled, rows_count + 2
+        )
+        converted = convert_values(values, from_scale, to_scale)
+        for i, value in zip(filled, converted):
+            rows[i][index] = repr(value)
+        writer.writerows(rows)
+        rows_count += len(rows)
+
+
+def convert_text(
+    source: IO[str],
+    target: IO[str],
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Converts a text stream with one value per line and writes the result
+    to `target`.
+
+    Lines are converted `chunk_size` at a time; blank lines are kept.
+
+    Returns
+    -------
+    rows : int
+        Number of lines written.
+    """
+    rows_count = 0
+    while True:
+        lines = [line.strip() for line in islice(source, chunk_size)]
+        if not lines:
+            return rows_count
+        filled = [i for i, line in enumerate(lines) if line]
+        values = _parse_floats(
+            [lines[i] for i in filled], filled, rows_count + 1
+        )
+        converted = convert_values(values, from_scale, to_scale)
+        for i, value in zip(filled, converted):
+            lines[i] = repr(value)
+        target.write('\n'.join(lines))
+        target.write('\n')
+        rows_count += len(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point of ``python -m totemp``."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as error:
+        parser.exit(1, f'{parser.prog}: error: {error}\n')
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m totemp', description='ToTemp temperature converter.'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    convert = commands.add_parser(
+        'convert',
+        help='convert a column of a CSV file or a file of values',
+        description=(
+            'Stream INPUT to OUTPUT converting values from one scale to '
+            'another. Use - for stdin/stdout. Binary files of little-endian '
+            'float64 values are memory-mapped and converted in place when '
+            'OUTPUT is INPUT.'
+        ),
+    )
+    convert.add_argument('input')
+    convert.add_argument('output')
+    _add_scale_arguments(convert)
+    convert.add_argument(
+        '--column',
+        help='CSV column to convert, by header name or zero-based index',
+    )
+    convert.add_argument(
+        '--format',
+        choices=('csv', 'text', 'binary'),
+        help=(
+            'file format (default: csv for *.csv files, binary for *.f64 '
+            'and *.bin files, text otherwise)'
+        ),
+    )
+    convert.add_argument('--delimiter', default=',')
+    convert.add_argument(
+        '--chunk-size', type=_positive_int, default=DEFAULT_CHUNK_SIZE
+    )
+    convert.set_defaults(handler=_run_convert)
+    return parser
+
+
+def _add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        '--from',
+        dest='from_scale',
+        type=_scale_argument,
+        required=True,
+        help='source scale (e.g. C, F, K, Celsius)',
+    )
+    parser.add_argument(
+        '--to',
+        dest='to_scale',
+        type=_scale_argument,
+        required=True,
+        help='target scale (e.g. C, F, K, Celsius)',
+    )
+
+
+def _run_convert(args: argparse.Namespace) -> int:
+    file_format = args.format or _guess_format(args.input)
+    if file_format == 'csv' and args.column is None:
+        raise ValueError('--column is required for CSV files')
+
+    start = perf_counter()
+    if file_format == 'binary':
+        if '-' in (args.input, args.output):
+            raise ValueError(
+                'binary files cannot be read from or written to -'
+            )
+        count = convert_file(
+            args.input, args.from_scale, args.to_scale, args.output
+        )
+        _report(count, 'values', perf_counter() - start)
+        return 0
+
+    if args.input != '-' and _same_file(args.input, args.output):
+        raise ValueError(f'{file_format} files cannot be converted in place')
+    with _open(args.input, 'r') as source, _open(args.output, 'w') as target:
+        if file_format == 'csv':
+            rows = convert_csv(
+                source,
+                target,
+                args.from_scale,
+                args.to_scale,
+                column=args.column,
+                delimiter=args.delimiter,
+                chunk_size=args.chunk_size,
+            )
+        else:
+            rows = convert_text(
+                source,
+                target,
+                args.from_scale,
+                args.to_scale,
+                chunk_size=args.chunk_size,
+            )
+    _report(rows, 'rows', perf_counter() - start)
+    return 0
+
+
+def _guess_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.f64', '.bin'):
+        return 'binary'
+    return 'text'
+
+
+def _same_file(path: str, other: str) -> bool:
+    return os.path.exists(other) and os.path.samefile(path, other)
+
+
+def _report(count: int, unit: str, elapsed: float) -> None:
+    """Prints throughput and peak memory to stderr."""
+    rate = count / elapsed if elapsed > 0 else float('inf')
+    message = f'{count:,} {unit} in {elapsed:.3f} s ({rate:,.0f} {unit}/s)'
+    peak = _peak_memory()
+    if peak is not None:
+        message += f', peak memory {peak / 2**20:,.1f} MiB'
+    print(message, file=sys.stderr)
+
+
+def _peak_memory() -> int | None:
+    """Returns the peak resident memory of the process in bytes, if known."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _open(path: str, mode: str) -> Any:
+    """Opens `path` with a large buffer; ``-`` means stdin/stdout."""
+    if path == '-':
+        return nullcontext(sys.stdin if mode == 'r' else sys.stdout)
+    return open(
+        path, mode, buffering=BUFFER_SIZE, newline='', encoding='utf-8'
+    )
+
+
+def _column_index(header: list[str], column: str) -> int:
+    if column in header:
+        return header.index(column)
+    if column.isdigit() and int(column) < len(header):
+        return int(column)
+    raise ValueError(f'column {column!r} not found in {header}')
+
+
+def _parse_floats(
+    cells: list[str], indexes: list[int], first_line: int
+) -> list[float]:
+    """
+    Parses the cells of a chunk; `indexes` are their rows in the chunk,
+    whose first row is at `first_line` of the input.
+    """
+    try:
+        return list(map(float, cells))
+    except ValueError:
+        for index, cell in zip(indexes, cells):
+            try:
+                float(cell)
+            except ValueError:
+                raise ValueError(
+                    f'line {first_line + index}: '
+                    f'invalid temperature value {cell!r}'
+                ) from None
+        raise
+
+
+def _scale_argument(name: str) -> type[AbstractTemperature]:
+    try:
+        return scale_from_name(name)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from None
+
+
+def _positive_int(text: str) -> int:
+    number = int(text)
+    if number < 1:
+        raise argparse.ArgumentTypeError('must be a positive integer')
+    return number
+
+
+def _update_scale_names() -> None:
+    """Adds the names and symbols of the registered scales."""
+    for scale in scales():
+        for alias in (scale.__name__, scale._symbol):
+            _SCALE_NAMES.setdefault(fold_symbol(alias), scale)
+
+
+_SCALE_NAMES: dict[str, type[AbstractTemperature]] = {}
+_update_scale_names()
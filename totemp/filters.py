@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from abc import ABCMeta, abstractmethod
+from array import array
+from itertools import repeat
+from numbers import Real
+from typing import Any
+
+from .batch import HAS_NUMPY, _plain_values, convert_values, is_ndarray
+from .temperature_array import TemperatureArray
+from .temperature_types import AbstractTemperature, _check_scale
+
+if HAS_NUMPY:
+    import numpy as np
+
+# Below this many sensors, the per-call overhead of NumPy outweighs the
+# vectorized updates, so the state is kept in an ``array('d')``.
+MIN_VECTORIZED_SENSORS = 32
+
+
+class _SmoothingFilter(metaclass=ABCMeta):
+    """
+    Base of the streaming filters: one state slot per sensor.
+
+    Each call to `update` is one tick, with one reading per sensor. The
+    state of all the sensors is kept in compact arrays in `scale`
+    (``ndarray`` when NumPy is installed and there are at least
+    `MIN_VECTORIZED_SENSORS` sensors, ``array('d')`` otherwise), so a tick
+    is a few whole-array operations instead of one object per sensor.
+    """
+
+    __slots__ = ('_scale', '_sensors', '_ready', '_vectorized')
+
+    def __init__(self, scale: type[AbstractTemperature], sensors: int) -> None:
+        _check_scale(scale)
+        if sensors < 1:
+            raise ValueError('`sensors` must be a positive integer')
+        self._scale = scale
+        self._sensors = sensors
+        self._ready = False
+        self._vectorized = HAS_NUMPY and sensors >= MIN_VECTORIZED_SENSORS
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}({self._scale.__name__}, '
+            f'sensors={self._sensors})'
+        )
+
+    @property
+    def scale(self) -> type[AbstractTemperature]:
+        """Temperature class of the state and the outputs."""
+        return self._scale
+
+    @property
+    def sensors(self) -> int:
+        """Number of independent sensors filtered together."""
+        return self._sensors
+
+    @property
+    def output(self) -> TemperatureArray:
+        """
+        Current output of every sensor, as a batch of `scale`.
+
+        If no reading was received yet, `ValueError` is raised.
+        """
+        if not self._ready:
+            raise ValueError('the filter has not received any reading')
+        return TemperatureArray._wrap(self._scale, self._output())
+
+    def update(self, readings: Any) -> Any:
+        """
+        Feeds one tick of readings and returns the filtered outputs.
+
+        `readings` holds one reading per sensor: a `TemperatureArray` of
+        any scale (converted once), or a sequence, ``array`` or ``ndarray``
+        of temperatures or plain numbers in `scale`. A filter of a single
+        sensor also accepts one temperature or number. The first tick
+        initializes the state with the readings.
+
+        Returns
+        -------
+        self.update(readings) : TemperatureArray | AbstractTemperature
+            The outputs as a batch of `scale`, or as a temperature object
+            if a single reading was given.
+        """
+        single = isinstance(readings, (AbstractTemperature, Real))
+        values = self._values(readings)
+        if self._ready:
+            self._step(values)
+        else:
+            self._start(values)
+            self._ready = True
+        output = self._output()
+        if single:
+            return self._scale(float(output[0]))
+        return TemperatureArray._wrap(self._scale, output)
+
+    def reset(self) -> None:
+        """Forgets the state, so the next tick initializes it again."""
+        self._ready = False
+
+    def _values(self, readings: Any) -> Any:
+        """Returns `readings` as plain values in `scale`, one per sensor."""
+        scale = self._scale
+        if isinstance(readings, AbstractTemperature):
+            values: Any = [readings._value_in(scale)]
+        elif isinstance(readings, Real):
+            values = [readings]
+        elif isinstance(readings, TemperatureArray):
+            values = readings.values
+            if readings.scale is not scale:
+                if self._vectorized:  # the NumPy path of `convert_values`
+                    values = np.asarray(values)
+                values = convert_values(values, readings.scale, scale)
+        elif is_ndarray(readings) or isinstance(readings, array):
+            values = readings
+        elif isinstance(readings, (list, tuple)):
+            values = _plain_values(list(readings), scale)
+        else:
+            raise TypeError(
+                f'unsupported readings {readings.__class__.__name__!r}'
+            )
+        if len(values) != self._sensors:
+            raise ValueError(
+                f'expected {self._sensors} readings, got {len(values)}'
+            )
+        if self._vectorized:
+            return np.asarray(values, dtype=np.float64)
+        return values
+
+    @abstractmethod
+    def _start(self, values: Any) -> None:
+        """Initializes the state with the first readings."""
+
+    @abstractmethod
+    def _step(self, values: Any) -> None:
+        """Updates the state with one tick of readings."""
+
+    @abstractmethod
+    def _output(self) -> Any:
+        """Returns the current outputs, one per sensor."""
+
+
+class ExponentialMovingAverage(_SmoothingFilter):
+    """
+    Exponential moving average of each sensor.
+
+    Every tick moves the average of each sensor towards its reading by the
+    smoothing factor `alpha` (``average += alpha * (reading - average)``);
+    a larger `alpha` follows the readings more closely.
+    """
+
+    __slots__ = ('_alpha', '_average')
+
+    def __init__(
+        self,
+        scale: type[AbstractTemperature],
+        alpha: float,
+        sensors: int = 1,
+    ) -> None:
+        super().__init__(scale, sensors)
+        self._alpha = _smoothing_factor(alpha)
+        self._average = _zeros(sensors, self._vectorized)
+
+    @property
+    def alpha(self) -> float:
+        """Smoothing factor, in ``(0, 1]``."""
+        return self._alpha
+
+    def _start(self, values: Any) -> None:
+        _assign(self._average, values)
+
+    def _step(self, values: Any) -> None:
+        _blend(self._average, values, self._alpha)
+
+    def _output(self) -> Any:
+        return _copy(self._average)
+
+
+class DoubleExponentialMovingAverage(_SmoothingFilter):
+    """
+    Double exponential moving average (DEMA) of each sensor.
+
+    A second average smooths the first one, and the output
+    ``2 * first - second`` removes most of the lag of a single average
+    when the readings trend up or down.
+    """
+
+    __slots__ = ('_alpha', '_first', '_second')
+
+    def __init__(
+        self,
+        scale: type[AbstractTemperature],
+        alpha: float,
+        sensors: int = 1,
+    ) -> None:
+        super().__init__(scale, sensors)
+        self._alpha = _smoothing_factor(alpha)
+        self._first = _zeros(sensors, self._vectorized)
+        self._second = _zeros(sensors, self._vectorized)
+
+    @property
+    def alpha(self) -> float:
+        """Smoothing factor of both averages, in ``(0, 1]``."""
+        return self._alpha
+
+    def _start(self, values: Any) -> None:
+        _assign(self._first, values)
+        _assign(self._second, values)
+
+    def _step(self, values: Any) -> None:
+        _blend(self._first, values, self._alpha)
+        _blend(self._second, self._first, self._alpha)
+
+    def _output(self) -> Any:
+        first, second = self._first, self._second
+        if is_ndarray(first):
+            return 2 * first - second
+        return array('d', map(_detrend, first, second))
+
+
+class KalmanFilter(_SmoothingFilter):
+    """
+    One-dimensional Kalman filter of each sensor, for a temperature that
+    drifts as a random walk.
+
+    `process_variance` is how much the true temperature may change between
+    ticks and `measurement_variance` the noise of the readings, both in
+    squared degrees of `scale`. Each tick predicts (the estimate variance
+    grows by `process_variance`), then corrects the estimate towards the
+    reading by the Kalman gain. All the sensors share the same model and
+    receive a reading every tick, so their variance and gain are the same
+    and are kept once.
+    """
+
+    __slots__ = (
+        '_process_variance',
+        '_measurement_variance',
+        '_variance',
+        '_estimate',
+    )
+
+    def __init__(
+        self,
+        scale: type[AbstractTemperature],
+        process_variance: float,
+        measurement_variance: float,
+        sensors: int = 1,
+    ) -> None:
+        super().__init__(scale, sensors)
+        if process_variance < 0:
+            raise ValueError('`process_variance` must not be negative')
+        if measurement_variance <= 0:
+            raise ValueError('`measurement_variance` must be positive')
+        self._process_variance = process_variance
+        self._measurement_variance = measurement_variance
+        self._variance = measurement_variance
+        self._estimate = _zeros(sensors, self._vectorized)
+
+    @property
+    def variance(self) -> float:
+        """Variance of the current estimates, in squared degrees."""
+        return self._variance
+
+    @property
+    def gain(self) -> float:
+        """Kalman gain the next tick will apply."""
+        predicted = self._variance + self._process_variance
+        return predicted / (predicted + self._measurement_variance)
+
+    def reset(self) -> None:
+        super().reset()
+        self._variance = self._measurement_variance
+
+    def _start(self, values: Any) -> None:
+        _assign(self._estimate, values)
+        self._variance = self._measurement_variance
+
+    def _step(self, values: Any) -> None:
+        gain = self.gain
+        _blend(self._estimate, values, gain)
+        self._variance = (1 - gain) * (self._variance + self._process_variance)
+
+    def _output(self) -> Any:
+        return _copy(self._estimate)
+
+
+def _smoothing_factor(alpha: float) -> float:
+    if not 0 < alpha <= 1:
+        raise ValueError('`alpha` must be in (0, 1]')
+    return alpha
+
+
+def _zeros(count: int, vectorized: bool) -> Any:
+    if vectorized:
+        return np.zeros(count)
+    return array('d', bytes(8 * count))
+
+
+def _copy(states: Any) -> Any:
+    if is_ndarray(states):
+        return states.copy()
+    return array('d', states)
+
+
+def _assign(states: Any, values: Any) -> None:
+    """Overwrites `states` in place with `values`."""
+    if is_ndarray(states):
+        states[:] = values
+    else:
+        states[:] = array('d', values)
+
+
+def _blend(states: Any, values: Any, weight: float) -> None:
+    """Moves `states` towards `values` in place by `weight`."""
+    if is_ndarray(states):
+        states += weight * (values - states)
+    else:
+        states[:] = array('d', map(_towards, states, values, repeat(weight)))
+
+
+def _towards(state: float, value: float, weight: float) -> float:
+    return state + weight * (value - state)
+
+
+def _detrend(first: float, second: float) -> float:
+    return 2 * first - second
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, Iterator
+
+from .temperature_types import AbstractTemperature, FrozenTemperature
+
+# Operators counted on `AbstractTemperature` (and the `FrozenTemperature`
+# overrides of equality).
+OPERATORS = (
+    '__add__',
+    '__sub__',
+    '__mul__',
+    '__pow__',
+    '__truediv__',
+    '__floordiv__',
+    '__mod__',
+    '__divmod__',
+    '__radd__',
+    '__rsub__',
+    '__rmul__',
+    '__rpow__',
+    '__rtruediv__',
+    '__rfloordiv__',
+    '__rmod__',
+    '__rdivmod__',
+    '__iadd__',
+    '__isub__',
+    '__imul__',
+    '__ipow__',
+    '__itruediv__',
+    '__ifloordiv__',
+    '__imod__',
+    '__eq__',
+    '__ne__',
+    '__lt__',
+    '__le__',
+    '__gt__',
+    '__ge__',
+    '__abs__',
+    '__pos__',
+    '__neg__',
+    '__invert__',
+    '__round__',
+    '__floor__',
+    '__ceil__',
+    '__trunc__',
+    '__float__',
+    '__int__',
+)
+
+
+class Snapshot:
+    """
+    Copy of the instrumentation counters at a point in time.
+
+    Attributes
+    ----------
+
+    conversions : Counter
+        `convert_to` calls (including the ``to_*`` helpers) by
+        `(source, target)` pair of classes.
+
+    operators : Counter
+        Operator invocations by special method name (e.g. ``'__add__'``).
+
+    allocations : Counter
+        Temperature objects created, by class.
+
+    timings : dict[str, Counter]
+        When timing is enabled, histograms of call durations by operation
+        name (``'convert_to'`` or a special method name); each maps the
+        upper bound of a power-of-two bucket, in nanoseconds, to a count.
+    """
+
+    __slots__ = ('conversions', 'operators', 'allocations', 'timings')
+
+    def __init__(self) -> None:
+        self.conversions: Counter = Counter()
+        self.operators: Counter = Counter()
+        self.allocations: Counter = Counter()
+        self.timings: dict[str, Counter] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'conversions={sum(self.conversions.values())}, '
+            f'operators={sum(self.operators.values())}, '
+            f'allocations={sum(self.allocations.values())})'
+        )
+
+    def copy(self) -> Snapshot:
+        """Returns an independent copy of self."""
+        copy = Snapshot()
+        copy.conversions.update(self.conversions)
+        copy.operators.update(self.operators)
+        copy.allocations.update(self.allocations)
+        copy.timings = {
+            name: Counter(histogram)
+            for name, histogram in self.timings.items()
+        }
+        return copy
+
+    def __sub__(self, other: Snapshot) -> Snapshot:
+        """Returns the counts recorded since the `other` snapshot."""
+        delta = Snapshot()
+        delta.conversions = self.conversions - other.conversions
+        delta.operators = self.operators - other.operators
+        delta.allocations = self.allocations - other.allocations
+        for name, histogram in self.timings.items():
+            difference = histogram - other.timings.get(name, Counter())
+            if difference:
+                delta.timings[name] = difference
+        return delta
+
+
+def enable(*, timing: bool = False) -> None:
+    """
+    Starts counting conversions, operators and allocations.
+
+    The instrumented methods are swapped in on the temperature classes only
+    while instrumentation is enabled, so disabled instrumentation costs
+    nothing. With `timing`, call durations are also recorded in
+    power-of-two histograms (at the price of two clock reads per call).
+    """
+    global _timing
+    if _patched:
+        if timing == _timing:
+            return
+        disable()
+    _timing = timing
+    targets: list[tuple[type, str, Callable[..., Any]]] = [
+        (AbstractTemperature, '__init__', _count_allocation),
+        (AbstractTemperature, 'convert_to', _count_conversion),
+    ]
+    targets += [
+        (AbstractTemperature, name, _count_operator) for name in OPERATORS
+    ]
+    targets += [
+        (FrozenTemperature, name, _count_operator)
+        for name in ('__eq__', '__ne__')
+    ]
+    for owner, name, instrument in targets:
+        original = owner.__dict__[name]
+        setattr(owner, name, instrument(name, original, timing))
+        _patched.append((owner, name, original))
+
+
+def disable() -> None:
+    """Stops counting and restores the original methods; counts are kept."""
+    while _patched:
+        owner, name, original = _patched.pop()
+        setattr(owner, name, original)
+
+
+def is_enabled() -> bool:
+    """Returns whether instrumentation is currently enabled."""
+    return bool(_patched)
+
+
+def snapshot() -> Snapshot:
+    """Returns a copy of the counters recorded so far."""
+    return _counters.copy()
+
+
+def reset() -> None:
+    """Clears every counter."""
+    global _counters
+    _counters = Snapshot()
+
+
+@contextmanager
+def profile(*, timing: bool = False) -> Iterator[Snapshot]:
+    """
+    Enables instrumentation for the duration of a ``with`` block.
+
+    The yielded `Snapshot` is filled when the block exits, with the counts
+    recorded inside it only; the previous state (enabled or not) is then
+    restored. Blocks may be nested.
+
+    Returns
+    -------
+    profile() : ContextManager[Snapshot]
+    """
+    was_enabled, was_timing = is_enabled(), _timing
+    enable(timing=timing or (was_enabled and was_timing))
+    start = snapshot()
+    result = Snapshot()
+    try:
+        yield result
+    finally:
+        delta = snapshot() - start
+        result.conversions = delta.conversions
+        result.operators = delta.operators
+        result.allocations = delta.allocations
+        result.timings = delta.timings
+        if not was_enabled:
+            disable()
+        elif was_timing != _timing:
+            enable(timing=was_timing)
+
+
+def _count_allocation(
+    name: str, function: Callable[..., Any], timing: bool
+) -> Callable[..., Any]:
+    @wraps(function)
+    def __init__(self: Any, value: float) -> None:
+        _counters.allocations[type(self)] += 1
+        function(self, value)
+
+    return __init__
+
+
+def _count_conversion(
+    name: str, function: Callable[..., Any], timing: bool
+) -> Callable[..., Any]:
+    if not timing:
+
+        @wraps(function)
+        def convert_to(self: Any, temp_cls: type) -> Any:
+            _counters.conversions[type(self), temp_cls] += 1
+            return function(self, temp_cls)
+
+        return convert_to
+
+    @wraps(function)
+    def timed_convert_to(self: Any, temp_cls: type) -> Any:
+        _counters.conversions[type(self), temp_cls] += 1
+        start = perf_counter_ns()
+        try:
+            return function(self, temp_cls)
+        finally:
+            _record(name, perf_counter_ns() - start)
+
+    return timed_convert_to
+
+
+def _count_operator(
+    name: str, function: Callable[..., Any], timing: bool
+) -> Callable[..., Any]:
+    if not timing:
+
+        @wraps(function)
+        def operator(*args: Any) -> Any:
+            _counters.operators[name] += 1
+            return function(*args)
+
+        return operator
+
+    @wraps(function)
+    def timed_operator(*args: Any) -> Any:
+        _counters.operators[name] += 1
+        start = perf_counter_ns()
+        try:
+            return function(*args)
+        finally:
+            _record(name, perf_counter_ns() - start)
+
+    return timed_operator
+
+
+def _record(name: str, elapsed: int) -> None:
+    """Adds a duration in nanoseconds to the histogram of `name`."""
+    histogram = _counters.timings.get(name)
+    if histogram is None:
+        histogram = _counters.timings[name] = Counter()
+    histogram[1 << elapsed.bit_length()] += 1
+
+
+_counters = Snapshot()
+_timing = False
+_patched: list[tuple[type, str, Any]] = []
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Any
+
+
+class BooleanMask(bytearray):
+    """
+    Compact result of a batch comparison: one byte (0 or 1) per value.
+
+    Masks are returned by the comparison operators of `TemperatureArray`
+    and select values with `TemperatureArray.filter`. Counting and the
+    ``&``, ``|``, ``^`` and ``~`` combinations run over the whole buffer at
+    once instead of one Python call per value.
+
+    Methods
+    -------
+
+    count(value=1)
+        returns the number of selected values (or of entries equal to
+        `value`).
+
+    any()
+        returns whether any value is selected.
+
+    all()
+        returns whether every value is selected.
+
+    Like a NumPy boolean array, a mask with more than one value has no
+    truth value: use `any` or `all` instead of ``if mask``.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({list(map(bool, self))})'
+
+    __str__ = __repr__
+
+    def count(self, value: Any = 1, *args: Any) -> int:  # type: ignore
+        """
+        Returns the number of selected values.
+
+        Returns
+        -------
+        self.count() : int
+            self.count(1)
+        """
+        return bytearray.count(self, value, *args)
+
+    def __bool__(self) -> bool:
+        """
+        Returns the truth value of a mask with a single value.
+
+        Raises
+        ------
+        ValueError
+            if the mask is empty or has more than one value.
+        """
+        if len(self) != 1:
+            raise ValueError(
+                f'the truth value of a mask with {len(self)} values is '
+                'ambiguous, use mask.any() or mask.all()'
+            )
+        return self[0] == 1
+
+    def any(self) -> bool:
+        """
+        Returns whether any value is selected.
+
+        Returns
+        -------
+        self.any() : bool
+            1 in self
+        """
+        return 1 in self
+
+    def all(self) -> bool:
+        """
+        Returns whether every value is selected (``True`` for an empty
+        mask, as the builtin `all`).
+
+        Returns
+        -------
+        self.all() : bool
+            0 not in self
+        """
+        return 0 not in self
+
+    def __and__(self, other: Any) -> BooleanMask:
+        """
+        Returns a new mask selecting the values selected by both masks.
+
+        Returns
+        -------
+        self.__and__(other) : BooleanMask
+        """
+        return self._combine(other, int.__and__)
+
+    def __or__(self, other: Any) -> BooleanMask:
+        """
+        Returns a new mask selecting the values selected by either mask.
+
+        Returns
+        -------
+        self.__or__(other) : BooleanMask
+        """
+        return self._combine(other, int.__or__)
+
+    def __xor__(self, other: Any) -> BooleanMask:
+        """
+        Returns a new mask selecting the values selected by only one mask.
+
+        Returns
+        -------
+        self.__xor__(other) : BooleanMask
+        """
+        return self._combine(other, int.__xor__)
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __invert__(self) -> BooleanMask:
+        """
+        Returns a new mask selecting the values not selected by self.
+
+        Returns
+        -------
+        self.__invert__() : BooleanMask
+        """
+        return BooleanMask(self.translate(_INVERT))
+
+    def _combine(self, other: Any, function: Any) -> Any:
+        """
+        Combines both masks as two big integers (one byte per value), so
+        the operation runs in C over the whole buffer.
+        """
+        if not isinstance(other, (bytes, bytearray)):
+            return NotImplemented
+        if len(other) != len(self):
+            raise ValueError(f'masks have {len(self)} and {len(other)} values')
+        result = function(
+            int.from_bytes(self, 'little'), int.from_bytes(other, 'little')
+        )
+        return BooleanMask(result.to_bytes(len(self), 'little'))
+
+
+_INVERT = bytes.maketrans(b'\x00\x01', b'\x01\x00')
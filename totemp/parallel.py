@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterable
+
+from .batch import HAS_NUMPY, convert_values, is_ndarray
+from .temperature_types import AbstractTemperature, _check_scale
+
+if HAS_NUMPY:
+    import numpy as np
+
+ITEM_SIZE = 8
+
+
+def convert_parallel(
+    values: Iterable[float],
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    *,
+    workers: int | None = None,
+) -> Any:
+    """
+    Converts raw values of `from_scale` to `to_scale` on several processes.
+
+    The values are copied once into a `multiprocessing.shared_memory`
+    block, which is split into one contiguous slice per worker; each worker
+    process attaches to the block and converts its slice in place with
+    `convert_values`, so the data itself is never pickled. Results are
+    identical to the serial `convert_values`. `workers` defaults to the
+    number of CPUs; with a single worker the conversion runs serially in
+    the calling process.
+    If no conversion is possible, `TypeError` is raised.
+
+    Returns
+    -------
+    convert_parallel(values, from_scale, to_scale) : ndarray | array
+        ``ndarray`` for ``ndarray`` inputs, ``array('d')`` otherwise.
+    """
+    _check_scale(from_scale, to_scale, 'from_scale')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError('`workers` must be a positive integer')
+    as_ndarray = is_ndarray(values)
+    data: Any = (
+        np.ascontiguousarray(values, dtype=np.float64)
+        if as_ndarray
+        else array('d', values)
+    )
+    count = len(data)
+    workers = min(workers, count)
+    if workers <= 1:
+        return convert_values(data, from_scale, to_scale)
+
+    block = SharedMemory(create=True, size=count * ITEM_SIZE)
+    try:
+        shared = memoryview(block.buf).cast('d')
+        try:
+            shared[:count] = memoryview(data)
+            bounds = [
+                (count * worker // workers, count * (worker + 1) // workers)
+                for worker in range(workers)
+            ]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _convert_block,
+                        block.name,
+                        start,
+                        stop,
+                        from_scale,
+                        to_scale,
+                    )
+                    for start, stop in bounds
+                ]
+                for future in futures:
+                    future.result()
+            if as_ndarray:
+                return np.array(shared[:count], dtype=np.float64)
+            return array('d', shared[:count])
+        finally:
+            shared.release()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _convert_block(
+    name: str,
+    start: int,
+    stop: int,
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+) -> None:
+    """Worker: converts `[start, stop)` of the shared block `name` in place."""
+    block = SharedMemory(name=name)
+    try:
+        if HAS_NUMPY:
+            values = np.ndarray(
+                stop - start,
+                dtype=np.float64,
+                buffer=block.buf,
+                offset=start * ITEM_SIZE,
+            )
+            convert_values(values, from_scale, to_scale, out=values)
+            del values
+        else:
+            shared = memoryview(block.buf).cast('d')
+            view = shared[start:stop]
+            try:
+                convert_values(view, from_scale, to_scale, out=view)
+            finally:
+                view.release()
+                shared.release()
+    finally:
+        block.close()
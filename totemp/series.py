@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import chain, repeat
+from math import isfinite
+from operator import ge, gt, le
+from typing import Any, Callable, Iterable, Iterator, overload
+
+from .batch import _plain_values, convert_values
+from .temperature_array import TemperatureArray
+from .temperature_types import AbstractTemperature, _check_scale
+
+
+class TemperatureSeries:
+    """
+    Timestamped temperatures of a single scale, in time order.
+
+    Timestamps (seconds as floats, e.g. from `time.time`) and values are
+    kept in two parallel ``array('d')`` buffers instead of one tuple and
+    one temperature object per reading. Appending grows the buffers in
+    place, time ranges are found by bisecting the timestamps, and rolling
+    aggregates are computed in a single pass over the buffers.
+
+    Attributes
+    ----------
+
+    _scale : type[AbstractTemperature]
+        Temperature class every value in the series belongs to.
+
+    _timestamps : array
+        ``array('d')`` with the timestamps, in non-decreasing order.
+
+    _values : array
+        ``array('d')`` with the raw temperature values.
+
+    Methods
+    -------
+
+    from_pairs(pairs, scale=None)
+        returns a new series built from `(timestamp, temperature)` pairs.
+
+    append(timestamp, value), extend(timestamps, values)
+        adds readings at the end of the series.
+
+    between(start, end)
+        returns the readings with `start <= timestamp < end`.
+
+    convert_to(temp_cls)
+        returns a new series of `temp_cls`.
+
+    rolling_mean(size=None, duration=None), rolling_min(...), rolling_max(...)
+        returns a new series with an aggregate of the window ending at
+        each reading.
+    """
+
+    __slots__ = ('_scale', '_timestamps', '_values')
+
+    def __init__(
+        self,
+        scale: type[AbstractTemperature],
+        timestamps: Iterable[float] = (),
+        values: Iterable[Any] = (),
+    ) -> None:
+        _check_scale(scale)
+        self._scale = scale
+        self._timestamps = array('d')
+        self._values = array('d')
+        self.extend(timestamps, values)
+
+    @classmethod
+    def _wrap(
+        cls,
+        scale: type[AbstractTemperature],
+        timestamps: array,
+        values: array,
+    ) -> TemperatureSeries:
+        """Returns a new series that takes ownership of the buffers as is."""
+        series = cls.__new__(cls)
+        series._scale = scale
+        series._timestamps = timestamps
+        series._values = values
+        return series
+
+    @classmethod
+    def from_pairs(
+        cls,
+        pairs: Iterable[tuple[float, AbstractTemperature]],
+        scale: type[AbstractTemperature] | None = None,
+    ) -> TemperatureSeries:
+        """
+        Returns a new series built from `(timestamp, temperature)` pairs.
+
+        Each temperature is converted to `scale` (the class of the first
+        temperature by default) before its value is stored.
+
+        Returns
+        -------
+        TemperatureSeries.from_pairs(pairs, scale) : TemperatureSeries
+        """
+        pairs = iter(pairs)
+        if scale is None:
+            try:
+                timestamp, first = next(pairs)
+            except StopIteration:
+                raise ValueError(
+                    '`scale` is required when `pairs` is empty'
+                ) from None
+            scale = first.__class__
+            series = cls(scale, (timestamp,), (first.value,))
+        else:
+            series = cls(scale)
+        for timestamp, temp in pairs:
+            series.append(timestamp, temp)
+        return series
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[tuple[float, AbstractTemperature]]:
+        scale = self._scale
+        return (
+            (timestamp, scale(value))
+            for timestamp, value in zip(self._timestamps, self._values)
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[float, AbstractTemperature]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> TemperatureSeries:
+        ...
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Returns a `(timestamp, temperature)` pair for an integer index or a
+        new series of the same scale for a slice.
+        """
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError('series slices must be contiguous')
+            return self._wrap(
+                self._scale, self._timestamps[index], self._values[index]
+            )
+        return self._timestamps[index], self._scale(self._values[index])
+
+    def __repr__(self) -> str:
+        """
+        Returns the “official” string representation of self.
+
+        Returns
+        -------
+        self.__repr__() : str
+            f'{self.__class__.__name__}({scale name}, {timestamps}, {values})'
+        """
+        return (
+            f'{self.__class__.__name__}({self._scale.__name__}, '
+            f'{self._timestamps.tolist()}, {self._values.tolist()})'
+        )
+
+    @property
+    def scale(self) -> type[AbstractTemperature]:
+        """Returns the temperature class of the series (read-only)."""
+        return self._scale
+
+    @property
+    def timestamps(self) -> array:
+        """Returns the underlying ``array('d')`` of timestamps."""
+        return self._timestamps
+
+    @property
+    def values(self) -> array:
+        """Returns the underlying ``array('d')`` of raw values."""
+        return self._values
+
+    def append(self, timestamp: float, value: Any) -> None:
+        """
+        Adds one reading at the end of the series.
+
+        `value` may be a temperature of any scale (converted to the scale
+        of the series) or a plain number. `timestamp` must not be earlier
+        than the last one, otherwise `ValueError` is raised.
+        """
+        timestamps = self._timestamps
+        if timestamps and timestamp < timestamps[-1]:
+            raise ValueError(
+                f'timestamp {timestamp} is earlier than {timestamps[-1]}'
+            )
+        if isinstance(value, AbstractTemperature):
+            value = value._value_in(self._scale)
+        self._values.append(value)
+        timestamps.append(timestamp)
+
+    def extend(
+        self, timestamps: Iterable[float], values: Iterable[Any]
+    ) -> None:
+        """
+        Adds many readings at the end of the series, growing the buffers in
+        place.
+
+        `values` may be a `TemperatureArray` (converted in one pass),
+        temperatures of any scale or plain numbers. If the lengths differ or
+        the timestamps are out of order, `ValueError` is raised and the
+        series is left unchanged.
+        """
+        new_timestamps = array('d', timestamps)
+        if isinstance(values, TemperatureArray):
+            new_values = convert_values(
+                values.values, values.scale, self._scale
+            )
+        else:
+            new_values = array(
+                'd',
+                _plain_values(
+                    values if isinstance(values, list) else list(values),
+                    self._scale,
+                ),
+            )
+        if len(new_timestamps) != len(new_values):
+            raise ValueError(
+                f'{len(new_timestamps)} timestamps for '
+                f'{len(new_values)} values'
+            )
+        if not new_timestamps:
+            return
+        previous = self._timestamps[-1:] + new_timestamps
+        if any(map(gt, previous, previous[1:])):
+            raise ValueError('timestamps must be in non-decreasing order')
+        self._timestamps.extend(new_timestamps)
+        self._values.extend(new_values)
+
+    def between(self, start: float, end: float) -> TemperatureSeries:
+        """
+        Returns a new series with the readings whose timestamps are in
+        `[start, end)`, found by bisecting the timestamps.
+
+        Returns
+        -------
+        self.between(start, end) : TemperatureSeries
+        """
+        timestamps = self._timestamps
+        return self[
+            bisect_left(timestamps, start) : bisect_left(timestamps, end)
+        ]
+
+    def to_array(self) -> TemperatureArray:
+        """
+        Returns the values (without the timestamps) as a new batch.
+
+        Returns
+        -------
+        self.to_array() : TemperatureArray
+        """
+        return TemperatureArray._wrap(self._scale, array('d', self._values))
+
+    def convert_to(
+        self, temp_cls: type[AbstractTemperature]
+    ) -> TemperatureSeries:
+        """
+        Returns a new series of `temp_cls`, with the values converted in one
+        pass with `convert_values` and the same timestamps.
+        If no conversion is possible, `TypeError` is raised.
+
+        Returns
+        -------
+        self.convert_to(temp_cls) : TemperatureSeries
+        """
+        return self._wrap(
+            temp_cls,
+            array('d', self._timestamps),
+            convert_values(self._values, self._scale, temp_cls),
+        )
+
+    def rolling_mean(
+        self, size: int | None = None, *, duration: float | None = None
+    ) -> TemperatureSeries:
+        """
+        Returns a new series with the mean of the window ending at each
+        reading.
+
+        The window holds the last `size` readings or, with `duration`, the
+        readings with timestamps in `(timestamp - duration, timestamp]`;
+        the first windows are partial. The sum is updated incrementally as
+        readings enter and leave the window, so the whole series is
+        aggregated in one pass; it is compensated (Neumaier) so a large
+        reading leaving the window does not absorb the smaller ones, and
+        infinite or NaN readings only affect the windows that hold them.
+
+        Returns
+        -------
+        self.rolling_mean(size) : TemperatureSeries
+        """
+        self._check_window(size, duration)
+        values = self._values
+        finite = all(map(isfinite, values))
+        if not finite:
+            values = array('d', [v if isfinite(v) else 0.0 for v in values])
+        if size is not None:
+            means = _count_window_means(values, size)
+        else:
+            means = _time_window_means(
+                self._timestamps, values, duration  # type: ignore
+            )
+        if not finite:
+            starts = self._window_starts(size, duration)
+            _restore_non_finite(means, self._values, starts)
+        return self._wrap(self._scale, array('d', self._timestamps), means)
+
+    def rolling_min(
+        self, size: int | None = None, *, duration: float | None = None
+    ) -> TemperatureSeries:
+        """
+        Returns a new series with the lowest value of the window ending at
+        each reading (see `rolling_mean` for the windows), using a monotonic
+        deque so each reading is pushed and popped once.
+
+        Returns
+        -------
+        self.rolling_min(size) : TemperatureSeries
+        """
+        return self._rolling_extreme(size, duration, ge)
+
+    def rolling_max(
+        self, size: int | None = None, *, duration: float | None = None
+    ) -> TemperatureSeries:
+        """
+        Returns a new series with the highest value of the window ending at
+        each reading (see `rolling_min`).
+
+        Returns
+        -------
+        self.rolling_max(size) : TemperatureSeries
+        """
+        return self._rolling_extreme(size, duration, le)
+
+    def _rolling_extreme(
+        self,
+        size: int | None,
+        duration: float | None,
+        dominated: Callable[[float, float], bool],
+    ) -> TemperatureSeries:
+        """
+        Rolling min or max: the deque holds the indexes of the readings that
+        may still become the extreme of a window, with their values in
+        monotonic order, so its head is the extreme of the current window.
+        """
+        values = self._values
+        extremes = array('d')
+        append = extremes.append
+        candidates: deque[int] = deque()
+        for index, start in enumerate(self._window_starts(size, duration)):
+            value = values[index]
+            while candidates and dominated(values[candidates[-1]], value):
+                candidates.pop()
+            candidates.append(index)
+            while candidates[0] < start:
+                candidates.popleft()
+            append(values[candidates[0]])
+        return self._wrap(self._scale, array('d', self._timestamps), extremes)
+
+    def _window_starts(
+        self, size: int | None, duration: float | None
+    ) -> Iterator[int]:
+        """Yields the index of the first reading of each window."""
+        self._check_window(size, duration)
+        if size is not None:
+            count = len(self._values)
+            return chain(
+                repeat(0, min(size, count)), range(1, count - size + 1)
+            )
+        return _time_window_starts(self._timestamps, duration)  # type: ignore
+
+    @staticmethod
+    def _check_window(size: int | None, duration: float | None) -> None:
+        if (size is None) == (duration is None):
+            raise TypeError('exactly one of `size` and `duration` is required')
+        if size is not None and size < 1:
+            raise ValueError('`size` must be a positive integer')
+        if duration is not None and duration <= 0:
+            raise ValueError('`duration` must be positive')
+
+
+def _time_window_starts(timestamps: array, duration: float) -> Iterator[int]:
+    """Two pointers: the start only moves forward as time advances."""
+    start = 0
+    for timestamp in timestamps:
+        limit = timestamp - duration
+        while timestamps[start] <= limit:
+            start += 1
+        yield start
+
+
+def _count_window_means(values: array, size: int) -> array:
+    """
+    Rolling means of count windows: each reading enters the sum and leaves
+    it `size` steps later. The sum is compensated as in Neumaier's
+    algorithm, with the rounding error of each addition found by TwoSum
+    (no branch), so a large reading leaving the window does not take the
+    smaller ones with it.
+    """
+    means = array('d')
+    append = means.append
+    total = compensation = 0.0
+    for value, old, count in zip(
+        values,
+        chain(repeat(0.0, size), values),
+        chain(range(1, size), repeat(size)),
+    ):
+        new_total = total + value
+        part = new_total - total
+        compensation += (total - (new_total - part)) + (value - part)
+        total = new_total - old
+        part = total - new_total
+        compensation += (new_total - (total - part)) - (old + part)
+        append((total + compensation) / count)
+    return means
+
+
+def _time_window_means(
+    timestamps: array, values: array, duration: float
+) -> array:
+    """
+    Rolling means of time windows, compensated as `_count_window_means`:
+    a second iterator over the readings yields the ones leaving the
+    window, so the loop does no indexing.
+    """
+    means = array('d')
+    append = means.append
+    total = compensation = 0.0
+    count = 0
+    leaving = zip(timestamps, values)
+    first_timestamp, first_value = next(leaving, (0.0, 0.0))
+    for timestamp, value in zip(timestamps, values):
+        new_total = total + value
+        part = new_total - total
+        compensation += (total - (new_total - part)) + (value - part)
+        total = new_total
+        count += 1
+        limit = timestamp - duration
+        while first_timestamp <= limit:
+            new_total = total - first_value
+            part = new_total - total
+            compensation += (total - (new_total - part)) - (first_value + part)
+            total = new_total
+            count -= 1
+            first_timestamp, first_value = next(leaving)
+        append((total + compensation) / count)
+    return means
+
+
+def _restore_non_finite(
+    means: array, values: array, starts: Iterator[int]
+) -> None:
+    """
+    Sets the mean of each window holding infinite or NaN readings (summed
+    as zeros by the compensated loops, since they cannot be subtracted
+    back out) to the plain sum of those readings: inf, -inf or nan.
+    """
+    indexes = [
+        index for index, value in enumerate(values) if not isfinite(value)
+    ]
+    for index, start in enumerate(starts):
+        low = bisect_left(indexes, start)
+        high = bisect_right(indexes, index, low)
+        if low < high:
+            means[index] = sum(values[i] for i in indexes[low:high])
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import math
+from array import array
+from itertools import islice, repeat
+from operator import mul, sub
+from typing import Any, Iterable
+
+from .batch import HAS_NUMPY, _plain_values, convert_values, is_ndarray
+from .stream import DEFAULT_CHUNK_SIZE
+from .temperature_array import TemperatureArray
+from .temperature_types import AbstractTemperature, _check_scale, converter
+
+if HAS_NUMPY:
+    import numpy as np
+
+
+class RunningStats:
+    """
+    One-pass statistics of a stream of temperatures, in constant memory.
+
+    Values of any scale are expressed in `scale` as they arrive, and only
+    the count, a compensated (Neumaier) sum, the sum of squared deviations
+    (updated with Welford's method, or Chan's formula for whole batches)
+    and the extremes are kept, so streams of any length are summarized
+    without buffering them. Accumulators filled by parallel workers are
+    combined with `merge`.
+
+    Attributes
+    ----------
+
+    _scale : type[AbstractTemperature]
+        Temperature class in which the state is kept and the results are
+        reported.
+
+    _count : int
+        Number of values seen.
+
+    _total, _compensation : float
+        Sum of the values and the running error of that sum.
+
+    _m2 : float
+        Sum of the squared deviations from the mean.
+
+    _min, _max : float
+        Extremes of the values seen.
+
+    Methods
+    -------
+
+    add(value)
+        adds one temperature (or a plain number in `scale`).
+
+    update(values)
+        adds many values, batch by batch.
+
+    merge(other)
+        adds the values summarized by another accumulator.
+    """
+
+    __slots__ = (
+        '_scale',
+        '_count',
+        '_total',
+        '_compensation',
+        '_m2',
+        '_min',
+        '_max',
+    )
+
+    def __init__(
+        self, scale: type[AbstractTemperature], values: Iterable[Any] = ()
+    ) -> None:
+        _check_scale(scale)
+        self._scale = scale
+        self._count = 0
+        self._total = 0.0
+        self._compensation = 0.0
+        self._m2 = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self.update(values)
+
+    def __repr__(self) -> str:
+        if not self._count:
+            return (
+                f'{self.__class__.__name__}({self._scale.__name__}, count=0)'
+            )
+        return (
+            f'{self.__class__.__name__}({self._scale.__name__}, '
+            f'count={self._count}, mean={self._mean()}, '
+            f'min={self._min}, max={self._max})'
+        )
+
+    @property
+    def scale(self) -> type[AbstractTemperature]:
+        """Temperature class of the results."""
+        return self._scale
+
+    @property
+    def count(self) -> int:
+        """Number of values seen."""
+        return self._count
+
+    @property
+    def mean(self) -> AbstractTemperature:
+        """Arithmetic mean of the values."""
+        self._require(1, 'mean')
+        return self._scale(self._mean())
+
+    @property
+    def min(self) -> AbstractTemperature:
+        """Lowest value."""
+        self._require(1, 'min')
+        return self._scale(self._min)
+
+    @property
+    def max(self) -> AbstractTemperature:
+        """Highest value."""
+        self._require(1, 'max')
+        return self._scale(self._max)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the values, in squared degrees of `scale`."""
+        self._require(2, 'variance')
+        return self._m2 / (self._count - 1)
+
+    @property
+    def pvariance(self) -> float:
+        """Population variance of the values, in squared degrees."""
+        self._require(1, 'pvariance')
+        return self._m2 / self._count
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation of the values, in degrees."""
+        return math.sqrt(self.variance)
+
+    @property
+    def pstdev(self) -> float:
+        """Population standard deviation of the values, in degrees."""
+        return math.sqrt(self.pvariance)
+
+    def add(self, value: Any) -> None:
+        """
+        Adds one value: a temperature of any scale or a plain number in
+        `scale`.
+        """
+        if isinstance(value, AbstractTemperature):
+            value = value._value_in(self._scale)
+        if not self._count:
+            self._combine(1, value, 0.0, value, value)
+            return
+        # Welford: the deviations from the old and the new mean.
+        delta = value - self._mean()
+        self._count += 1
+        self._add_to_total(value)
+        self._m2 += delta * (value - self._mean())
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def update(self, values: Iterable[Any]) -> None:
+        """
+        Adds many values, one batch at a time.
+
+        `values` may be a `TemperatureArray` of any scale, an ``array`` or
+        ``ndarray`` of values in `scale`, or any (possibly unbounded)
+        iterable of temperatures and plain numbers, which is read in chunks
+        of `DEFAULT_CHUNK_SIZE` items. Each batch is converted to `scale` at
+        once and summarized, then merged into the accumulator, so memory
+        stays bounded by one chunk.
+        """
+        scale = self._scale
+        if isinstance(values, TemperatureArray):
+            if values.scale is scale:
+                self._update_batch(values.values)
+            else:
+                self._update_batch(
+                    convert_values(values.values, values.scale, scale)
+                )
+            return
+        if is_ndarray(values) or isinstance(values, array):
+            self._update_batch(values)
+            return
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, DEFAULT_CHUNK_SIZE))
+            if not chunk:
+                return
+            self._update_batch(_plain_values(chunk, scale))
+
+    def merge(self, other: RunningStats) -> None:
+        """
+        Adds the values summarized by `other`, which may keep its state in
+        another scale; the result is the same as if every value had been
+        added to this accumulator.
+        """
+        if not isinstance(other, RunningStats):
+            raise TypeError(
+                f'cannot merge {other.__class__.__name__} into RunningStats'
+            )
+        if not other._count:
+            return
+        if other._scale is self._scale:
+            self._combine(
+                other._count,
+                other._total + other._compensation,
+                other._m2,
+                other._min,
+                other._max,
+            )
+            return
+        function = converter(other._scale, self._scale)
+        _, numerator, denominator, _ = other._scale._coefficients(self._scale)
+        factor = numerator / denominator
+        low, high = function(other._min), function(other._max)
+        if factor < 0:
+            low, high = high, low
+        self._combine(
+            other._count,
+            other._count * function(other._mean()),
+            other._m2 * factor * factor,
+            low,
+            high,
+        )
+
+    def _update_batch(self, values: Any) -> None:
+        """
+        Summarizes a batch of plain values in `scale` and merges it.
+
+        The sum of the deviations from the batch mean (zero in exact
+        arithmetic) corrects the squared deviations (corrected two-pass
+        algorithm) and, on the NumPy path, whose pairwise sum is not exact
+        as `math.fsum` is, the sum itself.
+        """
+        count = len(values)
+        if not count:
+            return
+        if HAS_NUMPY:
+            values = np.asarray(values, dtype=np.float64)
+            total = float(values.sum())
+            deviations = values - total / count
+            error = float(deviations.sum())
+            total += error
+            m2 = float(deviations @ deviations)
+            low, high = float(values.min()), float(values.max())
+        else:
+            total = math.fsum(values)
+            deviations = list(map(sub, values, repeat(total / count)))
+            error = math.fsum(deviations)
+            m2 = math.fsum(map(mul, deviations, deviations))
+            low, high = min(values), max(values)
+        self._combine(
+            count, total, max(m2 - error * error / count, 0.0), low, high
+        )
+
+    def _combine(
+        self, count: int, total: float, m2: float, low: float, high: float
+    ) -> None:
+        """Merges the summary of other values with Chan's formula."""
+        previous = self._count
+        if previous:
+            delta = total / count - self._mean()
+            m2 += delta * delta * previous * count / (previous + count)
+        self._count = previous + count
+        self._add_to_total(total)
+        self._m2 += m2
+        if low < self._min:
+            self._min = low
+        if high > self._max:
+            self._max = high
+
+    def _add_to_total(self, value: float) -> None:
+        """Neumaier compensated summation."""
+        total = self._total + value
+        if abs(self._total) >= abs(value):
+            self._compensation += (self._total - total) + value
+        else:
+            self._compensation += (value - total) + self._total
+        self._total = total
+
+    def _mean(self) -> float:
+        return (self._total + self._compensation) / self._count
+
+    def _require(self, count: int, name: str) -> None:
+        if self._count < count:
+            raise ValueError(
+                f'{name} requires at least {count} value'
+                f'{"s" if count > 1 else ""}'
+            )
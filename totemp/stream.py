@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from .batch import _plain_values, convert_values
+from .temperature_types import AbstractTemperature, _check_scale
+
+DEFAULT_CHUNK_SIZE = 65_536
+
+
+def convert_chunks(
+    iterable: Iterable[Any],
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Lazily converts `iterable` and yields the results chunk by chunk.
+
+    Up to `chunk_size` items are read at a time and converted from
+    `from_scale` to `to_scale` with `convert_values`, so memory stays
+    bounded by one chunk however long (or unbounded) the input is.
+    Items may be plain numbers in `from_scale` or temperature objects of
+    any scale, which are first expressed in `from_scale`.
+    If no conversion is possible, `TypeError` is raised.
+
+    Yields
+    ------
+    chunk : array
+        ``array('d')`` with the converted values of up to `chunk_size` items.
+    """
+    if chunk_size < 1:
+        raise ValueError('`chunk_size` must be a positive integer')
+    _check_scale(from_scale, to_scale, 'from_scale')
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield convert_values(
+            _plain_values(chunk, from_scale), from_scale, to_scale
+        )
+
+
+def convert(
+    iterable: Iterable[Any],
+    from_scale: type[AbstractTemperature],
+    to_scale: type[AbstractTemperature],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[float]:
+    """
+    Lazily converts `iterable` and yields the converted values one by one.
+
+    Conversion happens in chunks of `chunk_size` items (see
+    `convert_chunks`), so throughput follows the batch path while memory
+    stays bounded by one chunk.
+
+    Yields
+    ------
+    value : float
+        Each item of `iterable` converted to `to_scale`.
+    """
+    for chunk in convert_chunks(
+        iterable, from_scale, to_scale, chunk_size=chunk_size
+    ):
+        yield from chunk
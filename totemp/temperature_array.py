@@ -0,0 +1,730 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from array import array
+from itertools import compress, repeat
+from numbers import Real
+from operator import (
+    add,
+    eq,
+    floordiv,
+    ge,
+    gt,
+    le,
+    lt,
+    mod,
+    mul,
+    ne,
+    sub,
+    truediv,
+)
+from typing import Any, Callable, Iterable, Iterator, Sequence, overload
+
+from .batch import HAS_NUMPY, _plain_values, convert_values, is_ndarray
+from .mask import BooleanMask
+from .temperature_types import (
+    AbstractTemperature,
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    FrozenTemperature,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+    _check_scale,
+    _TemperatureBatch,
+)
+
+if HAS_NUMPY:
+    import numpy as np
+
+_ITER_CHUNK_SIZE = 4096
+
+
+class TemperatureArray(_TemperatureBatch):
+    """
+    Batch of temperatures of a single scale stored in a contiguous buffer.
+
+    Values are kept as raw floats in an ``array('d')`` instead of one
+    temperature object per reading, so converting a batch walks the
+    buffer once, without allocating intermediate objects. When NumPy is
+    installed, an ``ndarray`` of values is kept as a ``float64`` ``ndarray``
+    (without copying if it already is one) and converted with vectorized
+    operations.
+
+    Attributes
+    ----------
+
+    _scale : type[AbstractTemperature]
+        Temperature class every value in the batch belongs to.
+
+    _values : array | ndarray
+        Contiguous ``array('d')`` (or ``float64`` ``ndarray``) with the raw
+        temperature values.
+
+    Methods
+    -------
+
+    from_temperatures(temps, scale=None)
+        returns a new batch built from temperature objects.
+
+    convert_to(temp_cls, out=None)
+        returns a new batch of `temp_cls` which contains the converted values.
+
+    to_celsius(), to_fahrenheit(), ..., to_romer()
+        returns a new batch of the target scale.
+
+    filter(mask)
+        returns a new batch with the values selected by a comparison mask.
+    """
+
+    __slots__ = ('_scale', '_values')
+
+    def __init__(
+        self, scale: type[AbstractTemperature], values: Iterable[float] = ()
+    ) -> None:
+        _check_scale(scale)
+        self._scale = scale
+        self._values: Any
+        if is_ndarray(values):
+            self._values = np.asarray(values, dtype=np.float64)
+        else:
+            self._values = array('d', values)
+
+    @classmethod
+    def _wrap(
+        cls, scale: type[AbstractTemperature], values: Any
+    ) -> TemperatureArray:
+        """Returns a new batch that takes ownership of `values` as is."""
+        batch = cls.__new__(cls)
+        batch._scale = scale
+        batch._values = values
+        return batch
+
+    @classmethod
+    def from_temperatures(
+        cls,
+        temps: Iterable[AbstractTemperature],
+        scale: type[AbstractTemperature] | None = None,
+    ) -> TemperatureArray:
+        """
+        Returns a new batch built from temperature objects.
+
+        Each object is converted to `scale` (the class of the first object
+        by default, or its mutable class if it is frozen) before its value
+        is stored.
+
+        Returns
+        -------
+        TemperatureArray.from_temperatures(temps, scale) : TemperatureArray
+            TemperatureArray(scale, (t.convert_to(scale).value for t in temps))
+        """
+        temps = iter(temps)
+        if scale is None:
+            try:
+                first = next(temps)
+            except StopIteration:
+                raise ValueError(
+                    '`scale` is required when `temps` is empty'
+                ) from None
+            scale = _mutable_scale(first.__class__)
+            batch = cls(scale, (first.value,))
+        else:
+            batch = cls(scale)
+        batch._values.extend(temp.convert_to(scale).value for temp in temps)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[AbstractTemperature]:
+        # Chunks of `tolist` keep the fast float conversion without copying
+        # the whole buffer before the first item.
+        scale = self._scale
+        values = self._values
+        for start in range(0, len(values), _ITER_CHUNK_SIZE):
+            yield from map(
+                scale, values[start : start + _ITER_CHUNK_SIZE].tolist()
+            )
+
+    @overload
+    def __getitem__(self, index: int) -> AbstractTemperature:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> TemperatureArray:
+        ...
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Returns a temperature object for an integer index or a new batch
+        of the same scale for a slice.
+        """
+        if isinstance(index, slice):
+            return self._wrap(self._scale, self._values[index])
+        return self._scale(float(self._values[index]))
+
+    def __repr__(self) -> str:
+        """
+        Returns the “official” string representation of self.
+
+        Returns
+        -------
+        self.__repr__() : str
+            f'{self.__class__.__name__}({scale name}, {list of values})'
+        """
+        return (
+            f'{self.__class__.__name__}'
+            f'({self._scale.__name__}, {self._values.tolist()})'
+        )
+
+    @property
+    def scale(self) -> type[AbstractTemperature]:
+        """
+        Returns the temperature class of the batch (read-only).
+
+        Returns
+        -------
+        _scale : type[AbstractTemperature]
+            self._scale
+        """
+        return self._scale
+
+    @property
+    def symbol(self) -> str:
+        """
+        Returns official scale symbol of the batch (read-only).
+
+        Returns
+        -------
+        _symbol : str
+            self._scale._symbol
+        """
+        return self._scale._symbol
+
+    @property
+    def values(self) -> Any:
+        """
+        Returns the underlying ``array('d')`` (or ``ndarray``) buffer.
+
+        Returns
+        -------
+        _values : array
+            self._values
+        """
+        return self._values
+
+    def convert_to(
+        self, temp_cls: type[AbstractTemperature], *, out: Any = None
+    ) -> TemperatureArray:
+        """
+        Returns a new batch of `temp_cls` containing the converted values.
+
+        The conversion is resolved once per batch, from the same
+        coefficients used by the scalar ``convert_to`` methods, and then
+        applied to the whole buffer in a single pass (see `convert_values`).
+        If `out` is given, the converted values are written into it and the
+        new batch uses it as its buffer.
+        If no conversion to `temp_cls` is possible, `TypeError` is raised.
+
+        Returns
+        -------
+        self.convert_to(temp_cls) : TemperatureArray
+            TemperatureArray(temp_cls, convert_values(self.values, ...))
+        """
+        values = convert_values(self._values, self._scale, temp_cls, out=out)
+        return self._wrap(temp_cls, values)
+
+    def to_celsius(self) -> TemperatureArray:
+        """
+        Returns a Celsius batch with the converted values.
+
+        Returns
+        -------
+        convert_to(Celsius) : TemperatureArray
+        """
+        return self.convert_to(Celsius)
+
+    def to_fahrenheit(self) -> TemperatureArray:
+        """
+        Returns a Fahrenheit batch with the converted values.
+
+        Returns
+        -------
+        convert_to(Fahrenheit) : TemperatureArray
+        """
+        return self.convert_to(Fahrenheit)
+
+    def to_delisle(self) -> TemperatureArray:
+        """
+        Returns a Delisle batch with the converted values.
+
+        Returns
+        -------
+        convert_to(Delisle) : TemperatureArray
+        """
+        return self.convert_to(Delisle)
+
+    def to_kelvin(self) -> TemperatureArray:
+        """
+        Returns a Kelvin batch with the converted values.
+
+        Returns
+        -------
+        convert_to(Kelvin) : TemperatureArray
+        """
+        return self.convert_to(Kelvin)
+
+    def to_newton(self) -> TemperatureArray:
+        """
+        Returns a Newton batch with the converted values.
+
+        Returns
+        -------
+        convert_to(Newton) : TemperatureArray
+        """
+        return self.convert_to(Newton)
+
+    def to_rankine(self) -> TemperatureArray:
+        """
+        Returns a Rankine batch with the converted values.
+
+        Returns
+        -------
+        convert_to(Rankine) : TemperatureArray
+        """
+        return self.convert_to(Rankine)
+
+    def to_reaumur(self) -> TemperatureArray:
+        """
+        Returns a Réaumur batch with the converted values.
+
+        Returns
+        -------
+        convert_to(Reaumur) : TemperatureArray
+        """
+        return self.convert_to(Reaumur)
+
+    def to_romer(self) -> TemperatureArray:
+        """
+        Returns a Rømer batch with the converted values.
+
+        Returns
+        -------
+        convert_to(Romer) : TemperatureArray
+        """
+        return self.convert_to(Romer)
+
+    def __add__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch of the same scale with the sums of the values.
+
+        `other` may be a number, a temperature object, a sequence of the
+        same length (of numbers or temperature objects) or another batch.
+        Temperatures are converted to the scale of the batch first, as the
+        scalar operators do, but once per batch instead of once per item;
+        numbers and sequences are applied to the values directly.
+        All the arithmetic operators below follow the same rules.
+
+        Returns
+        -------
+        self.__add__(other) : TemperatureArray
+            TemperatureArray(scale, values + other)
+        """
+        return self._binary(other, add)
+
+    def __sub__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch of the same scale with the differences of the values.
+
+        Returns
+        -------
+        self.__sub__(other) : TemperatureArray
+            TemperatureArray(scale, values - other)
+        """
+        return self._binary(other, sub)
+
+    def __mul__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch of the same scale with the products of the values.
+
+        Returns
+        -------
+        self.__mul__(other) : TemperatureArray
+            TemperatureArray(scale, values * other)
+        """
+        return self._binary(other, mul)
+
+    def __pow__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch of the same scale with the values raised to the power of `other`.
+
+        Returns
+        -------
+        self.__pow__(other) : TemperatureArray
+            TemperatureArray(scale, values ** other)
+        """
+        return self._binary(other, pow)
+
+    def __truediv__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch of the same scale with the quotients of the values.
+
+        Returns
+        -------
+        self.__truediv__(other) : TemperatureArray
+            TemperatureArray(scale, values / other)
+        """
+        return self._binary(other, truediv)
+
+    def __floordiv__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch of the same scale with the floor quotients of the values.
+
+        Returns
+        -------
+        self.__floordiv__(other) : TemperatureArray
+            TemperatureArray(scale, values // other)
+        """
+        return self._binary(other, floordiv)
+
+    def __mod__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch of the same scale with the remainders of the division of the values.
+
+        Returns
+        -------
+        self.__mod__(other) : TemperatureArray
+            TemperatureArray(scale, values % other)
+        """
+        return self._binary(other, mod)
+
+    def __divmod__(self, other: Any) -> tuple[Any, Any]:
+        """
+        Returns two new batches of the same scale with the floor quotients
+        and the remainders of the values.
+
+        Returns
+        -------
+        self.__divmod__(other) : tuple[TemperatureArray, TemperatureArray]
+            (self // other, self % other)
+        """
+        operands = self._operands(other)
+        if operands is NotImplemented:
+            return NotImplemented
+        scale, left, right = operands
+        return (
+            self._wrap(scale, _compute(floordiv, left, right)),
+            self._wrap(scale, _compute(mod, left, right)),
+        )
+
+    def __radd__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch with `other` plus the values.
+
+        A number keeps the scale of the batch. A temperature object is the
+        left operand, so, as in the scalar operators, the values are
+        converted to its scale and the result has that scale.
+        All the reflected operators below follow the same rules.
+
+        Returns
+        -------
+        self.__radd__(other) : TemperatureArray
+            TemperatureArray(scale, other + values)
+        """
+        return self._binary(other, add, reflected=True)
+
+    def __rsub__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch with `other` minus the values.
+
+        Returns
+        -------
+        self.__rsub__(other) : TemperatureArray
+            TemperatureArray(scale, other - values)
+        """
+        return self._binary(other, sub, reflected=True)
+
+    def __rmul__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch with `other` times the values.
+
+        Returns
+        -------
+        self.__rmul__(other) : TemperatureArray
+            TemperatureArray(scale, other * values)
+        """
+        return self._binary(other, mul, reflected=True)
+
+    def __rpow__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch with `other` raised to the power of the values.
+
+        Returns
+        -------
+        self.__rpow__(other) : TemperatureArray
+            TemperatureArray(scale, other ** values)
+        """
+        return self._binary(other, pow, reflected=True)
+
+    def __rtruediv__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch with `other` divided by the values.
+
+        Returns
+        -------
+        self.__rtruediv__(other) : TemperatureArray
+            TemperatureArray(scale, other / values)
+        """
+        return self._binary(other, truediv, reflected=True)
+
+    def __rfloordiv__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch with `other` floor divided by the values.
+
+        Returns
+        -------
+        self.__rfloordiv__(other) : TemperatureArray
+            TemperatureArray(scale, other // values)
+        """
+        return self._binary(other, floordiv, reflected=True)
+
+    def __rmod__(self, other: Any) -> TemperatureArray:
+        """
+        Returns a new batch with the remainders of `other` divided by the values.
+
+        Returns
+        -------
+        self.__rmod__(other) : TemperatureArray
+            TemperatureArray(scale, other % values)
+        """
+        return self._binary(other, mod, reflected=True)
+
+    def __rdivmod__(self, other: Any) -> tuple[Any, Any]:
+        """
+        Returns two new batches with the floor quotients and the remainders
+        of `other` divided by the values.
+
+        Returns
+        -------
+        self.__rdivmod__(other) : tuple[TemperatureArray, TemperatureArray]
+            (other // self, other % self)
+        """
+        operands = self._operands(other, reflected=True)
+        if operands is NotImplemented:
+            return NotImplemented
+        scale, left, right = operands
+        return (
+            self._wrap(scale, _compute(floordiv, left, right)),
+            self._wrap(scale, _compute(mod, left, right)),
+        )
+
+    def __eq__(self, other: Any) -> Any:  # type: ignore
+        """
+        Returns a mask of the values equal to `other`.
+
+        `other` may be any operand of the arithmetic operators. A threshold
+        temperature in another scale is converted to the scale of the batch
+        once, then every value is compared with the plain number (with NumPy
+        when it is installed, or in one C-level pass otherwise). This is
+        also the case for reflected comparisons (``Fahrenheit(100) < batch``),
+        so, unlike the scalar operators, values converting to the threshold
+        may compare differently after rounding. All the comparison
+        operators below follow the same rules.
+
+        Returns
+        -------
+        self.__eq__(other) : BooleanMask
+            BooleanMask(values == other)
+        """
+        return self._compare(other, eq)
+
+    def __ne__(self, other: Any) -> Any:  # type: ignore
+        """
+        Returns a mask of the values different from `other`.
+
+        Returns
+        -------
+        self.__ne__(other) : BooleanMask
+            BooleanMask(values != other)
+        """
+        return self._compare(other, ne)
+
+    def __lt__(self, other: Any) -> Any:
+        """
+        Returns a mask of the values lesser than `other`.
+
+        Returns
+        -------
+        self.__lt__(other) : BooleanMask
+            BooleanMask(values < other)
+        """
+        return self._compare(other, lt)
+
+    def __le__(self, other: Any) -> Any:
+        """
+        Returns a mask of the values lesser than or equal to `other`.
+
+        Returns
+        -------
+        self.__le__(other) : BooleanMask
+            BooleanMask(values <= other)
+        """
+        return self._compare(other, le)
+
+    def __gt__(self, other: Any) -> Any:
+        """
+        Returns a mask of the values greater than `other`.
+
+        Returns
+        -------
+        self.__gt__(other) : BooleanMask
+            BooleanMask(values > other)
+        """
+        return self._compare(other, gt)
+
+    def __ge__(self, other: Any) -> Any:
+        """
+        Returns a mask of the values greater than or equal to `other`.
+
+        Returns
+        -------
+        self.__ge__(other) : BooleanMask
+            BooleanMask(values >= other)
+        """
+        return self._compare(other, ge)
+
+    __hash__ = None  # type: ignore
+
+    def filter(self, mask: Sequence[Any]) -> TemperatureArray:
+        """
+        Returns a new batch of the same scale with the values selected by
+        `mask`.
+
+        `mask` is usually the result of a comparison (``batch.filter(batch
+        > Fahrenheit(100))``), but any sequence of booleans of the same
+        length is accepted.
+
+        Returns
+        -------
+        self.filter(mask) : TemperatureArray
+        """
+        values = self._values
+        if len(mask) != len(values):
+            raise ValueError(f'mask has {len(mask)} values for {len(values)}')
+        if not HAS_NUMPY:
+            return self._wrap(self._scale, array('d', compress(values, mask)))
+        if isinstance(mask, (bytes, bytearray)):
+            selected = np.asarray(values)[np.frombuffer(mask, dtype=np.bool_)]
+        else:
+            selected = np.asarray(values)[np.asarray(mask, dtype=np.bool_)]
+        if is_ndarray(values):
+            return self._wrap(self._scale, selected)
+        result = array('d')
+        result.frombytes(selected.tobytes())
+        return self._wrap(self._scale, result)
+
+    def _compare(
+        self, other: Any, function: Callable[[Any, Any], Any]
+    ) -> BooleanMask:
+        """Compares every value with `other` into a mask."""
+        operands = self._operands(other)
+        if operands is NotImplemented:
+            return NotImplemented
+        _, left, right = operands
+        if HAS_NUMPY:
+            left = left if isinstance(left, Real) else np.asarray(left)
+            right = right if isinstance(right, Real) else np.asarray(right)
+            return BooleanMask(function(left, right))
+        if isinstance(right, Real):
+            return BooleanMask(map(function, left, repeat(right)))
+        return BooleanMask(map(function, left, right))
+
+    def _binary(
+        self,
+        other: Any,
+        function: Callable[[Any, Any], Any],
+        reflected: bool = False,
+    ) -> TemperatureArray:
+        """Applies `function` between the values and `other`."""
+        operands = self._operands(other, reflected)
+        if operands is NotImplemented:
+            return NotImplemented
+        scale, left, right = operands
+        return self._wrap(scale, _compute(function, left, right))
+
+    def _operands(self, other: Any, reflected: bool = False) -> Any:
+        """
+        Returns the scale of the result and the left and right operands as
+        plain numbers or buffers, or `NotImplemented` for unsupported
+        operands.
+        """
+        scale = self._scale
+        values = self._values
+        operand: Any
+        if isinstance(other, AbstractTemperature):
+            if reflected:
+                left_scale = _mutable_scale(other.__class__)
+                right = convert_values(values, scale, left_scale)
+                return left_scale, other._value, right
+            operand = other._value_in(scale)
+        elif isinstance(other, TemperatureArray):
+            operand = other._values
+            if other._scale is not scale:
+                operand = convert_values(operand, other._scale, scale)
+        elif isinstance(other, Real):
+            operand = other
+        elif is_ndarray(other) or isinstance(other, array):
+            operand = other
+        elif isinstance(other, (list, tuple)):
+            operand = _plain_values(list(other), scale)
+        else:
+            return NotImplemented
+        if not isinstance(operand, Real) and len(operand) != len(values):
+            raise ValueError(
+                f'operands have {len(values)} and {len(operand)} values'
+            )
+        if reflected:
+            return scale, operand, values
+        return scale, values, operand
+
+
+def _compute(
+    function: Callable[[Any, Any], Any], left: Any, right: Any
+) -> Any:
+    """
+    Returns ``function(left, right)`` element-wise, where either operand may
+    be a plain number.
+
+    ``ndarray`` operands take the NumPy path, which raises
+    `ZeroDivisionError` like the scalar operators (for divisions by zero
+    and zero raised to a negative power) instead of producing infinities.
+    """
+    if is_ndarray(left) or is_ndarray(right):
+        left = left if isinstance(left, Real) else np.asarray(left)
+        right = right if isinstance(right, Real) else np.asarray(right)
+        if function in _DIVISIONS and np.any(np.equal(right, 0)):
+            raise ZeroDivisionError('float division by zero')
+        if function is pow and np.any(np.equal(left, 0) & np.less(right, 0)):
+            raise ZeroDivisionError('0.0 cannot be raised to a negative power')
+        return np.asarray(function(left, right), dtype=np.float64)
+    if isinstance(left, Real):
+        return array('d', map(function, repeat(left), right))
+    if isinstance(right, Real):
+        return array('d', map(function, left, repeat(right)))
+    return array('d', map(function, left, right))
+
+
+def _mutable_scale(
+    scale: type[AbstractTemperature],
+) -> type[AbstractTemperature]:
+    """Returns the scale itself for the `Frozen` variant of a scale."""
+    if issubclass(scale, FrozenTemperature):
+        return scale.__bases__[1]
+    return scale
+
+
+_DIVISIONS = frozenset((truediv, floordiv, mod))
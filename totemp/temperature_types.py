@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
-from typing import Any, ClassVar, TypeVar
+from fractions import Fraction
+from functools import lru_cache
+from math import copysign
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar, cast
 
 T = TypeVar('T', bound='AbstractTemperature')
 
@@ -18,6 +21,21 @@ class AbstractTemperature(metaclass=ABCMeta):
     _symbol : ClassVar[str]
         Official scale symbol.
 
+    Frozen : ClassVar[type]
+        Immutable and hashable variant of the class (see `FrozenTemperature`).
+
+    _fixed_points : ClassVar[tuple[tuple[float, float], tuple[float, float]]]
+        Two `(reading, kelvin)` pairs that define the scale, e.g. the
+        freezing and boiling points of water. Classes that set it (or
+        `_to_kelvin`) are registered and get conversions to every scale.
+
+    _to_kelvin : ClassVar[tuple[float, float]]
+        `(scale, offset)` such that `kelvin = value * scale + offset`, as an
+        alternative to `_fixed_points`.
+
+    _conversions : ClassVar[dict]
+        Row of the conversion table with the coefficients to every scale.
+
     _value : float
         Temperature value (e.g. `36` or `-3.14`).
 
@@ -27,6 +45,12 @@ class AbstractTemperature(metaclass=ABCMeta):
     rounded()
         returns a new object of the same class with the value converted to int.
 
+    frozen()
+        returns an immutable and hashable copy of the object.
+
+    of(value)
+        returns a shared immutable instance from the interning cache.
+
     to_celsius()
         returns a Celsius object which contains the converted value.
 
@@ -56,19 +80,51 @@ class AbstractTemperature(metaclass=ABCMeta):
 
     """
 
-    _symbol: ClassVar[str]
+    __slots__ = ('_value', '__weakref__')
+
+    _fixed_points: ClassVar[tuple[tuple[float, float], tuple[float, float]]]
+    _to_kelvin: ClassVar[tuple[float, float]]
+    Frozen: ClassVar[type[AbstractTemperature]]
+    _conversions: ClassVar[
+        dict[type[AbstractTemperature], tuple[float, float, float, float]]
+    ] = {}
     _value: float
 
+    if TYPE_CHECKING:
+        _symbol: ClassVar[str]
+    else:
+        # Abstract until a subclass sets it, so only scales are instantiable.
+        @property
+        @abstractmethod
+        def _symbol(self) -> str:
+            """Official scale symbol, set as a class attribute by scales."""
+
     @classmethod
     def __init_subclass__(cls, **kwargs: object) -> None:
-        """Ensures subclasses set the `_symbol` attribute."""
+        """
+        Ensures subclasses set the `_symbol` attribute, creates their
+        immutable `Frozen` variant and registers the scales that declare
+        `_fixed_points` or `_to_kelvin`.
+        """
         super().__init_subclass__(**kwargs)
-        try:
-            _ = cls._symbol
-        except AttributeError:
+        if getattr(cls._symbol, '__isabstractmethod__', False):
             raise AttributeError(
                 'Temperature subclasses must set the `_symbol` class attribute'
-            ) from None
+            )
+        if not issubclass(cls, FrozenTemperature):
+            cls.Frozen = type(
+                f'Frozen{cls.__name__}',
+                (FrozenTemperature, cls),
+                {
+                    '__slots__': (),
+                    '__module__': cls.__module__,
+                    '__qualname__': f'{cls.__qualname__}.Frozen',
+                    '__doc__': f'Immutable and hashable {cls.__name__}.',
+                },
+            )
+            definition = _definition(cls)
+            if definition is not None:
+                _register(cls, definition)
 
     def __init__(self, value: float) -> None:
         self._value = value
@@ -115,7 +171,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return cls(self._value + other.convert_to(cls).value)
+                return cls(self._value + other._value_in(cls))
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return cls(self._value + other)
         except TypeError:
             return NotImplemented
@@ -140,7 +198,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return cls(self._value - other.convert_to(cls).value)
+                return cls(self._value - other._value_in(cls))
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return cls(self._value - other)
         except TypeError:
             return NotImplemented
@@ -165,7 +225,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return cls(self._value * other.convert_to(cls).value)
+                return cls(self._value * other._value_in(cls))
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return cls(self._value * other)
         except TypeError:
             return NotImplemented
@@ -190,7 +252,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return cls(self._value ** other.convert_to(cls).value)
+                return cls(self._value ** other._value_in(cls))
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return cls(self._value**other)
         except TypeError:
             return NotImplemented
@@ -215,7 +279,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return cls(self._value / other.convert_to(cls).value)
+                return cls(self._value / other._value_in(cls))
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return cls(self._value / other)
         except TypeError:
             return NotImplemented
@@ -240,7 +306,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return cls(self._value // other.convert_to(cls).value)
+                return cls(self._value // other._value_in(cls))
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return cls(self._value // other)
         except TypeError:
             return NotImplemented
@@ -265,7 +333,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return cls(self._value % other.convert_to(cls).value)
+                return cls(self._value % other._value_in(cls))
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return cls(self._value % other)
         except TypeError:
             return NotImplemented
@@ -291,7 +361,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return self._value == other.convert_to(cls).value
+                return self._value == other._value_in(cls)
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return self._value == other
         except TypeError:
             return NotImplemented
@@ -317,7 +389,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return self._value < other.convert_to(cls).value
+                return self._value < other._value_in(cls)
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return self._value < other
         except TypeError:
             return NotImplemented
@@ -344,7 +418,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return self._value <= other.convert_to(cls).value
+                return self._value <= other._value_in(cls)
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return self._value <= other
         except TypeError:
             return NotImplemented
@@ -371,7 +447,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return self._value != other.convert_to(cls).value
+                return self._value != other._value_in(cls)
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return self._value != other
         except TypeError:
             return NotImplemented
@@ -398,7 +476,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return self._value > other.convert_to(cls).value
+                return self._value > other._value_in(cls)
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return self._value > other
         except TypeError:
             return NotImplemented
@@ -425,7 +505,9 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                return self._value >= other.convert_to(cls).value
+                return self._value >= other._value_in(cls)
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             return self._value >= other
         except TypeError:
             return NotImplemented
@@ -454,8 +536,10 @@ class AbstractTemperature(metaclass=ABCMeta):
         cls = self.__class__
         try:
             if isinstance(other, AbstractTemperature):
-                result = divmod(self._value, other.convert_to(cls).value)
+                result = divmod(self._value, other._value_in(cls))
                 return cls(result[0]), cls(result[1])
+            if isinstance(other, _TemperatureBatch):
+                return NotImplemented
             result = divmod(self._value, other)
             return cls(result[0]), cls(result[1])
         except TypeError:
@@ -727,6 +811,216 @@ class AbstractTemperature(metaclass=ABCMeta):
         except TypeError:
             return NotImplemented
 
+    def __iadd__(self: T, other: Any) -> T:
+        """
+        Stores the sum of the values in self and returns self.
+
+        If `other` is a temperature instance, its value is converted to the
+        calling class without building a temporary object. Otherwise, an
+        attempt is made to apply `other` to the value directly. No new
+        object is allocated, which keeps accumulation loops such as
+        ``total += reading`` allocation-free.
+
+        Notes
+        -----
+        Frozen instances are never modified (see `FrozenTemperature`).
+
+        Returns
+        -------
+        self.__iadd__(other) : T
+            self, with self._value += other.convert_to(cls).value
+        """
+        try:
+            if isinstance(other, AbstractTemperature):
+                self._value += other._value_in(self.__class__)
+            elif isinstance(other, _TemperatureBatch):
+                return NotImplemented
+            else:
+                self._value += other
+        except TypeError:
+            return NotImplemented
+        return self
+
+    def __isub__(self: T, other: Any) -> T:
+        """
+        Stores the subtraction of the values in self and returns self.
+
+        If `other` is a temperature instance, its value is converted to the
+        calling class without building a temporary object. Otherwise, an
+        attempt is made to apply `other` to the value directly. No new
+        object is allocated, which keeps accumulation loops such as
+        ``total -= reading`` allocation-free.
+
+        Notes
+        -----
+        Frozen instances are never modified (see `FrozenTemperature`).
+
+        Returns
+        -------
+        self.__isub__(other) : T
+            self, with self._value -= other.convert_to(cls).value
+        """
+        try:
+            if isinstance(other, AbstractTemperature):
+                self._value -= other._value_in(self.__class__)
+            elif isinstance(other, _TemperatureBatch):
+                return NotImplemented
+            else:
+                self._value -= other
+        except TypeError:
+            return NotImplemented
+        return self
+
+    def __imul__(self: T, other: Any) -> T:
+        """
+        Stores the multiplication of the values in self and returns self.
+
+        If `other` is a temperature instance, its value is converted to the
+        calling class without building a temporary object. Otherwise, an
+        attempt is made to apply `other` to the value directly. No new
+        object is allocated, which keeps accumulation loops such as
+        ``total *= reading`` allocation-free.
+
+        Notes
+        -----
+        Frozen instances are never modified (see `FrozenTemperature`).
+
+        Returns
+        -------
+        self.__imul__(other) : T
+            self, with self._value *= other.convert_to(cls).value
+        """
+        try:
+            if isinstance(other, AbstractTemperature):
+                self._value *= other._value_in(self.__class__)
+            elif isinstance(other, _TemperatureBatch):
+                return NotImplemented
+            else:
+                self._value *= other
+        except TypeError:
+            return NotImplemented
+        return self
+
+    def __ipow__(self: T, other: Any) -> T:
+        """
+        Stores the exponentiation of the values in self and returns self.
+
+        If `other` is a temperature instance, its value is converted to the
+        calling class without building a temporary object. Otherwise, an
+        attempt is made to apply `other` to the value directly. No new
+        object is allocated, which keeps accumulation loops such as
+        ``total **= reading`` allocation-free.
+
+        Notes
+        -----
+        Frozen instances are never modified (see `FrozenTemperature`).
+
+        Returns
+        -------
+        self.__ipow__(other) : T
+            self, with self._value **= other.convert_to(cls).value
+        """
+        try:
+            if isinstance(other, AbstractTemperature):
+                self._value **= other._value_in(self.__class__)
+            elif isinstance(other, _TemperatureBatch):
+                return NotImplemented
+            else:
+                self._value **= other
+        except TypeError:
+            return NotImplemented
+        return self
+
+    def __itruediv__(self: T, other: Any) -> T:
+        """
+        Stores the division of the values in self and returns self.
+
+        If `other` is a temperature instance, its value is converted to the
+        calling class without building a temporary object. Otherwise, an
+        attempt is made to apply `other` to the value directly. No new
+        object is allocated, which keeps accumulation loops such as
+        ``total /= reading`` allocation-free.
+
+        Notes
+        -----
+        Frozen instances are never modified (see `FrozenTemperature`).
+
+        Returns
+        -------
+        self.__itruediv__(other) : T
+            self, with self._value /= other.convert_to(cls).value
+        """
+        try:
+            if isinstance(other, AbstractTemperature):
+                self._value /= other._value_in(self.__class__)
+            elif isinstance(other, _TemperatureBatch):
+                return NotImplemented
+            else:
+                self._value /= other
+        except TypeError:
+            return NotImplemented
+        return self
+
+    def __ifloordiv__(self: T, other: Any) -> T:
+        """
+        Stores the floor division of the values in self and returns self.
+
+        If `other` is a temperature instance, its value is converted to the
+        calling class without building a temporary object. Otherwise, an
+        attempt is made to apply `other` to the value directly. No new
+        object is allocated, which keeps accumulation loops such as
+        ``total //= reading`` allocation-free.
+
+        Notes
+        -----
+        Frozen instances are never modified (see `FrozenTemperature`).
+
+        Returns
+        -------
+        self.__ifloordiv__(other) : T
+            self, with self._value //= other.convert_to(cls).value
+        """
+        try:
+            if isinstance(other, AbstractTemperature):
+                self._value //= other._value_in(self.__class__)
+            elif isinstance(other, _TemperatureBatch):
+                return NotImplemented
+            else:
+                self._value //= other
+        except TypeError:
+            return NotImplemented
+        return self
+
+    def __imod__(self: T, other: Any) -> T:
+        """
+        Stores the remainder from the division of the values in self and returns self.
+
+        If `other` is a temperature instance, its value is converted to the
+        calling class without building a temporary object. Otherwise, an
+        attempt is made to apply `other` to the value directly. No new
+        object is allocated, which keeps accumulation loops such as
+        ``total %= reading`` allocation-free.
+
+        Notes
+        -----
+        Frozen instances are never modified (see `FrozenTemperature`).
+
+        Returns
+        -------
+        self.__imod__(other) : T
+            self, with self._value %= other.convert_to(cls).value
+        """
+        try:
+            if isinstance(other, AbstractTemperature):
+                self._value %= other._value_in(self.__class__)
+            elif isinstance(other, _TemperatureBatch):
+                return NotImplemented
+            else:
+                self._value %= other
+        except TypeError:
+            return NotImplemented
+        return self
+
     @property
     def value(self) -> float:
         """
@@ -765,6 +1059,39 @@ class AbstractTemperature(metaclass=ABCMeta):
         """
         return self.__class__(int(round(self._value)))
 
+    def frozen(self: T) -> T:
+        """
+        Returns an immutable and hashable copy of the temperature object.
+
+        The copy is an instance of the `Frozen` variant of the class, so it
+        can be used as a set member or dict key (see `FrozenTemperature`).
+        Frozen objects are returned as they are.
+
+        Returns
+        -------
+        Frozen(self._value) : T
+        """
+        if isinstance(self, FrozenTemperature):
+            return self
+        return cast(T, self.Frozen(self._value))
+
+    @classmethod
+    def of(cls: type[T], value: float) -> T:
+        """
+        Returns a shared immutable instance of the class with `value`.
+
+        Instances come from a bounded LRU cache keyed by scale and value
+        (see `intern_cache_info`), so readings that repeat, e.g. sensors
+        with a 0.1 degree resolution, reuse a single `Frozen` object
+        instead of allocating one per reading.
+
+        Returns
+        -------
+        cls.of(value) : T
+            cls.Frozen(value), shared
+        """
+        return cast(T, _interned(cls, value))
+
     def to_celsius(self) -> Celsius:
         """
         Returns a Celsius object which contains the class attribute "value"
@@ -853,14 +1180,259 @@ class AbstractTemperature(metaclass=ABCMeta):
         """
         return self.convert_to(Romer)
 
-    @abstractmethod
     def convert_to(self, temp_cls: type[T]) -> T:
         """
         Returns an instance of `temp_cls` containing the converted value.
 
+        The conversion coefficients are looked up in the precomputed
+        conversion table, so every target scale costs the same.
+        If no conversion to `temp_cls` is possible, `TypeError` is raised.
+
+        Returns
+        -------
+        self.convert_to(temp_cls) : T
+            temp_cls((self._value + pre) * mul / div + post)
+        """
+        return temp_cls(self._value_in(temp_cls))
+
+    def _value_in(self, temp_cls: type[AbstractTemperature]) -> float:
+        """
+        Returns the value converted to `temp_cls` as a plain number.
+
+        This is `convert_to` without building the resulting object, which
+        lets the operators work on mixed scales without temporaries.
+        If no conversion to `temp_cls` is possible, `TypeError` is raised.
+        """
+        try:
+            coefficients = self._conversions[temp_cls]
+        except KeyError:
+            raise TypeError(
+                f'Cannot convert {self.__class__.__name__} to {temp_cls!r}'
+            ) from None
+        if coefficients is _IDENTITY:
+            return self._value
+        pre, mul, div, post = coefficients
+        return (self._value + pre) * mul / div + post
+
+    @classmethod
+    def _coefficients(
+        cls, temp_cls: type[AbstractTemperature]
+    ) -> tuple[float, float, float, float]:
+        """
+        Returns the `(pre, mul, div, post)` coefficients that convert a raw
+        value of the calling scale into a raw value of `temp_cls`.
+
         If no conversion to `temp_cls` is possible, `TypeError` is raised.
         """
-        ...
+        try:
+            return cls._conversions[temp_cls]
+        except KeyError:
+            raise TypeError(
+                f'Cannot convert {cls.__name__} to {temp_cls!r}'
+            ) from None
+
+
+class _TemperatureBatch:
+    """
+    Base of containers with many temperatures of one scale.
+
+    Temperature operators return `NotImplemented` for batch operands, so
+    the reflected operator of the batch handles the operation.
+    """
+
+    __slots__ = ()
+
+
+class FrozenTemperature:
+    """
+    Mixin that makes temperature objects immutable and hashable.
+
+    Every temperature class gets a `Frozen` variant that inherits from this
+    mixin and from the class itself (e.g. `Celsius.Frozen`), usually built
+    with `frozen()`. Its `value` is read-only and its hash and equality come
+    from a canonical key, the value in Kelvin rounded to
+    `_CANONICAL_DIGITS` decimal places, so equal temperatures in different
+    scales (e.g. `Celsius(0)` and `Kelvin(273.15)`) collapse to the same
+    set member or dict key.
+
+    Notes
+    -----
+    Equality with plain numbers keeps comparing `value` directly, so numbers
+    and frozen temperatures should not be mixed as keys of the same dict.
+    """
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        """
+        Returns the hash of the canonical key of self.
+
+        Returns
+        -------
+        self.__hash__() : int
+            hash(round(self.convert_to(Kelvin).value, _CANONICAL_DIGITS))
+        """
+        return hash(_canonical_key(self))
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Checks if the canonical keys of the objects are equal.
+
+        Notes
+        -----
+        If `other` is not a temperature instance, atempts to return: self._value == other
+
+        Returns
+        -------
+        self.__eq__(other) : bool
+            _canonical_key(self) == _canonical_key(other)
+        """
+        if isinstance(other, AbstractTemperature):
+            try:
+                return _canonical_key(self) == _canonical_key(other)
+            except TypeError:
+                return NotImplemented
+        return AbstractTemperature.__eq__(self, other)  # type: ignore
+
+    def __ne__(self, other: Any) -> bool:
+        """
+        Checks if the canonical keys of the objects are different.
+
+        Returns
+        -------
+        self.__ne__(other) : bool
+            not self.__eq__(other)
+        """
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __iadd__(self, other: Any) -> Any:
+        """
+        Returns NotImplemented, so augmented assignments (``+=``, ``-=``,
+        ``*=``, ...) fall back to the binary operators and rebind the name
+        to a new object instead of modifying the frozen one.
+        """
+        return NotImplemented
+
+    __isub__ = __imul__ = __ipow__ = __iadd__
+    __itruediv__ = __ifloordiv__ = __imod__ = __iadd__
+
+    @property
+    def value(self) -> float:
+        """
+        Returns temperature object value (read-only).
+
+        Returns
+        -------
+        _value : float
+            self._value
+        """
+        return self._value  # type: ignore
+
+
+def _canonical_key(temp: Any) -> float:
+    """Returns the value of `temp` in Kelvin, rounded for hashing."""
+    return round(temp._value_in(Kelvin), _CANONICAL_DIGITS)
+
+
+# Registry of scales: `_KELVIN[scale]` holds the exact `(scale, offset)` of
+# `kelvin = value * scale + offset`, from which the coefficients between
+# every pair of registered scales are derived when a scale is registered.
+_KELVIN: dict[type[AbstractTemperature], tuple[Fraction, Fraction]] = {}
+_CONVERSIONS: dict[
+    type[AbstractTemperature],
+    dict[type[AbstractTemperature], tuple[float, float, float, float]],
+] = {}
+_IDENTITY = (-0.0, 1, 1, -0.0)
+
+
+def scales() -> tuple[type[AbstractTemperature], ...]:
+    """
+    Returns the registered temperature scales, in registration order.
+
+    A subclass of `AbstractTemperature` is registered when it is created if
+    it sets `_fixed_points` or `_to_kelvin`; conversions between it and
+    every other registered scale are then available everywhere (objects,
+    `converter`, batches and streams).
+
+    Returns
+    -------
+    scales() : tuple[type[AbstractTemperature], ...]
+    """
+    return tuple(_KELVIN)
+
+
+def _definition(
+    cls: type[AbstractTemperature],
+) -> tuple[Fraction, Fraction] | None:
+    """Returns the exact `(scale, offset)` to Kelvin declared by `cls`."""
+    for klass in cls.__mro__:
+        if '_to_kelvin' in vars(klass):
+            scale, offset = map(_exact, vars(klass)['_to_kelvin'])
+            break
+        if '_fixed_points' in vars(klass):
+            (reading, kelvin), (other_reading, other_kelvin) = (
+                map(_exact, point) for point in vars(klass)['_fixed_points']
+            )
+            if reading == other_reading:
+                raise ValueError(
+                    f'{cls.__name__} fixed points must have distinct readings'
+                )
+            scale = (other_kelvin - kelvin) / (other_reading - reading)
+            offset = kelvin - reading * scale
+            break
+    else:
+        return None
+    if not scale:
+        raise ValueError(f'{cls.__name__} scale must not be zero')
+    return scale, offset
+
+
+def _exact(number: float) -> Fraction:
+    """Returns `number` as a fraction, floats read as their decimal repr."""
+    if isinstance(number, float):
+        return Fraction(repr(number))
+    return Fraction(number)
+
+
+def _register(
+    cls: type[AbstractTemperature], definition: tuple[Fraction, Fraction]
+) -> None:
+    """Adds `cls` to the registry and derives its conversion coefficients."""
+    _KELVIN[cls] = definition
+    row = _CONVERSIONS[cls] = {}
+    cls._conversions = row
+    for other in _KELVIN:
+        if other is cls:
+            row[cls] = row[cls.Frozen] = _IDENTITY
+            continue
+        row[other] = row[other.Frozen] = _derive(cls, other)
+        back = _derive(other, cls)
+        _CONVERSIONS[other][cls] = _CONVERSIONS[other][cls.Frozen] = back
+
+
+def _derive(
+    source: type[AbstractTemperature], target: type[AbstractTemperature]
+) -> tuple[float, float, float, float]:
+    """
+    Returns the `(pre, mul, div, post)` coefficients from `source` to
+    `target`, computed exactly and rounded once.
+    """
+    source_scale, source_offset = _KELVIN[source]
+    target_scale, target_offset = _KELVIN[target]
+    ratio = source_scale / target_scale
+    post = float((source_offset - target_offset) / target_scale)
+    mul: float
+    div: float
+    if ratio.numerator < 2**53 and ratio.denominator < 2**53:
+        mul, div = ratio.numerator, ratio.denominator
+    else:
+        mul, div = float(ratio), 1
+    if not post:
+        post = 0.0 if ratio < 0 else -0.0
+    return -0.0, mul, div, post
 
 
 class Celsius(AbstractTemperature):
@@ -877,26 +1449,9 @@ class Celsius(AbstractTemperature):
         Temperature value (e.g. `36` or `-3.14`).
     """
 
+    __slots__ = ()
     _symbol = 'ºC'
-
-    def convert_to(self, temp_cls: type[T]) -> T:
-        if temp_cls is Celsius:
-            return temp_cls(self._value)
-        if temp_cls is Fahrenheit:
-            return temp_cls(self._value * 9 / 5 + 32)
-        if temp_cls is Delisle:
-            return temp_cls((100 - self._value) * 3 / 2)
-        if temp_cls is Kelvin:
-            return temp_cls(self._value + 273.15)
-        if temp_cls is Newton:
-            return temp_cls(self._value * 33 / 100)
-        if temp_cls is Rankine:
-            return temp_cls((self._value + 273.15) * 9 / 5)
-        if temp_cls is Reaumur:
-            return temp_cls(self._value * 4 / 5)
-        if temp_cls is Romer:
-            return temp_cls(self._value * 21 / 40 + 7.5)
-        raise TypeError
+    _fixed_points = ((0, 273.15), (100, 373.15))
 
 
 class Fahrenheit(AbstractTemperature):
@@ -913,26 +1468,9 @@ class Fahrenheit(AbstractTemperature):
         Temperature value (e.g. `36` or `-3.14`).
     """
 
+    __slots__ = ()
     _symbol = 'ºF'
-
-    def convert_to(self, temp_cls: type[T]) -> T:
-        if temp_cls is Celsius:
-            return temp_cls((self._value - 32) * 5 / 9)
-        if temp_cls is Fahrenheit:
-            return temp_cls(self._value)
-        if temp_cls is Delisle:
-            return temp_cls((212 - self._value) * 5 / 6)
-        if temp_cls is Kelvin:
-            return temp_cls((self._value + 459.67) * 5 / 9)
-        if temp_cls is Newton:
-            return temp_cls((self._value - 32) * 11 / 60)
-        if temp_cls is Rankine:
-            return temp_cls(self._value + 459.67)
-        if temp_cls is Reaumur:
-            return temp_cls((self._value - 32) * 4 / 9)
-        if temp_cls is Romer:
-            return temp_cls((self._value - 32) * (7 / 24) + 7.5)
-        raise TypeError
+    _fixed_points = ((32, 273.15), (212, 373.15))
 
 
 class Delisle(AbstractTemperature):
@@ -949,26 +1487,9 @@ class Delisle(AbstractTemperature):
         Temperature value (e.g. `36` or `-3.14`).
     """
 
+    __slots__ = ()
     _symbol = 'ºDe'
-
-    def convert_to(self, temp_cls: type[T]) -> T:
-        if temp_cls is Celsius:
-            return temp_cls(100 - self._value * 2 / 3)
-        if temp_cls is Fahrenheit:
-            return temp_cls(212 - self._value * 6 / 5)
-        if temp_cls is Delisle:
-            return temp_cls(self._value)
-        if temp_cls is Kelvin:
-            return temp_cls(373.15 - self._value * 2 / 3)
-        if temp_cls is Newton:
-            return temp_cls(33 - self._value * 11 / 50)
-        if temp_cls is Rankine:
-            return temp_cls(671.67 - self._value * 6 / 5)
-        if temp_cls is Reaumur:
-            return temp_cls(80 - self._value * 8 / 15)
-        if temp_cls is Romer:
-            return temp_cls(60 - self._value * 7 / 20)
-        raise TypeError
+    _fixed_points = ((150, 273.15), (0, 373.15))
 
 
 class Kelvin(AbstractTemperature):
@@ -985,26 +1506,9 @@ class Kelvin(AbstractTemperature):
         Temperature value (e.g. `36` or `-3.14`).
     """
 
+    __slots__ = ()
     _symbol = 'K'
-
-    def convert_to(self, temp_cls: type[T]) -> T:
-        if temp_cls is Celsius:
-            return temp_cls(self._value - 273.15)
-        if temp_cls is Fahrenheit:
-            return temp_cls(self._value * 9 / 5 - 459.67)
-        if temp_cls is Delisle:
-            return temp_cls((373.15 - self._value) * 3 / 2)
-        if temp_cls is Kelvin:
-            return temp_cls(self._value)
-        if temp_cls is Newton:
-            return temp_cls((self._value - 273.15) * 33 / 100)
-        if temp_cls is Rankine:
-            return temp_cls(self._value * 1.8)
-        if temp_cls is Reaumur:
-            return temp_cls((self._value - 273.15) * 4 / 5)
-        if temp_cls is Romer:
-            return temp_cls((self._value - 273.15) * 21 / 40 + 7.5)
-        raise TypeError
+    _to_kelvin = (1, 0)
 
 
 class Newton(AbstractTemperature):
@@ -1021,26 +1525,9 @@ class Newton(AbstractTemperature):
         Temperature value (e.g. `36` or `-3.14`).
     """
 
+    __slots__ = ()
     _symbol = 'ºN'
-
-    def convert_to(self, temp_cls: type[T]) -> T:
-        if temp_cls is Celsius:
-            return temp_cls(self._value / 0.33)
-        if temp_cls is Fahrenheit:
-            return temp_cls(self._value * 60 / 11 + 32)
-        if temp_cls is Delisle:
-            return temp_cls((33 - self._value) * 50 / 11)
-        if temp_cls is Kelvin:
-            return temp_cls(self._value / 0.33000 + 273.15)
-        if temp_cls is Newton:
-            return temp_cls(self._value)
-        if temp_cls is Rankine:
-            return temp_cls(self._value * 60 / 11 + 491.67)
-        if temp_cls is Reaumur:
-            return temp_cls(self._value * 80 / 33)
-        if temp_cls is Romer:
-            return temp_cls(self._value * 35 / 22 + 7.5)
-        raise TypeError
+    _fixed_points = ((0, 273.15), (33, 373.15))
 
 
 class Rankine(AbstractTemperature):
@@ -1057,26 +1544,9 @@ class Rankine(AbstractTemperature):
         Temperature value (e.g. `36` or `-3.14`).
     """
 
+    __slots__ = ()
     _symbol = 'ºR'
-
-    def convert_to(self, temp_cls: type[T]) -> T:
-        if temp_cls is Celsius:
-            return temp_cls((self._value - 491.67) * 5 / 9)
-        if temp_cls is Fahrenheit:
-            return temp_cls(self._value - 459.67)
-        if temp_cls is Delisle:
-            return temp_cls((671.67 - self._value) * 5 / 6)
-        if temp_cls is Kelvin:
-            return temp_cls(self._value * 5 / 9)
-        if temp_cls is Newton:
-            return temp_cls((self._value - 491.67) * 11 / 60)
-        if temp_cls is Rankine:
-            return temp_cls(self._value)
-        if temp_cls is Reaumur:
-            return temp_cls((self._value - 491.67) * 4 / 9)
-        if temp_cls is Romer:
-            return temp_cls((self._value - 491.67) * 7 / 24 + 7.5)
-        raise TypeError
+    _fixed_points = ((491.67, 273.15), (671.67, 373.15))
 
 
 class Reaumur(AbstractTemperature):
@@ -1093,26 +1563,9 @@ class Reaumur(AbstractTemperature):
         Temperature value (e.g. `36` or `-3.14`).
     """
 
+    __slots__ = ()
     _symbol = 'ºRé'
-
-    def convert_to(self, temp_cls: type[T]) -> T:
-        if temp_cls is Celsius:
-            return temp_cls(self._value * 5 / 4)
-        if temp_cls is Fahrenheit:
-            return temp_cls(self._value * 9 / 4 + 32)
-        if temp_cls is Delisle:
-            return temp_cls((80 - self._value) * 15 / 8)
-        if temp_cls is Kelvin:
-            return temp_cls(self._value * 5 / 4 + 273.15)
-        if temp_cls is Newton:
-            return temp_cls(self._value * 33 / 80)
-        if temp_cls is Rankine:
-            return temp_cls(self._value * 9 / 4 + 491.67)
-        if temp_cls is Reaumur:
-            return temp_cls(self._value)
-        if temp_cls is Romer:
-            return temp_cls(self._value * 21 / 32 + 7.5)
-        raise TypeError
+    _fixed_points = ((0, 273.15), (80, 373.15))
 
 
 class Romer(AbstractTemperature):
@@ -1129,23 +1582,215 @@ class Romer(AbstractTemperature):
         Temperature value (e.g. `36` or `-3.14`).
     """
 
+    __slots__ = ()
     _symbol = 'ºRø'
+    _fixed_points = ((7.5, 273.15), (60, 373.15))
+
+
+# Textbook formulas of the built-in scales: `_FORMULAS[source][target]`
+# holds the coefficients `(pre, mul, div, post)` of
+# `(value + pre) * mul / div + post`. They replace the derived coefficients,
+# following the order of the textbook formulas, so results are identical to
+# evaluating them by hand; `-0.0` is the neutral addend that also preserves
+# the sign of zero.
+_CANONICAL_DIGITS = 9
+_FORMULAS: dict[
+    type[AbstractTemperature],
+    dict[type[AbstractTemperature], tuple[float, float, float, float]],
+] = {
+    Celsius: {
+        Celsius: _IDENTITY,
+        Fahrenheit: (-0.0, 9, 5, 32),
+        Delisle: (-100, -3, 2, 0.0),
+        Kelvin: (-0.0, 1, 1, 273.15),
+        Newton: (-0.0, 33, 100, -0.0),
+        Rankine: (273.15, 9, 5, -0.0),
+        Reaumur: (-0.0, 4, 5, -0.0),
+        Romer: (-0.0, 21, 40, 7.5),
+    },
+    Fahrenheit: {
+        Celsius: (-32, 5, 9, -0.0),
+        Fahrenheit: _IDENTITY,
+        Delisle: (-212, -5, 6, 0.0),
+        Kelvin: (459.67, 5, 9, -0.0),
+        Newton: (-32, 11, 60, -0.0),
+        Rankine: (-0.0, 1, 1, 459.67),
+        Reaumur: (-32, 4, 9, -0.0),
+        Romer: (-32, 7 / 24, 1, 7.5),
+    },
+    Delisle: {
+        Celsius: (-0.0, -2, 3, 100),
+        Fahrenheit: (-0.0, -6, 5, 212),
+        Delisle: _IDENTITY,
+        Kelvin: (-0.0, -2, 3, 373.15),
+        Newton: (-0.0, -11, 50, 33),
+        Rankine: (-0.0, -6, 5, 671.67),
+        Reaumur: (-0.0, -8, 15, 80),
+        Romer: (-0.0, -7, 20, 60),
+    },
+    Kelvin: {
+        Celsius: (-0.0, 1, 1, -273.15),
+        Fahrenheit: (-0.0, 9, 5, -459.67),
+        Delisle: (-373.15, -3, 2, 0.0),
+        Kelvin: _IDENTITY,
+        Newton: (-273.15, 33, 100, -0.0),
+        Rankine: (-0.0, 1.8, 1, -0.0),
+        Reaumur: (-273.15, 4, 5, -0.0),
+        Romer: (-273.15, 21, 40, 7.5),
+    },
+    Newton: {
+        Celsius: (-0.0, 1, 0.33, -0.0),
+        Fahrenheit: (-0.0, 60, 11, 32),
+        Delisle: (-33, -50, 11, 0.0),
+        Kelvin: (-0.0, 1, 0.33, 273.15),
+        Newton: _IDENTITY,
+        Rankine: (-0.0, 60, 11, 491.67),
+        Reaumur: (-0.0, 80, 33, -0.0),
+        Romer: (-0.0, 35, 22, 7.5),
+    },
+    Rankine: {
+        Celsius: (-491.67, 5, 9, -0.0),
+        Fahrenheit: (-0.0, 1, 1, -459.67),
+        Delisle: (-671.67, -5, 6, 0.0),
+        Kelvin: (-0.0, 5, 9, -0.0),
+        Newton: (-491.67, 11, 60, -0.0),
+        Rankine: _IDENTITY,
+        Reaumur: (-491.67, 4, 9, -0.0),
+        Romer: (-491.67, 7, 24, 7.5),
+    },
+    Reaumur: {
+        Celsius: (-0.0, 5, 4, -0.0),
+        Fahrenheit: (-0.0, 9, 4, 32),
+        Delisle: (-80, -15, 8, 0.0),
+        Kelvin: (-0.0, 5, 4, 273.15),
+        Newton: (-0.0, 33, 80, -0.0),
+        Rankine: (-0.0, 9, 4, 491.67),
+        Reaumur: _IDENTITY,
+        Romer: (-0.0, 21, 32, 7.5),
+    },
+    Romer: {
+        Celsius: (-7.5, 40, 21, -0.0),
+        Fahrenheit: (-7.5, 24, 7, 32),
+        Delisle: (-60, -20, 7, 0.0),
+        Kelvin: (-7.5, 40, 21, 273.15),
+        Newton: (-7.5, 22, 35, -0.0),
+        Rankine: (-7.5, 24, 7, 491.67),
+        Reaumur: (-7.5, 32, 21, -0.0),
+        Romer: _IDENTITY,
+    },
+}
+
+for _scale, _row in _FORMULAS.items():
+    for _target, _coefficients in _row.items():
+        _CONVERSIONS[_scale][_target] = _coefficients
+        _CONVERSIONS[_scale][_target.Frozen] = _coefficients
+
+
+DEFAULT_INTERN_CACHE_SIZE = 4096
+
+
+def _frozen_instance(
+    scale: type[AbstractTemperature], value: float
+) -> AbstractTemperature:
+    return scale.Frozen(value)
+
+
+_interned = lru_cache(maxsize=DEFAULT_INTERN_CACHE_SIZE, typed=True)(
+    _frozen_instance
+)
+
+
+def intern_cache_info() -> Any:
+    """
+    Returns the statistics of the cache behind `AbstractTemperature.of`.
 
-    def convert_to(self, temp_cls: type[T]) -> T:
-        if temp_cls is Celsius:
-            return temp_cls((self._value - 7.5) * 40 / 21)
-        if temp_cls is Fahrenheit:
-            return temp_cls((self._value - 7.5) * 24 / 7 + 32)
-        if temp_cls is Delisle:
-            return temp_cls((60 - self._value) * 20 / 7)
-        if temp_cls is Kelvin:
-            return temp_cls((self._value - 7.5) * 40 / 21 + 273.15)
-        if temp_cls is Newton:
-            return temp_cls((self._value - 7.5) * 22 / 35)
-        if temp_cls is Rankine:
-            return temp_cls((self._value - 7.5) * 24 / 7 + 491.67)
-        if temp_cls is Reaumur:
-            return temp_cls((self._value - 7.5) * 32 / 21)
-        if temp_cls is Romer:
-            return temp_cls(self._value)
-        raise TypeError
+    Returns
+    -------
+    intern_cache_info() : CacheInfo
+        `(hits, misses, maxsize, currsize)`, as `functools.lru_cache`.
+    """
+    return _interned.cache_info()
+
+
+def intern_cache_clear() -> None:
+    """Empties the cache behind `AbstractTemperature.of` and its statistics."""
+    _interned.cache_clear()
+
+
+def set_intern_cache_size(maxsize: int) -> None:
+    """
+    Bounds the cache behind `AbstractTemperature.of` to `maxsize` instances,
+    evicting the least recently used ones beyond it. The cache is emptied.
+    """
+    global _interned
+    if maxsize < 0:
+        raise ValueError('`maxsize` must not be negative')
+    _interned = lru_cache(maxsize=maxsize, typed=True)(_frozen_instance)
+
+
+@lru_cache(maxsize=None)
+def converter(
+    from_scale: type[AbstractTemperature], to_scale: type[AbstractTemperature]
+) -> Callable[[float], float]:
+    """
+    Returns a plain function that converts a raw value of `from_scale`
+    into a raw value of `to_scale`.
+
+    The function is generated once per pair of scales, with the same
+    coefficients used by `convert_to` written into its code as constants
+    (neutral terms are left out), and then cached. It is meant for tight
+    loops such as ``map(converter(Celsius, Fahrenheit), values)``.
+    If no conversion is possible, `TypeError` is raised.
+
+    Returns
+    -------
+    converter(from_scale, to_scale) : Callable[[float], float]
+        value -> (value + pre) * mul / div + post
+    """
+    pre, mul, div, post = _check_scale(from_scale, to_scale, 'from_scale')
+    expression = 'value'
+    if not _is_neutral_addend(pre):
+        expression = f'({expression} + {pre!r})'
+    if mul != 1:
+        expression = f'{expression} * {mul!r}'
+    if div != 1:
+        expression = f'{expression} / {div!r}'
+    if not _is_neutral_addend(post):
+        expression = f'{expression} + {post!r}'
+
+    name = f'{from_scale.__name__.lower()}_to_{to_scale.__name__.lower()}'
+    namespace: dict[str, Any] = {}
+    exec(f'def {name}(value):\n    return {expression}\n', namespace)
+    function = namespace[name]
+    function.__doc__ = (
+        f'Converts a {from_scale.__name__} value to {to_scale.__name__}: '
+        f'{expression}'
+    )
+    return function
+
+
+def _is_neutral_addend(number: float) -> bool:
+    """Returns whether adding `number` leaves every float unchanged."""
+    return number == 0 and copysign(1, number) < 0
+
+
+def _check_scale(
+    scale: Any, to_scale: Any = None, name: str = 'scale'
+) -> tuple[float, float, float, float]:
+    """
+    Raises `TypeError` unless `scale` is a temperature class and, if
+    `to_scale` is given, its values can be converted to `to_scale`.
+
+    Returns
+    -------
+    _check_scale(scale, to_scale) : tuple[float, float, float, float]
+        The `(pre, mul, div, post)` coefficients to `to_scale`, or the
+        identity without `to_scale`.
+    """
+    if not (
+        isinstance(scale, type) and issubclass(scale, AbstractTemperature)
+    ):
+        raise TypeError(f'`{name}` must be a temperature class, not {scale!r}')
+    if to_scale is None:
+        return _IDENTITY
+    return scale._coefficients(to_scale)
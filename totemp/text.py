@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import re
+import unicodedata
+from array import array
+from functools import lru_cache
+from itertools import islice, repeat
+from operator import add
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from .batch import _plain_values, is_ndarray
+from .stream import DEFAULT_CHUNK_SIZE
+from .temperature_array import TemperatureArray
+from .temperature_types import AbstractTemperature, converter, scales
+
+# A number as written by `repr(float)`/`str(int)` (plus a leading `+` and
+# `inf`/`nan`), then a scale symbol with an optional degree sign.
+_PATTERN = re.compile(
+    r'\s*([-+]?(?:(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?|inf(?:inity)?|nan))'
+    r'\s*([º°]?\s*[^\W\d_]+)\s*',
+    re.IGNORECASE,
+)
+
+
+def parse(text: str) -> AbstractTemperature:
+    """
+    Returns the temperature written in `text`.
+
+    `text` is a value followed by a scale symbol, as produced by ``str``
+    (``'53.6 ºF'``). The degree sign may be ``º``, ``°`` or missing, and
+    symbols are matched regardless of case and accents (``'°C'``, ``'C'``,
+    ``'12.5ºRo'``). If `text` cannot be parsed, `ValueError` is raised.
+
+    Returns
+    -------
+    parse(text) : AbstractTemperature
+        Instance of the scale whose symbol appears in `text`.
+    """
+    value, scale = _parse(text)
+    return scale(value)
+
+
+def parse_many(
+    lines: Iterable[str],
+    scale: type[AbstractTemperature] | None = None,
+    *,
+    as_array: bool = False,
+) -> Any:
+    """
+    Parses many temperature strings (see `parse`), skipping blank lines.
+
+    By default a list of temperature objects is returned, each of the scale
+    written in its line, or converted to `scale` if it is given. With
+    `as_array`, the values are returned in a `TemperatureArray` of `scale`
+    (by default, the scale of the first line) without building one object
+    per line. If a line cannot be parsed, `ValueError` is raised with its
+    (one-based) line number.
+
+    Returns
+    -------
+    parse_many(lines) : list[AbstractTemperature] | TemperatureArray
+    """
+    parsed = _parse_lines(lines)
+    if not as_array:
+        if scale is None:
+            return [source(value) for value, source in parsed]
+        return [
+            scale(
+                value if source is scale else converter(source, scale)(value)
+            )
+            for value, source in parsed
+        ]
+
+    values = array('d')
+    append = values.append
+    for value, source in parsed:
+        if scale is None:
+            scale = source
+        append(value if source is scale else converter(source, scale)(value))
+    if scale is None:
+        raise ValueError('cannot infer the scale of an empty input')
+    return TemperatureArray._wrap(scale, values)
+
+
+def format_many(
+    values: Iterable[Any],
+    scale: type[AbstractTemperature],
+    *,
+    precision: int | None = None,
+    with_symbol: bool = True,
+    file: IO[str] | None = None,
+) -> Any:
+    """
+    Formats many temperatures of `scale` as strings.
+
+    `values` may be a `TemperatureArray`, temperature objects of any scale
+    or plain numbers in `scale`; everything is expressed in `scale` first.
+    Values are rendered like `__str__` (``'53.6 ºF'``), with `precision`
+    fixed decimals if it is given, and without the symbol if `with_symbol`
+    is false. The format template is built once per symbol and options and
+    applied to the whole batch.
+    With `file`, one string per line is written straight to that text
+    stream, without building a list of strings (iterators are consumed
+    in chunks, so memory stays bounded).
+
+    Returns
+    -------
+    format_many(values, scale) : list[str] | int
+        The strings or, with `file`, the number of lines written.
+    """
+    if precision is not None and precision < 0:
+        raise ValueError('`precision` must not be negative')
+    template = _template(
+        scale._symbol if with_symbol else '', precision, file is not None
+    )
+    if file is None:
+        return list(template(_raw_values(values, scale)))
+    count = 0
+    for chunk in _raw_chunks(values, scale):
+        file.writelines(template(chunk))
+        count += len(chunk)
+    return count
+
+
+def fold_symbol(name: str) -> str:
+    """
+    Returns `name` in the form scale names and symbols are matched in.
+
+    The text is stripped of surrounding spaces and of a leading degree
+    sign, case-folded and stripped of accents, so ``'°C'``, ``'c'`` and
+    ``'ºC'`` fold to the same key, as do ``'Rø'`` and ``'ro'``.
+
+    Returns
+    -------
+    fold_symbol(name) : str
+        fold_symbol('ºRé') == 're'
+    """
+    name = name.strip().lstrip('º°').strip().casefold().replace('ø', 'o')
+    return ''.join(
+        char
+        for char in unicodedata.normalize('NFKD', name)
+        if not unicodedata.combining(char)
+    )
+
+
+def _raw_values(values: Any, scale: type[AbstractTemperature]) -> Any:
+    """Returns `values` as a sequence of plain numbers in `scale`."""
+    if isinstance(values, TemperatureArray):
+        if values.scale is not scale:
+            values = values.convert_to(scale)
+        values = values.values
+    if is_ndarray(values):
+        return values.tolist()
+    if isinstance(values, array):
+        return values
+    return _plain_values(
+        values if isinstance(values, list) else list(values), scale
+    )
+
+
+def _raw_chunks(
+    values: Iterable[Any], scale: type[AbstractTemperature]
+) -> Iterator[Any]:
+    """Yields `values` as plain numbers in `scale`, lazily for iterators."""
+    if isinstance(values, (TemperatureArray, list, tuple, array)) or (
+        is_ndarray(values)
+    ):
+        yield _raw_values(values, scale)
+        return
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, DEFAULT_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield _plain_values(chunk, scale)
+
+
+@lru_cache(maxsize=None)
+def _template(
+    symbol: str, precision: int | None, newline: bool
+) -> Callable[[Iterable[float]], Iterator[str]]:
+    """Returns a function rendering many values with the same suffix."""
+    suffix = ' ' + symbol if symbol else ''
+    if newline:
+        suffix += '\n'
+    if precision is not None:
+        format = f'{{:.{precision}f}}{_escape(suffix)}'.format
+        return lambda values: map(format, values)
+    # `str` then one concatenation is faster than `str.format` for `{}`.
+    return lambda values: map(add, map(str, values), repeat(suffix))
+
+
+def _escape(text: str) -> str:
+    return text.replace('{', '{{').replace('}', '}}')
+
+
+def _parse(text: str) -> tuple[float, type[AbstractTemperature]]:
+    found = _PATTERN.fullmatch(text)
+    if found is None:
+        raise ValueError(f'invalid temperature {text!r}')
+    value, symbol = found.groups()
+    return float(value), _SYMBOLS.get(symbol) or _lookup(symbol, text)
+
+
+def _parse_lines(
+    lines: Iterable[str],
+) -> Iterator[tuple[float, type[AbstractTemperature]]]:
+    """Yields the value and scale of every non-blank line."""
+    match = _PATTERN.fullmatch
+    symbols = _SYMBOLS
+    for number, line in enumerate(lines, 1):
+        found = match(line)
+        if found is None:
+            if not line or line.isspace():
+                continue
+            raise ValueError(f'line {number}: invalid temperature {line!r}')
+        value, symbol = found.groups()
+        yield float(value), symbols.get(symbol) or _lookup(symbol, line)
+
+
+def _lookup(symbol: str, text: str) -> type[AbstractTemperature]:
+    """Resolves a spelling of a symbol missing from `_SYMBOLS` and caches it."""
+    folded = fold_symbol(symbol)
+    if folded not in _FOLDED_SYMBOLS:
+        _update_symbols()  # a scale may have been registered since
+    try:
+        scale = _FOLDED_SYMBOLS[folded]
+    except KeyError:
+        raise ValueError(
+            f'unknown temperature symbol {symbol!r} in {text!r}'
+        ) from None
+    _SYMBOLS[symbol] = scale
+    return scale
+
+
+def _update_symbols() -> None:
+    """Adds the symbols of the registered scales; the first scale wins."""
+    for scale in scales():
+        _FOLDED_SYMBOLS.setdefault(fold_symbol(scale._symbol), scale)
+        _SYMBOLS.setdefault(scale._symbol, scale)
+
+
+_FOLDED_SYMBOLS: dict[str, type[AbstractTemperature]] = {}
+# Exact spellings seen so far, so each one is folded only once.
+_SYMBOLS: dict[str, type[AbstractTemperature]] = {}
+_update_symbols()